@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional speedup; stdlib json is used when orjson is not installed
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when available). Raises json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def dumps(data: Any, *, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (same layout as json.dumps(indent=2, ensure_ascii=False)).
+
+    indent=False writes the compact form instead.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            pass  # e.g. ints beyond 64 bits; stdlib json handles these
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
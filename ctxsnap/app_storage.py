@@ -5,11 +5,14 @@ import logging
 import os
 import re
 import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from ctxsnap._json import dumps as _json_dumps, loads as _json_loads
 from ctxsnap.constants import APP_NAME, DEFAULT_PROCESS_KEYWORDS, default_tags_for_language
 from ctxsnap.core.security import SecurityService
 
@@ -73,6 +76,32 @@ def safe_snapshot_path(snaps_dir: Path, sid: str) -> Path:
     return target
 
 
+def read_snapshot_dir(snaps_dir: Path) -> Dict[str, bytes]:
+    """Raw bytes of every *.json file in snaps_dir, keyed by file name (for rollback)."""
+    files: Dict[str, bytes] = {}
+    with os.scandir(snaps_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                with open(entry.path, "rb") as fh:
+                    files[entry.name] = fh.read()
+    return files
+
+
+def remove_snapshot_files(snaps_dir: Path) -> int:
+    """Delete every *.json file in snaps_dir with one directory scan; returns the count."""
+    removed = 0
+    with os.scandir(snaps_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                continue
+            removed += 1
+    return removed
+
+
 def _default_index() -> Dict[str, Any]:
     return {
         "schema_version": 2,
@@ -159,25 +188,22 @@ def ensure_storage() -> Tuple[Path, Path, Path]:
     sync_state_path = base / "sync_state.json"
 
     if not index_path.exists():
-        index_path.write_text(json.dumps(_default_index(), ensure_ascii=False, indent=2), encoding="utf-8")
+        index_path.write_bytes(_json_dumps(_default_index()))
     if not settings_path.exists():
-        settings_path.write_text(json.dumps(_default_settings(), ensure_ascii=False, indent=2), encoding="utf-8")
+        settings_path.write_bytes(_json_dumps(_default_settings()))
     if not conflicts_path.exists():
-        conflicts_path.write_text(json.dumps({"conflicts": []}, ensure_ascii=False, indent=2), encoding="utf-8")
+        conflicts_path.write_bytes(_json_dumps({"conflicts": []}))
     if not sync_state_path.exists():
-        sync_state_path.write_text(
-            json.dumps(
+        sync_state_path.write_bytes(
+            _json_dumps(
                 {
                     "provider": "",
                     "last_cursor": "",
                     "synced_at": "",
                     "snapshot_count": 0,
                     "conflict_count": 0,
-                },
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
+                }
+            )
         )
     return snaps, index_path, settings_path
 
@@ -190,8 +216,7 @@ def load_json(p: Path, default: Optional[Dict[str, Any]] = None) -> Dict[str, An
         if not p.exists():
             LOGGER.warning("JSON file not found: %s, using default", p)
             return default.copy()
-        content = p.read_text(encoding="utf-8")
-        data = json.loads(content)
+        data = _json_loads(p.read_bytes())
         if not isinstance(data, dict):
             LOGGER.warning("JSON file %s is not a dict, using default", p)
             return default.copy()
@@ -211,15 +236,64 @@ def load_json(p: Path, default: Optional[Dict[str, Any]] = None) -> Dict[str, An
         return default.copy()
 
 
-def save_json(p: Path, data: Dict[str, Any]) -> bool:
+def read_snapshot_file(p: Path) -> Dict[str, Any]:
+    """Parse and migrate one snapshot file. Raises OSError/ValueError like json.loads."""
+    return migrate_snapshot(_json_loads(p.read_bytes()))
+
+
+class SnapshotReadCache:
+    """Bytes of recently read snapshot files, reused while (mtime_ns, size) is unchanged.
+
+    Every read still parses a fresh dict, so callers may mutate the result; that is
+    much cheaper than deep-copying a cached dict. Only the on-disk bytes are kept,
+    never decrypted content. Safe to use from worker threads.
+    """
+
+    def __init__(self, limit: int = 128) -> None:
+        self._limit = limit
+        self._entries: OrderedDict[str, Tuple[Tuple[int, int], bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def read(self, p: Path) -> Optional[Dict[str, Any]]:
+        """read_snapshot_file() through the cache; None when the file does not exist."""
+        key = str(p)
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._entries.move_to_end(key)
+                raw = cached[1]
+            else:
+                raw = None
+        if raw is None:
+            raw = p.read_bytes()
+            with self._lock:
+                self._entries[key] = (stamp, raw)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._limit:
+                    self._entries.popitem(last=False)
+        return migrate_snapshot(_json_loads(raw))
+
+
+def save_json(p: Path, data: Dict[str, Any], *, indent: bool = True) -> bool:
     """Save JSON file atomically using temp file + rename pattern."""
     try:
-        content = json.dumps(data, ensure_ascii=False, indent=2)
+        content = _json_dumps(data, indent=indent)
         p.parent.mkdir(parents=True, exist_ok=True)
         fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=p.stem + "_", dir=str(p.parent))
         fd_closed = False
         try:
-            os.write(fd, content.encode("utf-8"))
+            os.write(fd, content)
             os.close(fd)
             fd_closed = True
             os.replace(tmp_path, str(p))
@@ -241,6 +315,15 @@ def save_json(p: Path, data: Dict[str, Any]) -> bool:
         return False
 
 
+def save_index(p: Path, index: Dict[str, Any]) -> bool:
+    """Save index.json atomically in compact form.
+
+    The index is rewritten on every pin/archive/save, so it skips the
+    indentation that roughly doubles its size; load_json() reads either form.
+    """
+    return save_json(p, index, indent=False)
+
+
 def append_restore_history(entry: Dict[str, Any]) -> None:
     """Append a restore entry to history with atomic write."""
     path = app_dir() / "restore_history.json"
@@ -383,11 +466,11 @@ def export_settings_to_file(path: Path, settings: Dict[str, Any]) -> None:
         "exported_at": now_iso(),
         "settings": settings,
     }
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(_json_dumps(payload))
 
 
 def import_settings_from_file(path: Path) -> Dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _json_loads(path.read_bytes())
     if isinstance(data, dict) and "settings" in data and isinstance(data["settings"], dict):
         data = data["settings"]
     if not isinstance(data, dict):
@@ -425,30 +508,88 @@ def export_backup_to_file(
         except Exception as exc:
             LOGGER.exception("read index for export: %s", exc)
             data["index"] = _default_index()
+    snapshot_files = sorted(snaps_dir.glob("*.json")) if include_snapshots else []
     if include_snapshots:
-        snaps: List[Dict[str, Any]] = []
-        for f in sorted(snaps_dir.glob("*.json")):
-            try:
-                snaps.append(migrate_snapshot(json.loads(f.read_text(encoding="utf-8"))))
-            except Exception as exc:
-                LOGGER.exception("read snapshot %s: %s", f.name, exc)
-                continue
-        data["snapshots"] = snaps
+        data["snapshots"] = []
     if data:
         payload["data"] = data
 
     if encrypt_backup:
+        # DPAPI encrypts the whole payload at once, so it has to be built in memory.
+        data["snapshots"] = list(_iter_export_snapshots(snapshot_files))
         security = SecurityService()
         wrapped = security.encrypt_backup_payload(payload)
-        path.write_text(json.dumps(wrapped, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(_json_dumps(wrapped))
         return
 
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_backup_stream(path, payload, snapshot_files if include_snapshots else None)
+
+
+def _iter_export_snapshots(files: List[Path]) -> Iterator[Dict[str, Any]]:
+    for f in files:
+        try:
+            yield read_snapshot_file(f)
+        except Exception as exc:
+            LOGGER.exception("read snapshot %s: %s", f.name, exc)
+
+
+# Closing bytes of an indented payload whose last value is data["snapshots"] == [].
+_EMPTY_SNAPSHOTS_TAIL = b"[]\n  }\n}"
+_SNAPSHOT_INDENT = b"\n      "
+
+
+def _export_snapshot_bytes(f: Path) -> Optional[bytes]:
+    """JSON for one snapshot in the backup stream, or None when the file is unreadable.
+
+    A file that migrate_snapshot() would leave unchanged is copied as-is; only
+    older snapshots are re-serialized (re-indented to match the payload).
+    """
+    try:
+        raw = f.read_bytes()
+        snap = _json_loads(raw)
+        if _snapshot_is_migrated(snap):
+            return raw.strip()
+        return _json_dumps(migrate_snapshot(snap)).replace(b"\n", _SNAPSHOT_INDENT)
+    except Exception as exc:
+        LOGGER.exception("read snapshot %s: %s", f.name, exc)
+        return None
+
+
+def _write_backup_stream(path: Path, payload: Dict[str, Any], snapshot_files: Optional[List[Path]]) -> None:
+    """Write the backup payload, adding snapshots one file at a time.
+
+    Only one snapshot is held in memory at a time. Around the snapshots the
+    bytes match _json_dumps(payload); current snapshot files are spliced in
+    verbatim (see _export_snapshot_bytes()).
+    """
+    head = _json_dumps(payload)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=path.stem + "_", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as out:
+            if snapshot_files is None:
+                out.write(head)
+            else:
+                if not head.endswith(_EMPTY_SNAPSHOTS_TAIL):
+                    raise ValueError("Unexpected backup payload layout")
+                out.write(head[: -len(_EMPTY_SNAPSHOTS_TAIL)] + b"[")
+                sep = b""
+                for f in snapshot_files:
+                    chunk = _export_snapshot_bytes(f)
+                    if chunk is None:
+                        continue
+                    out.write(sep + _SNAPSHOT_INDENT + chunk)
+                    sep = b","
+                out.write(b"\n    ]\n  }\n}" if sep else b"]\n  }\n}")
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
 
 
 def import_backup_from_file(path: Path) -> Dict[str, Any]:
     """Import either settings-only export, full backup, or encrypted backup."""
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = _json_loads(path.read_bytes())
     if not isinstance(raw, dict):
         raise ValueError("Invalid backup format")
 
@@ -469,6 +610,43 @@ def import_backup_from_file(path: Path) -> Dict[str, Any]:
     return {"settings": settings, "data": None, "encrypted_backup": False}
 
 
+# Keys migrate_snapshot() guarantees; keep in sync with it.
+_MIGRATED_SNAPSHOT_KEYS = frozenset(
+    {
+        "schema_version",
+        "vscode_workspace",
+        "tags",
+        "pinned",
+        "archived",
+        "running_apps",
+        "source",
+        "trigger",
+        "auto_fingerprint",
+        "rev",
+        "updated_at",
+        "git_state",
+        "sensitive",
+    }
+)
+_MIGRATED_GIT_STATE_KEYS = frozenset({"branch", "sha", "dirty", "changed", "staged", "untracked"})
+
+
+def _snapshot_is_migrated(snap: Any) -> bool:
+    """True when migrate_snapshot() would not change ``snap``."""
+    if not isinstance(snap, dict) or not snap.keys() >= _MIGRATED_SNAPSHOT_KEYS:
+        return False
+    schema_version, rev, git_state = snap["schema_version"], snap["rev"], snap["git_state"]
+    return (
+        type(schema_version) is int
+        and schema_version >= 2
+        and type(rev) is int
+        and rev >= 1
+        and isinstance(git_state, dict)
+        and git_state.keys() >= _MIGRATED_GIT_STATE_KEYS
+        and isinstance(snap["sensitive"], dict)
+    )
+
+
 def migrate_snapshot(snap: Dict[str, Any]) -> Dict[str, Any]:
     """Backfill missing keys for older snapshots."""
     snap.setdefault("schema_version", 2)
@@ -507,5 +685,5 @@ def gen_id() -> str:
 
 
 def save_snapshot_file(path: Path, snap: Dict[str, Any]) -> bool:
-    """Save snapshot file atomically."""
-    return save_json(path, snap)
+    """Save snapshot file atomically, in compact form like save_index()."""
+    return save_json(path, snap, indent=False)
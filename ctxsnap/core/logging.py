@@ -1,10 +1,25 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 from ctxsnap.app_storage import app_dir
 from ctxsnap.constants import APP_NAME
 
+# File writes/rotation run on a dedicated listener thread (kept global so it is not collected).
+_LISTENER: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is not None:
+        listener.stop()
+
+
 def setup_logging() -> Path:
     r"""Configure rotating file logs under %APPDATA%\ctxsnap\logs."""
     log_dir = app_dir() / "logs"
@@ -16,10 +31,16 @@ def setup_logging() -> Path:
     
     # clear existing handlers to avoid duplicates if called multiple times (though practically once)
     if not logger.handlers:
+        global _LISTENER
         handler = RotatingFileHandler(str(log_file), maxBytes=1_000_000, backupCount=5, encoding="utf-8")
         fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
         handler.setFormatter(fmt)
-        logger.addHandler(handler)
+        # Calling threads (UI/workers) only enqueue; the QueueListener thread does the disk I/O.
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        _LISTENER = QueueListener(log_queue, handler, respect_handler_level=True)
+        _LISTENER.start()
+        atexit.register(_stop_listener)
         
         # Also log to stdout for dev if needed, or if no console attached it goes nowhere
         # console = logging.StreamHandler(sys.stdout)
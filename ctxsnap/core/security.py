@@ -8,6 +8,7 @@ from copy import deepcopy
 from ctypes import wintypes
 from typing import Any, Dict, Iterable, Optional, Tuple
 
+from ctxsnap._json import loads
 from ctxsnap.constants import APP_NAME
 
 LOGGER = logging.getLogger(APP_NAME)
@@ -113,7 +114,7 @@ class SecurityService:
         if not blob:
             raise ValueError("Empty encrypted blob")
         raw = self._unprotect(base64.b64decode(blob.encode("ascii")))
-        data = json.loads(raw.decode("utf-8"))
+        data = loads(raw)
         if not isinstance(data, dict):
             raise ValueError("Decrypted payload is not dict")
         return data
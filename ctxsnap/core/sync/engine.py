@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from ctxsnap.app_storage import is_valid_snapshot_id, load_json, migrate_snapshot, now_iso, safe_snapshot_path, save_json, save_snapshot_file
+from ctxsnap.app_storage import is_valid_snapshot_id, load_json, migrate_snapshot, now_iso, read_snapshot_file, safe_snapshot_path, save_index, save_json, save_snapshot_file
 from ctxsnap.constants import APP_NAME
 from ctxsnap.core.sync.base import SyncConflict, SyncPayload, SyncProvider, snapshot_sort_key
 from ctxsnap.services.snapshot_service import SnapshotService
@@ -75,7 +75,7 @@ class SyncEngine:
         snaps: Dict[str, Dict[str, Any]] = {}
         for p in sorted(self.local_snaps_dir.glob("*.json")):
             try:
-                snap = migrate_snapshot(json.loads(p.read_text(encoding="utf-8")))
+                snap = read_snapshot_file(p)
             except Exception as exc:
                 LOGGER.warning("sync_pull skip corrupted local snapshot %s: %s", p.name, exc)
                 continue
@@ -243,7 +243,7 @@ class SyncEngine:
         merged_index["tombstones"] = merged_tombstones
         merged_index["snapshots"] = [self._entry_from_snapshot(s) for _, s in sorted(merged.items(), key=lambda kv: kv[1].get("created_at", ""), reverse=True)]
         merged_index = self.snapshot_service.migrate_index(merged_index)
-        save_json(self.local_index_path, merged_index)
+        save_index(self.local_index_path, merged_index)
 
         push_map = dict(merged)
         for conflict in conflicts:
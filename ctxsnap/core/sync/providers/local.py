@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict
 
+from ctxsnap._json import dumps, loads
 from ctxsnap.app_storage import now_iso
 from ctxsnap.core.sync.base import SyncPayload, SyncProvider, SyncProviderError
 
@@ -28,7 +28,7 @@ class LocalSyncProvider(SyncProvider):
             payload = self._default_payload()
         else:
             try:
-                payload = json.loads(self.payload_path.read_text(encoding="utf-8"))
+                payload = loads(self.payload_path.read_bytes())
             except Exception as exc:
                 raise SyncProviderError(f"Failed to read local sync payload: {exc}") from exc
         return SyncPayload(
@@ -45,7 +45,7 @@ class LocalSyncProvider(SyncProvider):
             "snapshots": payload.snapshots,
         }
         try:
-            self.payload_path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+            self.payload_path.write_bytes(dumps(raw))
         except Exception as exc:
             raise SyncProviderError(f"Failed to write local sync payload: {exc}") from exc
         return cursor
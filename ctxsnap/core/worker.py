@@ -1,12 +1,20 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PySide6 import QtCore
-from ctxsnap.utils import recent_files_under
+from ctxsnap.utils import compile_glob_patterns, git_title_suggestion, log_exc, recent_files_under
+
+
+# sid -> scan result. The GUI thread pops it instead of copying the list through the signal.
+_RECENT_FILES_RESULTS: Dict[str, Tuple[str, ...]] = {}
+
+
+def pop_recent_files_result(sid: str) -> Tuple[str, ...]:
+    return _RECENT_FILES_RESULTS.pop(sid, ())
 
 
 class RecentFilesWorker(QtCore.QObject):
-    finished = QtCore.Signal(str, list)
+    finished = QtCore.Signal(str)
     failed = QtCore.Signal(str, str)
 
     def __init__(
@@ -25,9 +33,12 @@ class RecentFilesWorker(QtCore.QObject):
         self.sid = sid
         self.root = root
         self.limit = limit
-        self.exclude_dirs = exclude_dirs
+        self.exclude_dirs = frozenset(d.lower() for d in exclude_dirs)
         self.include_patterns = include_patterns
         self.exclude_patterns = exclude_patterns
+        # Compile the glob patterns once instead of running fnmatch per file.
+        self._include_re = compile_glob_patterns(include_patterns)
+        self._exclude_re = compile_glob_patterns(exclude_patterns)
         self.scan_limit = scan_limit
         self.scan_seconds = scan_seconds
 
@@ -38,11 +49,83 @@ class RecentFilesWorker(QtCore.QObject):
                 self.root,
                 limit=self.limit,
                 exclude_dirs=self.exclude_dirs,
-                include_patterns=self.include_patterns,
-                exclude_patterns=self.exclude_patterns,
                 scan_limit=self.scan_limit,
                 scan_seconds=self.scan_seconds,
+                include_re=self._include_re,
+                exclude_re=self._exclude_re,
             )
-            self.finished.emit(self.sid, files)
+            _RECENT_FILES_RESULTS[self.sid] = tuple(files)
+            self.finished.emit(self.sid)
         except Exception as exc:
             self.failed.emit(self.sid, str(exc))
+
+
+class GitProbeSignals(QtCore.QObject):
+    finished = QtCore.Signal(str, object)
+
+
+class GitProbeWorker(QtCore.QRunnable):
+    """QThreadPool job computing git_title_suggestion(root) off the UI thread."""
+
+    def __init__(self, root: Path) -> None:
+        super().__init__()
+        self.root = root
+        self.signals = GitProbeSignals()
+
+    def run(self) -> None:
+        suggestion: Optional[str] = None
+        try:
+            suggestion = git_title_suggestion(self.root)
+        except Exception:
+            suggestion = None
+        self.signals.finished.emit(str(self.root), suggestion)
+
+
+class SnapshotLoadSignals(QtCore.QObject):
+    finished = QtCore.Signal(str, int, object)
+
+
+class SnapshotLoadWorker(QtCore.QRunnable):
+    """QThreadPool job reading (and decrypting) one snapshot file off the UI thread."""
+
+    def __init__(self, sid: str, token: int, load: Callable[[str], Optional[Dict[str, Any]]]) -> None:
+        super().__init__()
+        self.sid = sid
+        self.token = token
+        self.load = load
+        self.signals = SnapshotLoadSignals()
+
+    def run(self) -> None:
+        snap: Optional[Dict[str, Any]] = None
+        try:
+            snap = self.load(self.sid)
+        except Exception:
+            snap = None
+        self.signals.finished.emit(self.sid, self.token, snap)
+
+
+class SnapshotCaptureSignals(QtCore.QObject):
+    finished = QtCore.Signal(str, object)
+
+
+class SnapshotCaptureWorker(QtCore.QRunnable):
+    """QThreadPool job collecting a new snapshot's recent files, processes, apps and git state.
+
+    Emits the captured fields, or None when capturing raised.
+    """
+
+    def __init__(self, sid: str, capture: Callable[[], Dict[str, Any]]) -> None:
+        super().__init__()
+        self.sid = sid
+        self.capture = capture
+        self.signals = SnapshotCaptureSignals()
+
+    def run(self) -> None:
+        captured: Optional[Dict[str, Any]] = None
+        try:
+            captured = self.capture()
+        except Exception as exc:
+            log_exc("capture snapshot", exc)
+            captured = None
+        self.signals.finished.emit(self.sid, captured)
+
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import shlex
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ctxsnap.utils import build_search_blob
 
@@ -27,6 +27,39 @@ class SearchService:
         "title": "title",
     }
 
+    def __init__(self) -> None:
+        # sid -> (title, root, tags, search_blob, base_hay, tags_hay, cached_hay).
+        # The lowercased haystacks are reused across keystrokes; the source fields are
+        # compared on each lookup so an edited index row rebuilds its entry.
+        self._hay_cache: Dict[str, Tuple[Any, ...]] = {}
+        # sid -> (updated_at, rev, search_blob) of rows whose snapshot file added nothing
+        # to the stored search_blob (no encrypted fields, blob up to date). A miss on such
+        # a row is final, so it is not re-read from disk on every keystroke. Only the
+        # fact is kept, never decrypted text.
+        self._complete_blobs: Dict[str, Tuple[Any, Any, Any]] = {}
+
+    def _haystacks(self, item: Dict[str, Any], sid: str) -> Tuple[str, str, str]:
+        """Return (base_hay, tags_hay, cached_hay) lowercased for an index row."""
+        title = item.get("title", "")
+        root = item.get("root", "")
+        tags = item.get("tags", [])
+        blob = item.get("search_blob", "")
+        entry = self._hay_cache.get(sid) if sid else None
+        if (
+            entry is not None
+            and entry[0] == title
+            and entry[1] == root
+            and entry[2] == tags
+            and entry[3] == blob
+        ):
+            return entry[4], entry[5], entry[6]
+        tags_hay = " ".join(str(t).lower() for t in tags or [])
+        base_hay = f"{title or ''} {root or ''} {tags_hay}".lower()
+        cached_hay = base_hay + " " + str(blob).lower()
+        if sid:
+            self._hay_cache[sid] = (title, root, list(tags or []), blob, base_hay, tags_hay, cached_hay)
+        return base_hay, tags_hay, cached_hay
+
     def parse(self, raw: str, *, field_enabled: bool) -> ParsedQuery:
         out = ParsedQuery()
         query = (raw or "").strip()
@@ -55,6 +88,14 @@ class SearchService:
         h = haystack.lower()
         return all(n in h for n in needles)
 
+    @staticmethod
+    def _contains_all_lower(haystack: str, needles: List[str]) -> bool:
+        """Same as _contains_all for a haystack that is already lowercased (no extra copy)."""
+        for n in needles:
+            if n not in haystack:
+                return False
+        return True
+
     def matches_item(
         self,
         item: Dict[str, Any],
@@ -67,9 +108,8 @@ class SearchService:
 
         title = str(item.get("title", "") or "")
         root = str(item.get("root", "") or "")
-        tags = [str(t).lower() for t in item.get("tags", []) or []]
-        base_hay = f"{title} {root} {' '.join(tags)}".lower()
         sid = str(item.get("id") or "")
+        base_hay, tags_hay, cached_hay = self._haystacks(item, sid)
         snap: Optional[Dict[str, Any]] = None
 
         def ensure_snapshot() -> Optional[Dict[str, Any]]:
@@ -79,11 +119,18 @@ class SearchService:
             return snap
 
         if parsed.terms:
-            cached_hay = base_hay + " " + str(item.get("search_blob", "")).lower()
-            if not self._contains_all(cached_hay, parsed.terms):
+            if not self._contains_all_lower(cached_hay, parsed.terms):
+                stamp = (item.get("updated_at"), item.get("rev"), item.get("search_blob"))
+                if sid and self._complete_blobs.get(sid) == stamp:
+                    return False
                 loaded = ensure_snapshot()
-                runtime_hay = base_hay + " " + self.build_blob_if_missing(item, loaded).lower()
-                if not self._contains_all(runtime_hay, parsed.terms):
+                stored = str(item.get("search_blob") or "")
+                runtime = build_search_blob(loaded) if loaded else ""
+                if loaded and sid and runtime == stored:
+                    self._complete_blobs[sid] = stamp
+                    return False
+                runtime_hay = base_hay + " " + f"{stored} {runtime}".strip().lower()
+                if not self._contains_all_lower(runtime_hay, parsed.terms):
                     return False
 
         if not parsed.fields:
@@ -97,8 +144,7 @@ class SearchService:
                 if not self._contains_all(root, values):
                     return False
             elif field == "tags":
-                joined = " ".join(tags)
-                if not self._contains_all(joined, values):
+                if not self._contains_all_lower(tags_hay, values):
                     return False
             elif field in {"todos", "note", "processes", "running_apps"}:
                 loaded = ensure_snapshot()
@@ -114,7 +160,7 @@ class SearchService:
                 else:
                     apps = loaded.get("running_apps", []) or []
                     hay = " ".join(str(a.get("name", "")).lower() + " " + str(a.get("exe", "")).lower() for a in apps if isinstance(a, dict))
-                if not self._contains_all(hay, values):
+                if not self._contains_all_lower(hay, values):
                     return False
             else:
                 # Unknown field should fail closed.
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict
 
 from ctxsnap.app_storage import is_valid_snapshot_id, now_iso
+from ctxsnap.utils import safe_parse_datetime
 
 
 class SnapshotService:
@@ -36,9 +37,18 @@ class SnapshotService:
         out["updated_at"] = now_iso()
         return out
 
-    def migrate_index(self, index: Dict[str, Any]) -> Dict[str, Any]:
+    def migrate_index(self, index: Dict[str, Any], *, copy_rows: bool = True) -> Dict[str, Any]:
+        """Normalized copy of ``index``.
+
+        With ``copy_rows=False`` the snapshots list and its rows are shared with the
+        input instead of deep-copied; for callers that replace the index with the result.
+        """
         source = index if isinstance(index, dict) else {}
-        out: Dict[str, Any] = deepcopy(source)
+        if copy_rows:
+            out: Dict[str, Any] = deepcopy(source)
+        else:
+            out = deepcopy({key: value for key, value in source.items() if key != "snapshots"})
+            out["snapshots"] = source.get("snapshots")
         if not isinstance(out.get("snapshots"), list):
             out["snapshots"] = []
         search_meta = out.get("search_meta")
@@ -62,7 +72,9 @@ class SnapshotService:
         return out
 
     def touch_index(self, index: Dict[str, Any]) -> Dict[str, Any]:
-        out = self.migrate_index(index)
+        # Rows are shared: every caller assigns the result back to the live index, and
+        # keeping the list lets _index_row()'s id map survive metadata edits.
+        out = self.migrate_index(index, copy_rows=False)
         out["rev"] = max(1, self._to_int(out.get("rev", 1), 1)) + 1
         out["updated_at"] = now_iso()
         return out
@@ -100,7 +112,7 @@ class SnapshotService:
         return kept
 
     def upsert_tombstone(self, index: Dict[str, Any], sid: str, *, deleted_at: str | None = None) -> Dict[str, Any]:
-        out = self.migrate_index(index)
+        out = self.migrate_index(index, copy_rows=False)
         stamp = str(deleted_at or now_iso())
         merged = {item["id"]: item["deleted_at"] for item in out.get("tombstones", []) if isinstance(item, dict) and item.get("id")}
         previous = merged.get(sid, "")
@@ -133,10 +145,4 @@ class SnapshotService:
 
     @staticmethod
     def _parse_datetime(value: str) -> datetime | None:
-        raw = str(value or "").strip()
-        if not raw:
-            return None
-        try:
-            return datetime.strptime(raw, "%Y-%m-%dT%H:%M:%S")
-        except ValueError:
-            return None
+        return safe_parse_datetime(str(value or "").strip())
@@ -1,11 +1,81 @@
 from __future__ import annotations
 import difflib
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from PySide6 import QtCore, QtWidgets
 from ctxsnap.i18n import tr
 from ctxsnap.ui.styles import NoScrollComboBox
 
 
+def _format_unified_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _line_diff(a: List[str], b: List[str], fromfile: str, tofile: str, n: int = 3) -> Iterator[str]:
+    """difflib.unified_diff(lineterm="") equivalent that matches on interned line ids.
+
+    Lines are mapped to ints first so SequenceMatcher compares ints instead of strings.
+    """
+    ids: Dict[str, int] = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+    matcher = difflib.SequenceMatcher(None, a_ids, b_ids, autojunk=False)
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_unified_range(first[1], last[2])} +{_format_unified_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
+
+
+class _CompareSignals(QtCore.QObject):
+    finished = QtCore.Signal(int, str)
+
+
+class _CompareJob(QtCore.QRunnable):
+    """Serialize + diff two snapshots on the thread pool."""
+
+    def __init__(
+        self,
+        token: int,
+        serialize: Callable[[Dict[str, Any]], List[str]],
+        left: Dict[str, Any],
+        right: Dict[str, Any],
+    ) -> None:
+        super().__init__()
+        self.token = token
+        self.serialize = serialize
+        self.left = left
+        self.right = right
+        self.signals = _CompareSignals()
+
+    def run(self) -> None:
+        try:
+            diff = _line_diff(self.serialize(self.left), self.serialize(self.right), "Snapshot A", "Snapshot B")
+            diff_text = "\n".join(diff)
+        except Exception as exc:
+            diff_text = f"Compare failed: {exc}"
+        self.signals.finished.emit(self.token, diff_text)
+
+
 class RestoreHistoryDialog(QtWidgets.QDialog):
     restoreRequested = QtCore.Signal(str)
 
@@ -27,9 +97,12 @@ class RestoreHistoryDialog(QtWidgets.QDialog):
         self.detail.setPlaceholderText(tr("Select a restore entry to view details."))
 
         self._items = history.get("restores", []) if isinstance(history.get("restores"), list) else []
-        for entry in self._items:
-            label = f"🕐 {entry.get('created_at','')}  •  {entry.get('snapshot_id','')}"
-            self.listw.addItem(label)
+        self.listw.setUniformItemSizes(True)
+        self.listw.setUpdatesEnabled(False)
+        self.listw.addItems(
+            [f"🕐 {entry.get('created_at','')}  •  {entry.get('snapshot_id','')}" for entry in self._items]
+        )
+        self.listw.setUpdatesEnabled(True)
 
         self.listw.currentRowChanged.connect(self._on_select)
         self.listw.itemDoubleClicked.connect(lambda _item: self._request_restore())
@@ -104,6 +177,9 @@ class CompareDialog(QtWidgets.QDialog):
         self.setMinimumSize(780, 560)
         self._snaps = snapshots
         self._loader = loader
+        self._compare_token = 0
+        # token -> in-flight job, held until it reports back so it is released on the GUI thread
+        self._compare_jobs: Dict[int, _CompareJob] = {}
 
         title = QtWidgets.QLabel("🔍 " + tr("Compare two snapshots"))
         title.setObjectName("TitleLabel")
@@ -116,10 +192,10 @@ class CompareDialog(QtWidgets.QDialog):
         
         self.left_combo = NoScrollComboBox()
         self.right_combo = NoScrollComboBox()
-        for snap in snapshots:
-            label = f"{snap.get('title','')}  •  {snap.get('created_at','')}"
-            self.left_combo.addItem(label)
-            self.right_combo.addItem(label)
+        # Labels come from index rows only; snapshot files are loaded when Compare runs.
+        labels = [f"{snap.get('title','')}  •  {snap.get('created_at','')}" for snap in snapshots]
+        self.left_combo.addItems(labels)
+        self.right_combo.addItems(labels)
 
         if snapshots:
             self.left_combo.setCurrentIndex(0)
@@ -140,6 +216,7 @@ class CompareDialog(QtWidgets.QDialog):
         btn_compare = QtWidgets.QPushButton("⚡ " + tr("Compare"))
         btn_compare.setProperty("primary", True)
         btn_compare.clicked.connect(self._run_compare)
+        self.btn_compare = btn_compare
         btn_close = QtWidgets.QPushButton(tr("Close"))
         btn_close.clicked.connect(self.accept)
         
@@ -191,17 +268,22 @@ class CompareDialog(QtWidgets.QDialog):
         left_id = str(left_meta.get("id") or "")
         right_id = str(right_meta.get("id") or "")
         left = self._loader(left_id) or left_meta
-        right = self._loader(right_id) or right_meta
-        left_lines = self._serialize(left)
-        right_lines = self._serialize(right)
-        diff = difflib.unified_diff(
-            left_lines,
-            right_lines,
-            fromfile="Snapshot A",
-            tofile="Snapshot B",
-            lineterm="",
-        )
-        diff_text = "\n".join(diff)
+        right = left if right_id == left_id else (self._loader(right_id) or right_meta)
+        # Serialize + diff on the thread pool; only the latest request's result is applied.
+        self._compare_token += 1
+        job = _CompareJob(self._compare_token, self._serialize, left, right)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self._on_compare_finished)
+        self._compare_jobs[self._compare_token] = job
+        self.btn_compare.setEnabled(False)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    @QtCore.Slot(int, str)
+    def _on_compare_finished(self, token: int, diff_text: str) -> None:
+        self._compare_jobs.pop(token, None)
+        if token != self._compare_token:
+            return
+        self.btn_compare.setEnabled(True)
         if not diff_text.strip():
             diff_text = "✓ No differences found between the two snapshots."
         self.diff_view.setText(diff_text)
@@ -3,6 +3,30 @@ from typing import List
 from PySide6 import QtCore, QtWidgets
 from ctxsnap.i18n import tr
 
+# (title key, body key, icon) per page; translated when the dialog is built.
+_ONBOARDING_PAGES = (
+    ("Onboarding p1 title", "Onboarding p1 body", "📸"),
+    ("Onboarding p2 title", "Onboarding p2 body", "⚡"),
+    ("Onboarding p3 title", "Onboarding p3 body", "🔄"),
+    ("Onboarding p4 title", "Onboarding p4 body", "⚙️"),
+)
+
+_BODY_HTML = """
+            <div style="padding: 16px; line-height: 1.6; font-size: 14px; color: #f0f0f5;">
+                {body}
+            </div>
+        """
+
+# Set once on the page stack; it cascades to every page's QTextBrowser.
+_BODY_STYLE = """
+            QTextBrowser { 
+                background: rgba(26, 26, 36, 0.6); 
+                border: 1px solid rgba(42, 42, 64, 0.5); 
+                border-radius: 12px; 
+                padding: 12px;
+            }
+        """
+
 
 class OnboardingDialog(QtWidgets.QDialog):
     """Friendly first-run onboarding.
@@ -32,6 +56,7 @@ class OnboardingDialog(QtWidgets.QDialog):
         self.progress_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         self.stack = QtWidgets.QStackedWidget()
+        self.stack.setStyleSheet(_BODY_STYLE)
         self.pages: List[QtWidgets.QWidget] = []
         self._build_pages()
 
@@ -77,19 +102,7 @@ class OnboardingDialog(QtWidgets.QDialog):
         
         b = QtWidgets.QTextBrowser()
         b.setOpenExternalLinks(False)
-        b.setHtml(f"""
-            <div style="padding: 16px; line-height: 1.6; font-size: 14px; color: #f0f0f5;">
-                {body_html}
-            </div>
-        """)
-        b.setStyleSheet("""
-            QTextBrowser { 
-                background: rgba(26, 26, 36, 0.6); 
-                border: 1px solid rgba(42, 42, 64, 0.5); 
-                border-radius: 12px; 
-                padding: 12px;
-            }
-        """)
+        b.setHtml(_BODY_HTML.format(body=body_html))
         
         lay = QtWidgets.QVBoxLayout(w)
         lay.setSpacing(12)
@@ -98,27 +111,8 @@ class OnboardingDialog(QtWidgets.QDialog):
         return w
 
     def _build_pages(self) -> None:
-        p1 = self._mk_page(
-            tr("Onboarding p1 title"),
-            tr("Onboarding p1 body"),
-            "📸",
-        )
-        p2 = self._mk_page(
-            tr("Onboarding p2 title"),
-            tr("Onboarding p2 body"),
-            "⚡",
-        )
-        p3 = self._mk_page(
-            tr("Onboarding p3 title"),
-            tr("Onboarding p3 body"),
-            "🔄",
-        )
-        p4 = self._mk_page(
-            tr("Onboarding p4 title"), 
-            tr("Onboarding p4 body"),
-            "⚙️",
-        )
-        for p in [p1, p2, p3, p4]:
+        for title, body, icon in _ONBOARDING_PAGES:
+            p = self._mk_page(tr(title), tr(body), icon)
             self.pages.append(p)
             self.stack.addWidget(p)
 
@@ -1,9 +1,20 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+import io
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from PySide6 import QtCore, QtWidgets
 from ctxsnap.i18n import tr
 
 
+def _write_lines(w: Callable[[str], Any], lines: Iterable[str], empty: str) -> None:
+    sep = ""
+    for line in lines:
+        w(sep)
+        w(line)
+        sep = "\n"
+    if not sep:
+        w(empty)
+
+
 class RestorePreviewDialog(QtWidgets.QDialog):
     def __init__(
         self,
@@ -91,6 +102,8 @@ class RestorePreviewDialog(QtWidgets.QDialog):
             QtWidgets.QAbstractItemView.SelectionMode.NoSelection
         )
         self.apps_list.setMaximumHeight(120)
+        self.apps_list.setUniformItemSizes(True)
+        self.apps_list.setUpdatesEnabled(False)
         for app in running_apps:
             label = f"  {app.get('name','')}  •  {app.get('exe','')}"
             item = QtWidgets.QListWidgetItem(label)
@@ -102,23 +115,24 @@ class RestorePreviewDialog(QtWidgets.QDialog):
             )
             item.setData(QtCore.Qt.ItemDataRole.UserRole, app)
             self.apps_list.addItem(item)
+        self.apps_list.setUpdatesEnabled(True)
 
         # Snapshot info display
         info = QtWidgets.QTextEdit()
         info.setReadOnly(True)
         info.setPlaceholderText(tr("Snapshot details"))
         
-        todo_text = "\n".join([f"  {i+1}. {t}" for i, t in enumerate(todos[:3]) if t])
-        recent_text = "\n".join([f"  • {p}" for p in recent[:8]])
-        apps_text = "\n".join([f"  • {p.get('name','')}  →  {p.get('exe','')}" for p in running_apps[:6]])
-        
-        info.setText(
-            f"📂 Root:\n  {root}\n\n"
-            f"📝 Note:\n  {note or '(none)'}\n\n"
-            f"📋 TODOs:\n{todo_text or '  (none)'}\n\n"
-            f"📁 Recent files ({len(recent)} total, showing top 8):\n{recent_text or '  (none)'}\n\n"
-            f"📱 Running apps ({len(running_apps)} total, showing top 6):\n{apps_text or '  (none)'}"
-        )
+        buf = io.StringIO()
+        w = buf.write
+        w(f"📂 Root:\n  {root}\n\n")
+        w(f"📝 Note:\n  {note or '(none)'}\n\n")
+        w("📋 TODOs:\n")
+        _write_lines(w, (f"  {i+1}. {t}" for i, t in enumerate(todos[:3]) if t), "  (none)")
+        w(f"\n\n📁 Recent files ({len(recent)} total, showing top 8):\n")
+        _write_lines(w, (f"  • {p}" for p in recent[:8]), "  (none)")
+        w(f"\n\n📱 Running apps ({len(running_apps)} total, showing top 6):\n")
+        _write_lines(w, (f"  • {p.get('name','')}  →  {p.get('exe','')}" for p in running_apps[:6]), "  (none)")
+        info.setText(buf.getvalue())
 
         # Buttons
         btn_restore = QtWidgets.QPushButton("▶ " + tr("Restore"))
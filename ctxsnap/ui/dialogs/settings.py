@@ -1,7 +1,9 @@
 from __future__ import annotations
+import contextlib
+import functools
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from PySide6 import QtCore, QtWidgets
 
 from ctxsnap.constants import DEFAULT_TAGS, APP_NAME, default_tags_for_language
@@ -20,6 +22,160 @@ from ctxsnap.ui.styles import (
 )
 
 
+# Defaults for nested settings sections; merged once via {**defaults, **sub} instead of per-key .get() defaults.
+_HOTKEY_DEFAULTS: Dict[str, Any] = {"enabled": True, "ctrl": True, "alt": True, "shift": False, "vk": "S"}
+_RESTORE_DEFAULTS: Dict[str, Any] = {
+    "open_folder": True,
+    "open_terminal": True,
+    "open_vscode": True,
+    "open_running_apps": False,
+    "show_post_restore_checklist": True,
+}
+_CAPTURE_DEFAULTS: Dict[str, Any] = {"recent_files": True, "processes": True, "running_apps": True}
+_DEV_FLAGS_DEFAULTS: Dict[str, Any] = {
+    "sync_enabled": False,
+    "security_enabled": False,
+    "advanced_search_enabled": False,
+    "restore_profiles_enabled": False,
+}
+_SECURITY_DEFAULTS: Dict[str, Any] = {
+    "dpapi_enabled": False,
+    "encrypt_note": True,
+    "encrypt_todos": True,
+    "encrypt_processes": True,
+    "encrypt_running_apps": True,
+}
+_SEARCH_DEFAULTS: Dict[str, Any] = {"enable_field_query": True, "saved_queries": []}
+_TOP_LEVEL_DEFAULTS: Dict[str, Any] = {
+    "restore_preview_default": True,
+    "recent_files_limit": 30,
+    "recent_files_scan_limit": 20000,
+    "recent_files_scan_seconds": 2.0,
+    "recent_files_background": False,
+    "list_page_size": 200,
+    "auto_snapshot_minutes": 0,
+    "auto_snapshot_on_git_change": False,
+    "capture_note": True,
+    "capture_todos": True,
+    "capture_enforce_todos": True,
+    "archive_after_days": 0,
+    "archive_skip_pinned": True,
+    "auto_backup_hours": 0,
+}
+_SECTION_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "hotkey": _HOTKEY_DEFAULTS,
+    "restore": _RESTORE_DEFAULTS,
+    "capture": _CAPTURE_DEFAULTS,
+    "dev_flags": _DEV_FLAGS_DEFAULTS,
+    "security": _SECURITY_DEFAULTS,
+    "search": _SEARCH_DEFAULTS,
+}
+
+# (widget attribute, settings section or None for top level, key, coercer) for every
+# checkbox (bool) and spin box (int/float). Shared by the tab builders and
+# apply_settings_to_controls so both paths always set the same fields.
+_FieldSpec = Tuple[str, Optional[str], str, Callable[[Any], Any]]
+_GENERAL_FIELDS: Tuple[_FieldSpec, ...] = (
+    ("recent_spin", None, "recent_files_limit", int),
+    ("scan_limit_spin", None, "recent_files_scan_limit", int),
+    ("scan_seconds_spin", None, "recent_files_scan_seconds", float),
+    ("background_recent", None, "recent_files_background", bool),
+    ("page_size_spin", None, "list_page_size", int),
+    ("auto_snapshot_minutes", None, "auto_snapshot_minutes", int),
+    ("auto_snapshot_on_git", None, "auto_snapshot_on_git_change", bool),
+    ("capture_recent", "capture", "recent_files", bool),
+    ("capture_processes", "capture", "processes", bool),
+    ("capture_running_apps", "capture", "running_apps", bool),
+    ("capture_note", None, "capture_note", bool),
+    ("capture_todos", None, "capture_todos", bool),
+    ("capture_enforce_todos", None, "capture_enforce_todos", bool),
+    ("archive_after_days", None, "archive_after_days", int),
+    ("archive_skip_pinned", None, "archive_skip_pinned", bool),
+    ("auto_backup_hours", None, "auto_backup_hours", int),
+    ("flag_sync_enabled", "dev_flags", "sync_enabled", bool),
+    ("flag_security_enabled", "dev_flags", "security_enabled", bool),
+    ("flag_adv_search_enabled", "dev_flags", "advanced_search_enabled", bool),
+    ("flag_restore_profiles_enabled", "dev_flags", "restore_profiles_enabled", bool),
+    ("dpapi_enabled", "security", "dpapi_enabled", bool),
+    ("sec_note", "security", "encrypt_note", bool),
+    ("sec_todos", "security", "encrypt_todos", bool),
+    ("sec_processes", "security", "encrypt_processes", bool),
+    ("sec_apps", "security", "encrypt_running_apps", bool),
+    ("search_enable_field_query", "search", "enable_field_query", bool),
+)
+_RESTORE_FIELDS: Tuple[_FieldSpec, ...] = (
+    ("rs_folder", "restore", "open_folder", bool),
+    ("rs_terminal", "restore", "open_terminal", bool),
+    ("rs_vscode", "restore", "open_vscode", bool),
+    ("rs_running_apps", "restore", "open_running_apps", bool),
+    ("rs_checklist", "restore", "show_post_restore_checklist", bool),
+    ("preview_default", None, "restore_preview_default", bool),
+)
+_HOTKEY_FIELDS: Tuple[_FieldSpec, ...] = (
+    ("hk_enabled", "hotkey", "enabled", bool),
+    ("hk_ctrl", "hotkey", "ctrl", bool),
+    ("hk_alt", "hotkey", "alt", bool),
+    ("hk_shift", "hotkey", "shift", bool),
+)
+_ALL_FIELDS = _GENERAL_FIELDS + _RESTORE_FIELDS + _HOTKEY_FIELDS
+# (line edit attribute, settings key) for the comma-separated list fields.
+_CSV_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("exclude_dirs", "recent_files_exclude"),
+    ("include_patterns", "recent_files_include"),
+    ("exclude_patterns", "recent_files_exclude_patterns"),
+    ("process_keywords", "process_keywords"),
+)
+_ERROR_STYLE = "color: #ef4444; font-weight: 500;"
+_JSON_FILTER = "JSON files (*.json)"
+# (label, widget attribute) rows of the template editor grid.
+_TEMPLATE_FORM_ROWS: Tuple[Tuple[str, str], ...] = (
+    ("📝 Name", "template_name"),
+    ("📄 Note", "template_note"),
+    ("1️⃣ TODO 1", "template_todo1"),
+    ("2️⃣ TODO 2", "template_todo2"),
+    ("3️⃣ TODO 3", "template_todo3"),
+    ("🏷️ Tags", "template_tags"),
+)
+# Every value control touched by apply_settings_to_controls (list widgets block their own signals).
+_FROZEN_CONTROLS: Tuple[str, ...] = tuple(spec[0] for spec in _ALL_FIELDS) + (
+    "lang_combo",
+    "default_root_edit",
+    "hk_key",
+    "exclude_dirs",
+    "include_patterns",
+    "exclude_patterns",
+    "process_keywords",
+    "sync_provider",
+    "sync_local_root",
+    "sync_interval_minutes",
+    "search_saved_queries",
+)
+
+
+def _merged_section(settings: Dict[str, Any], key: str, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Return settings[key] merged over its defaults as a new dict."""
+    sub = settings.get(key)
+    if not isinstance(sub, dict):
+        return dict(defaults)
+    return {**defaults, **sub}
+
+
+def _hint_label(text: str, *, wrap: bool = False) -> QtWidgets.QLabel:
+    """Create a label styled by the HintLabel stylesheet rule."""
+    label = QtWidgets.QLabel(text)
+    label.setObjectName("HintLabel")
+    if wrap:
+        label.setWordWrap(True)
+    return label
+
+
+def _title_label(text: str) -> QtWidgets.QLabel:
+    """Create a label styled by the TitleLabel stylesheet rule."""
+    label = QtWidgets.QLabel(text)
+    label.setObjectName("TitleLabel")
+    return label
+
+
 def _make_scrollable(widget: QtWidgets.QWidget) -> QtWidgets.QScrollArea:
     """Wrap a widget in a scroll area for overflow handling."""
     scroll = QtWidgets.QScrollArea()
@@ -35,6 +191,30 @@ def _make_scrollable(widget: QtWidgets.QWidget) -> QtWidgets.QScrollArea:
     return scroll
 
 
+class _BackupSignals(QtCore.QObject):
+    finished = QtCore.Signal(str, str, object, str)
+
+
+class _BackupJob(QtCore.QRunnable):
+    """Run a backup export/import call on the thread pool."""
+
+    def __init__(self, kind: str, path: str, fn: Callable[[], Any]) -> None:
+        super().__init__()
+        self.kind = kind
+        self.path = path
+        self.fn = fn
+        self.signals = _BackupSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn()
+        except Exception as exc:
+            log_exc(f"{self.kind} backup", exc)
+            self.signals.finished.emit(self.kind, self.path, None, str(exc))
+            return
+        self.signals.finished.emit(self.kind, self.path, result, "")
+
+
 class SettingsDialog(QtWidgets.QDialog):
     """Settings UI:
     - Hotkey (Ctrl/Alt/Shift/Key, enable)
@@ -59,143 +239,17 @@ class SettingsDialog(QtWidgets.QDialog):
         self._snaps_dir = snaps_dir
         self._imported_payload = None
         self._import_apply_now = False
+        self._backup_busy = False
+        # Running backup job, held until it reports back so it is released on the GUI thread
+        self._backup_job: Optional[_BackupJob] = None
+        # values() is cached until any tracked control changes (see _track_changes).
+        self._values_rev = 0
+        self._values_cache: Optional[Tuple[int, Dict[str, Any]]] = None
 
-        header = QtWidgets.QLabel("⚙️ " + tr("Settings"))
-        header.setObjectName("TitleLabel")
-        sub = QtWidgets.QLabel(tr("Settings Hint"))
-        sub.setObjectName("HintLabel")
+        header = _title_label("⚙️ " + tr("Settings"))
+        sub = _hint_label(tr("Settings Hint"))
 
-        tabs = QtWidgets.QTabWidget()
-
-        # === Hotkey tab ===
-        hk = settings.get("hotkey", {})
-        self.hk_enabled = QtWidgets.QCheckBox("✓ " + tr("Enable Hotkey"))
-        self.hk_enabled.setChecked(bool(hk.get("enabled", True)))
-        self.hk_ctrl = QtWidgets.QCheckBox("Ctrl")
-        self.hk_alt = QtWidgets.QCheckBox("Alt")
-        self.hk_shift = QtWidgets.QCheckBox("Shift")
-        self.hk_ctrl.setChecked(bool(hk.get("ctrl", True)))
-        self.hk_alt.setChecked(bool(hk.get("alt", True)))
-        self.hk_shift.setChecked(bool(hk.get("shift", False)))
-        self.hk_key = NoScrollComboBox()
-        for c in [chr(i) for i in range(ord("A"), ord("Z") + 1)]:
-            self.hk_key.addItem(c)
-        vk = str(hk.get("vk", "S")).upper()
-        idx = self.hk_key.findText(vk)
-        if idx >= 0:
-            self.hk_key.setCurrentIndex(idx)
-
-        hk_row = QtWidgets.QHBoxLayout()
-        hk_row.setSpacing(12)
-        hk_row.addWidget(self.hk_ctrl)
-        hk_row.addWidget(self.hk_alt)
-        hk_row.addWidget(self.hk_shift)
-        hk_row.addStretch(1)
-        hk_row.addWidget(QtWidgets.QLabel("🔤 Key"))
-        hk_row.addWidget(self.hk_key)
-
-        hotkey_page = QtWidgets.QWidget()
-        hk_box = QtWidgets.QGroupBox("⌨️ " + tr("Global Hotkey"))
-        hk_box_l = QtWidgets.QVBoxLayout(hk_box)
-        hk_box_l.setSpacing(10)
-        hk_box_l.addWidget(self.hk_enabled)
-        hk_box_l.addLayout(hk_row)
-        hk_hint = QtWidgets.QLabel("💡 " + tr("Hotkey Hint"))
-        hk_hint.setObjectName("HintLabel")
-        hk_hint.setWordWrap(True)
-        hk_layout = QtWidgets.QVBoxLayout(hotkey_page)
-        hk_layout.setSpacing(12)
-        hk_layout.setContentsMargins(16, 16, 16, 16)
-        hk_layout.addWidget(hk_box)
-        hk_layout.addWidget(hk_hint)
-        hk_layout.addStretch(1)
-
-        # === Restore tab ===
-        restore = settings.get("restore", {})
-        self.rs_folder = QtWidgets.QCheckBox("📁 " + tr("Open folder on restore"))
-        self.rs_terminal = QtWidgets.QCheckBox("💻 " + tr("Open terminal on restore"))
-        self.rs_vscode = QtWidgets.QCheckBox("🔷 " + tr("Open VSCode on restore"))
-        self.rs_running_apps = QtWidgets.QCheckBox("📱 " + tr("Restore apps on restore"))
-        self.rs_checklist = QtWidgets.QCheckBox("✅ " + tr("Show post-restore checklist"))
-        self.rs_folder.setChecked(bool(restore.get("open_folder", True)))
-        self.rs_terminal.setChecked(bool(restore.get("open_terminal", True)))
-        self.rs_vscode.setChecked(bool(restore.get("open_vscode", True)))
-        self.rs_running_apps.setChecked(bool(restore.get("open_running_apps", False)))
-        self.rs_checklist.setChecked(bool(restore.get("show_post_restore_checklist", True)))
-
-        self.preview_default = QtWidgets.QCheckBox("👁 " + tr("Show restore preview by default"))
-        self.preview_default.setChecked(bool(settings.get("restore_preview_default", True)))
-
-        restore_page = QtWidgets.QWidget()
-        restore_box = QtWidgets.QGroupBox("🔄 " + tr("Restore Defaults"))
-        restore_l = QtWidgets.QVBoxLayout(restore_box)
-        restore_l.setSpacing(8)
-        restore_l.addWidget(self.rs_folder)
-        restore_l.addWidget(self.rs_terminal)
-        restore_l.addWidget(self.rs_vscode)
-        restore_l.addWidget(self.rs_running_apps)
-        restore_l.addWidget(self.rs_checklist)
-        restore_l.addSpacing(12)
-        restore_l.addWidget(self.preview_default)
-
-        self.restore_profiles_list = QtWidgets.QListWidget()
-        self.restore_profiles_list.setSelectionMode(
-            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
-        )
-        self.restore_profiles_list.setMaximumHeight(120)
-        self.rp_name = QtWidgets.QLineEdit()
-        self.rp_name.setPlaceholderText(tr("Profile name"))
-        self.rp_default = QtWidgets.QCheckBox(tr("Default profile"))
-        self.rp_folder = QtWidgets.QCheckBox(tr("Open folder on restore"))
-        self.rp_terminal = QtWidgets.QCheckBox(tr("Open terminal on restore"))
-        self.rp_vscode = QtWidgets.QCheckBox(tr("Open VSCode on restore"))
-        self.rp_running_apps = QtWidgets.QCheckBox(tr("Restore apps on restore"))
-        self.rp_checklist = QtWidgets.QCheckBox(tr("Show post-restore checklist"))
-        self.rp_folder.setChecked(True)
-        self.rp_terminal.setChecked(True)
-        self.rp_vscode.setChecked(True)
-        self.rp_checklist.setChecked(True)
-        self.btn_rp_add = QtWidgets.QPushButton("💾 " + tr("Add / Update"))
-        self.btn_rp_add.setProperty("primary", True)
-        self.btn_rp_remove = QtWidgets.QPushButton("🗑 " + tr("Delete"))
-        self.btn_rp_remove.setProperty("danger", True)
-        self.btn_rp_add.clicked.connect(self.add_or_update_restore_profile)
-        self.btn_rp_remove.clicked.connect(self.remove_restore_profile)
-        self.restore_profiles_list.currentRowChanged.connect(self.load_restore_profile)
-        self._restore_profiles_cache: List[Dict[str, Any]] = []
-        self._load_restore_profiles(settings.get("restore_profiles", []))
-
-        rp_form = QtWidgets.QFormLayout()
-        rp_form.addRow("📝 " + tr("Name"), self.rp_name)
-        rp_form.addRow("", self.rp_default)
-        rp_form.addRow("", self.rp_folder)
-        rp_form.addRow("", self.rp_terminal)
-        rp_form.addRow("", self.rp_vscode)
-        rp_form.addRow("", self.rp_running_apps)
-        rp_form.addRow("", self.rp_checklist)
-
-        rp_btns = QtWidgets.QHBoxLayout()
-        rp_btns.setSpacing(8)
-        rp_btns.addWidget(self.btn_rp_add)
-        rp_btns.addWidget(self.btn_rp_remove)
-        rp_btns.addStretch(1)
-
-        rp_box = QtWidgets.QGroupBox("🧩 " + tr("Restore Profiles"))
-        rp_box_l = QtWidgets.QVBoxLayout(rp_box)
-        rp_box_l.addWidget(self.restore_profiles_list)
-        rp_box_l.addLayout(rp_form)
-        rp_box_l.addLayout(rp_btns)
-
-        restore_hint = QtWidgets.QLabel("💡 " + tr("Restore Preview Hint"))
-        restore_hint.setObjectName("HintLabel")
-        restore_hint.setWordWrap(True)
-        restore_layout = QtWidgets.QVBoxLayout(restore_page)
-        restore_layout.setSpacing(12)
-        restore_layout.setContentsMargins(16, 16, 16, 16)
-        restore_layout.addWidget(restore_box)
-        restore_layout.addWidget(rp_box)
-        restore_layout.addWidget(restore_hint)
-        restore_layout.addStretch(1)
+        self.tabs = QtWidgets.QTabWidget()
 
         # === General tab (SCROLLABLE) ===
         general_content = QtWidgets.QWidget()
@@ -226,25 +280,22 @@ class SettingsDialog(QtWidgets.QDialog):
         # Recent files settings
         self.recent_spin = NoScrollSpinBox()
         self.recent_spin.setRange(0, 300)
-        self.recent_spin.setValue(int(settings.get("recent_files_limit", 30)))
         self.recent_spin.setSuffix(tr("suffix_files"))
         self.scan_limit_spin = NoScrollSpinBox()
         self.scan_limit_spin.setRange(100, 200000)
-        self.scan_limit_spin.setValue(int(settings.get("recent_files_scan_limit", 20000)))
         self.scan_limit_spin.setSuffix(tr("suffix_files"))
         self.scan_seconds_spin = NoScrollDoubleSpinBox()
         self.scan_seconds_spin.setRange(0.1, 10.0)
         self.scan_seconds_spin.setSingleStep(0.5)
-        self.scan_seconds_spin.setValue(float(settings.get("recent_files_scan_seconds", 2.0)))
         self.scan_seconds_spin.setSuffix(tr("suffix_sec"))
-        self.background_recent = QtWidgets.QCheckBox("🔄 " + tr("Recent Files Scan"))
-        self.background_recent.setToolTip(tr("Recent Files Scan"))
-        self.background_recent.setChecked(bool(settings.get("recent_files_background", False)))
+        scan_text = tr("Recent Files Scan")
+        self.background_recent = QtWidgets.QCheckBox("🔄 " + scan_text)
+        self.background_recent.setToolTip(scan_text)
         
-        scan_box = QtWidgets.QGroupBox("📁 " + tr("Recent Files Scan"))
+        scan_box = QtWidgets.QGroupBox("📁 " + scan_text)
         scan_layout = QtWidgets.QFormLayout(scan_box)
         scan_layout.setSpacing(8)
-        scan_layout.addRow("📊 " + tr("Recent Files Scan") + ":", self.recent_spin)
+        scan_layout.addRow("📊 " + scan_text + ":", self.recent_spin)
         scan_layout.addRow("🔍 " + tr("Scan limit") + ":", self.scan_limit_spin)
         scan_layout.addRow("⏱ " + tr("Scan timeout") + ":", self.scan_seconds_spin)
         scan_layout.addRow("", self.background_recent)
@@ -252,16 +303,13 @@ class SettingsDialog(QtWidgets.QDialog):
         # Pagination
         self.page_size_spin = NoScrollSpinBox()
         self.page_size_spin.setRange(20, 2000)
-        self.page_size_spin.setValue(int(settings.get("list_page_size", 200)))
         self.page_size_spin.setSuffix(tr("suffix_per_page"))
         
         # Auto snapshot
         self.auto_snapshot_minutes = NoScrollSpinBox()
         self.auto_snapshot_minutes.setRange(0, 1440)
         self.auto_snapshot_minutes.setSuffix(tr("suffix_min"))
-        self.auto_snapshot_minutes.setValue(int(settings.get("auto_snapshot_minutes", 0)))
         self.auto_snapshot_on_git = QtWidgets.QCheckBox("📦 " + tr("Trigger on Git commit"))
-        self.auto_snapshot_on_git.setChecked(bool(settings.get("auto_snapshot_on_git_change", False)))
         
         auto_box = QtWidgets.QGroupBox("⏰ " + tr("Automation"))
         auto_layout = QtWidgets.QFormLayout(auto_box)
@@ -271,7 +319,6 @@ class SettingsDialog(QtWidgets.QDialog):
         auto_layout.addRow("", self.auto_snapshot_on_git)
         
         # Capture settings
-        capture = settings.get("capture", {})
         self.capture_recent = QtWidgets.QCheckBox("📁 " + tr("Capture recent files")) 
         self.capture_processes = QtWidgets.QCheckBox("⚙️ " + tr("Capture running processes"))
         self.capture_running_apps = QtWidgets.QCheckBox("📱 " + tr("Running apps to restore"))
@@ -280,15 +327,9 @@ class SettingsDialog(QtWidgets.QDialog):
         self.capture_enforce_todos = QtWidgets.QCheckBox("⚠️ " + tr("Enforce 3 TODOs"))
         
         self.capture_recent.setToolTip(tr("Recent Files Hint"))
-        self.capture_processes.setToolTip(tr("Privacy Hint"))
-        self.capture_running_apps.setToolTip(tr("Privacy Hint"))
-        
-        self.capture_recent.setChecked(bool(capture.get("recent_files", True)))
-        self.capture_processes.setChecked(bool(capture.get("processes", True)))
-        self.capture_running_apps.setChecked(bool(capture.get("running_apps", True)))
-        self.capture_note.setChecked(bool(settings.get("capture_note", True)))
-        self.capture_todos.setChecked(bool(settings.get("capture_todos", True)))
-        self.capture_enforce_todos.setChecked(bool(settings.get("capture_enforce_todos", True)))
+        privacy_text = tr("Privacy Hint")
+        self.capture_processes.setToolTip(privacy_text)
+        self.capture_running_apps.setToolTip(privacy_text)
 
         capture_box = QtWidgets.QGroupBox("📸 " + tr("Capture Options"))
         capture_layout = QtWidgets.QVBoxLayout(capture_box)
@@ -303,13 +344,10 @@ class SettingsDialog(QtWidgets.QDialog):
         # Archive & Backup
         self.archive_after_days = NoScrollSpinBox()
         self.archive_after_days.setRange(0, 3650)
-        self.archive_after_days.setValue(int(settings.get("archive_after_days", 0)))
         self.archive_after_days.setSuffix(tr("suffix_days"))
         self.archive_skip_pinned = QtWidgets.QCheckBox("📌 " + tr("Skip pinned snapshots when auto-archiving"))
-        self.archive_skip_pinned.setChecked(bool(settings.get("archive_skip_pinned", True)))
         self.auto_backup_hours = NoScrollSpinBox()
         self.auto_backup_hours.setRange(0, 168)
-        self.auto_backup_hours.setValue(int(settings.get("auto_backup_hours", 0)))
         self.auto_backup_hours.setSuffix(tr("suffix_hours"))
         
         archive_box = QtWidgets.QGroupBox("🗄️ " + tr("Archive & Backup"))
@@ -320,15 +358,10 @@ class SettingsDialog(QtWidgets.QDialog):
         archive_layout.addRow("💾 " + tr("Auto backup interval") + ":", self.auto_backup_hours)
 
         # Developer flags / Sync / Security / Search
-        dev_flags = settings.get("dev_flags", {})
         self.flag_sync_enabled = QtWidgets.QCheckBox("🛰️ " + tr("Enable Sync Feature"))
         self.flag_security_enabled = QtWidgets.QCheckBox("🔐 " + tr("Enable Security Feature"))
         self.flag_adv_search_enabled = QtWidgets.QCheckBox("🔎 " + tr("Enable Advanced Search"))
         self.flag_restore_profiles_enabled = QtWidgets.QCheckBox("🧩 " + tr("Enable Restore Profiles"))
-        self.flag_sync_enabled.setChecked(bool(dev_flags.get("sync_enabled", False)))
-        self.flag_security_enabled.setChecked(bool(dev_flags.get("security_enabled", False)))
-        self.flag_adv_search_enabled.setChecked(bool(dev_flags.get("advanced_search_enabled", False)))
-        self.flag_restore_profiles_enabled.setChecked(bool(dev_flags.get("restore_profiles_enabled", False)))
 
         dev_box = QtWidgets.QGroupBox("🛠️ " + tr("Developer Features"))
         dev_layout = QtWidgets.QVBoxLayout(dev_box)
@@ -360,17 +393,11 @@ class SettingsDialog(QtWidgets.QDialog):
         sync_layout.addRow(tr("Sync Interval (minutes)"), self.sync_interval_minutes)
         sync_layout.addRow("", self.btn_sync_now)
 
-        security_cfg = settings.get("security", {})
         self.dpapi_enabled = QtWidgets.QCheckBox("🔐 " + tr("Enable DPAPI"))
-        self.dpapi_enabled.setChecked(bool(security_cfg.get("dpapi_enabled", False)))
         self.sec_note = QtWidgets.QCheckBox("📝 " + tr("Encrypt Note"))
         self.sec_todos = QtWidgets.QCheckBox("✅ " + tr("Encrypt TODOs"))
         self.sec_processes = QtWidgets.QCheckBox("⚙️ " + tr("Encrypt Processes"))
         self.sec_apps = QtWidgets.QCheckBox("📱 " + tr("Encrypt Running Apps"))
-        self.sec_note.setChecked(bool(security_cfg.get("encrypt_note", True)))
-        self.sec_todos.setChecked(bool(security_cfg.get("encrypt_todos", True)))
-        self.sec_processes.setChecked(bool(security_cfg.get("encrypt_processes", True)))
-        self.sec_apps.setChecked(bool(security_cfg.get("encrypt_running_apps", True)))
         self.btn_security_migrate = QtWidgets.QPushButton("🔐 " + tr("Encrypt existing snapshots"))
         self.btn_security_migrate.clicked.connect(self.request_security_migration)
         sec_box = QtWidgets.QGroupBox("🔐 " + tr("Security Settings"))
@@ -383,10 +410,9 @@ class SettingsDialog(QtWidgets.QDialog):
         sec_layout.addWidget(self.sec_apps)
         sec_layout.addWidget(self.btn_security_migrate)
 
-        search_cfg = settings.get("search", {})
+        search_cfg = _merged_section(settings, "search", _SEARCH_DEFAULTS)
         self.search_enable_field_query = QtWidgets.QCheckBox("🔎 " + tr("Enable Field Query"))
-        self.search_enable_field_query.setChecked(bool(search_cfg.get("enable_field_query", True)))
-        self.search_saved_queries = QtWidgets.QLineEdit(", ".join(search_cfg.get("saved_queries", [])))
+        self.search_saved_queries = QtWidgets.QLineEdit(", ".join(search_cfg["saved_queries"]))
         self.search_saved_queries.setPlaceholderText(tr("Saved queries (comma-separated)"))
         search_box = QtWidgets.QGroupBox("🔎 " + tr("Search Settings"))
         search_layout = QtWidgets.QFormLayout(search_box)
@@ -395,33 +421,32 @@ class SettingsDialog(QtWidgets.QDialog):
         search_layout.addRow(tr("Saved Queries"), self.search_saved_queries)
 
         # Filters section
+        exclude_dirs_text = tr("Exclude dirs (comma-separated)")
+        include_text = tr("Include patterns for recent file scan")
+        exclude_text = tr("Exclude patterns for recent file scan")
+        keywords_text = tr("Process Keywords")
         self.exclude_dirs = QtWidgets.QLineEdit()
-        self.exclude_dirs.setPlaceholderText(tr("Exclude dirs (comma-separated)"))
-        self.exclude_dirs.setText(", ".join(settings.get("recent_files_exclude", [])))
-        self.exclude_dirs.setToolTip(tr("Exclude dirs (comma-separated)"))
+        self.exclude_dirs.setPlaceholderText(exclude_dirs_text)
+        self.exclude_dirs.setToolTip(exclude_dirs_text)
         
         self.include_patterns = QtWidgets.QLineEdit()
-        self.include_patterns.setPlaceholderText(tr("Include patterns for recent file scan"))
-        self.include_patterns.setText(", ".join(settings.get("recent_files_include", [])))
+        self.include_patterns.setPlaceholderText(include_text)
         self.exclude_patterns = QtWidgets.QLineEdit()
-        self.exclude_patterns.setPlaceholderText(tr("Exclude patterns for recent file scan"))
-        self.exclude_patterns.setText(", ".join(settings.get("recent_files_exclude_patterns", [])))
+        self.exclude_patterns.setPlaceholderText(exclude_text)
         
         self.process_keywords = QtWidgets.QLineEdit()
-        self.process_keywords.setPlaceholderText(tr("Process Keywords"))
-        self.process_keywords.setText(", ".join(settings.get("process_keywords", [])))
+        self.process_keywords.setPlaceholderText(keywords_text)
+        self._apply_csv_fields(settings)
 
         filter_box = QtWidgets.QGroupBox("🔍 " + tr("Filters"))
         filter_layout = QtWidgets.QFormLayout(filter_box)
         filter_layout.setSpacing(8)
-        filter_layout.addRow("🚫 " + tr("Exclude dirs (comma-separated)") + ":", self.exclude_dirs)
-        filter_layout.addRow("✅ " + tr("Include patterns for recent file scan") + ":", self.include_patterns)
-        filter_layout.addRow("❌ " + tr("Exclude patterns for recent file scan") + ":", self.exclude_patterns)
-        filter_layout.addRow("⚙️ " + tr("Process Keywords") + ":", self.process_keywords)
+        filter_layout.addRow("🚫 " + exclude_dirs_text + ":", self.exclude_dirs)
+        filter_layout.addRow("✅ " + include_text + ":", self.include_patterns)
+        filter_layout.addRow("❌ " + exclude_text + ":", self.exclude_patterns)
+        filter_layout.addRow("⚙️ " + keywords_text + ":", self.process_keywords)
         
-        privacy_hint = QtWidgets.QLabel("🔒 " + tr("Privacy Hint"))
-        privacy_hint.setObjectName("HintLabel")
-        privacy_hint.setWordWrap(True)
+        privacy_hint = _hint_label("🔒 " + privacy_text, wrap=True)
         
         # General layout with all boxes
         general_layout = QtWidgets.QVBoxLayout(general_content)
@@ -443,15 +468,183 @@ class SettingsDialog(QtWidgets.QDialog):
         
         # Wrap in scroll area
         general_page = _make_scrollable(general_content)
+        self._apply_fields(settings, _GENERAL_FIELDS)
+        self._track_changes(general_page)
+
+        # Only the General tab is built up front; the other tabs are built when first
+        # shown, or when values()/apply_settings_to_controls() need their widgets.
+        self.tabs.addTab(general_page, "⚙️ " + tr("General"))
+        self.tabs.addTab(QtWidgets.QWidget(), "🔄 " + tr("Restore"))
+        self.tabs.addTab(QtWidgets.QWidget(), "⌨️ " + tr("Global Hotkey"))
+        self.tabs.addTab(QtWidgets.QWidget(), "🏷️ " + tr("Tags"))
+        self.tabs.addTab(QtWidgets.QWidget(), "📋 " + tr("Template"))
+        self.tabs.addTab(QtWidgets.QWidget(), "💾 Backup")
+        self._tab_builders: List[Optional[Callable[[Dict[str, Any]], QtWidgets.QWidget]]] = [
+            None,
+            self._build_restore_page,
+            self._build_hotkey_page,
+            self._build_tags_page,
+            self._build_templates_page,
+            self._build_backup_page,
+        ]
+        self.tabs.currentChanged.connect(self._ensure_tab)
 
-        # === Tags tab ===
+        # Bottom buttons
+        self.err = QtWidgets.QLabel("")
+        self.err.setStyleSheet(_ERROR_STYLE)
+        self.err.setObjectName("ErrorLabel")
+        self.btn_ok = btn_ok = QtWidgets.QPushButton("✓ " + tr("Save"))
+        btn_ok.setProperty("primary", True)
+        self.btn_cancel = btn_cancel = QtWidgets.QPushButton(tr("Cancel"))
+        btn_ok.clicked.connect(self.validate_and_accept)
+        btn_cancel.clicked.connect(self.reject)
+        btn_row = QtWidgets.QHBoxLayout()
+        btn_row.setSpacing(10)
+        btn_row.addStretch(1)
+        btn_row.addWidget(btn_cancel)
+        btn_row.addWidget(btn_ok)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.addWidget(header)
+        layout.addWidget(sub)
+        layout.addSpacing(8)
+        layout.addWidget(self.tabs, 1)
+        layout.addWidget(self.err)
+        layout.addLayout(btn_row)
+
+    def _build_restore_page(self, settings: Dict[str, Any]) -> QtWidgets.QWidget:
+        """Restore tab: default restore options and restore profiles."""
+        self.rs_folder = QtWidgets.QCheckBox("📁 " + tr("Open folder on restore"))
+        self.rs_terminal = QtWidgets.QCheckBox("💻 " + tr("Open terminal on restore"))
+        self.rs_vscode = QtWidgets.QCheckBox("🔷 " + tr("Open VSCode on restore"))
+        self.rs_running_apps = QtWidgets.QCheckBox("📱 " + tr("Restore apps on restore"))
+        self.rs_checklist = QtWidgets.QCheckBox("✅ " + tr("Show post-restore checklist"))
+
+        self.preview_default = QtWidgets.QCheckBox("👁 " + tr("Show restore preview by default"))
+
+        restore_page = QtWidgets.QWidget()
+        restore_box = QtWidgets.QGroupBox("🔄 " + tr("Restore Defaults"))
+        restore_l = QtWidgets.QVBoxLayout(restore_box)
+        restore_l.setSpacing(8)
+        restore_l.addWidget(self.rs_folder)
+        restore_l.addWidget(self.rs_terminal)
+        restore_l.addWidget(self.rs_vscode)
+        restore_l.addWidget(self.rs_running_apps)
+        restore_l.addWidget(self.rs_checklist)
+        restore_l.addSpacing(12)
+        restore_l.addWidget(self.preview_default)
+
+        self.restore_profiles_list = QtWidgets.QListWidget()
+        self.restore_profiles_list.setSelectionMode(
+            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.restore_profiles_list.setMaximumHeight(120)
+        self.rp_name = QtWidgets.QLineEdit()
+        self.rp_name.setPlaceholderText(tr("Profile name"))
+        self.rp_default = QtWidgets.QCheckBox(tr("Default profile"))
+        self.rp_folder = QtWidgets.QCheckBox(tr("Open folder on restore"))
+        self.rp_terminal = QtWidgets.QCheckBox(tr("Open terminal on restore"))
+        self.rp_vscode = QtWidgets.QCheckBox(tr("Open VSCode on restore"))
+        self.rp_running_apps = QtWidgets.QCheckBox(tr("Restore apps on restore"))
+        self.rp_checklist = QtWidgets.QCheckBox(tr("Show post-restore checklist"))
+        self.rp_folder.setChecked(True)
+        self.rp_terminal.setChecked(True)
+        self.rp_vscode.setChecked(True)
+        self.rp_checklist.setChecked(True)
+        self.btn_rp_add = QtWidgets.QPushButton("💾 " + tr("Add / Update"))
+        self.btn_rp_add.setProperty("primary", True)
+        self.btn_rp_remove = QtWidgets.QPushButton("🗑 " + tr("Delete"))
+        self.btn_rp_remove.setProperty("danger", True)
+        self.btn_rp_add.clicked.connect(self.add_or_update_restore_profile)
+        self.btn_rp_remove.clicked.connect(self.remove_restore_profile)
+        self.restore_profiles_list.currentRowChanged.connect(self.load_restore_profile)
+        self._restore_profiles_cache: List[Dict[str, Any]] = []
+        self._load_restore_profiles(settings.get("restore_profiles", []))
+
+        rp_form = QtWidgets.QFormLayout()
+        rp_form.addRow("📝 " + tr("Name"), self.rp_name)
+        rp_form.addRow("", self.rp_default)
+        rp_form.addRow("", self.rp_folder)
+        rp_form.addRow("", self.rp_terminal)
+        rp_form.addRow("", self.rp_vscode)
+        rp_form.addRow("", self.rp_running_apps)
+        rp_form.addRow("", self.rp_checklist)
+
+        rp_btns = QtWidgets.QHBoxLayout()
+        rp_btns.setSpacing(8)
+        rp_btns.addWidget(self.btn_rp_add)
+        rp_btns.addWidget(self.btn_rp_remove)
+        rp_btns.addStretch(1)
+
+        rp_box = QtWidgets.QGroupBox("🧩 " + tr("Restore Profiles"))
+        rp_box_l = QtWidgets.QVBoxLayout(rp_box)
+        rp_box_l.addWidget(self.restore_profiles_list)
+        rp_box_l.addLayout(rp_form)
+        rp_box_l.addLayout(rp_btns)
+
+        restore_hint = _hint_label("💡 " + tr("Restore Preview Hint"), wrap=True)
+        restore_layout = QtWidgets.QVBoxLayout(restore_page)
+        restore_layout.setSpacing(12)
+        restore_layout.setContentsMargins(16, 16, 16, 16)
+        restore_layout.addWidget(restore_box)
+        restore_layout.addWidget(rp_box)
+        restore_layout.addWidget(restore_hint)
+        restore_layout.addStretch(1)
+        self._apply_fields(settings, _RESTORE_FIELDS)
+        return restore_page
+
+    def _build_hotkey_page(self, settings: Dict[str, Any]) -> QtWidgets.QWidget:
+        """Global hotkey tab."""
+        hk = _merged_section(settings, "hotkey", _HOTKEY_DEFAULTS)
+        self.hk_enabled = QtWidgets.QCheckBox("✓ " + tr("Enable Hotkey"))
+        self.hk_ctrl = QtWidgets.QCheckBox("Ctrl")
+        self.hk_alt = QtWidgets.QCheckBox("Alt")
+        self.hk_shift = QtWidgets.QCheckBox("Shift")
+        self.hk_key = NoScrollComboBox()
+        self.hk_key.addItems([chr(i) for i in range(ord("A"), ord("Z") + 1)])
+        vk = str(hk["vk"]).upper()
+        idx = self.hk_key.findText(vk)
+        if idx >= 0:
+            self.hk_key.setCurrentIndex(idx)
+
+        hk_row = QtWidgets.QHBoxLayout()
+        hk_row.setSpacing(12)
+        hk_row.addWidget(self.hk_ctrl)
+        hk_row.addWidget(self.hk_alt)
+        hk_row.addWidget(self.hk_shift)
+        hk_row.addStretch(1)
+        hk_row.addWidget(QtWidgets.QLabel("🔤 Key"))
+        hk_row.addWidget(self.hk_key)
+
+        hotkey_page = QtWidgets.QWidget()
+        hk_box = QtWidgets.QGroupBox("⌨️ " + tr("Global Hotkey"))
+        hk_box_l = QtWidgets.QVBoxLayout(hk_box)
+        hk_box_l.setSpacing(10)
+        hk_box_l.addWidget(self.hk_enabled)
+        hk_box_l.addLayout(hk_row)
+        hk_hint = _hint_label("💡 " + tr("Hotkey Hint"), wrap=True)
+        hk_layout = QtWidgets.QVBoxLayout(hotkey_page)
+        hk_layout.setSpacing(12)
+        hk_layout.setContentsMargins(16, 16, 16, 16)
+        hk_layout.addWidget(hk_box)
+        hk_layout.addWidget(hk_hint)
+        hk_layout.addStretch(1)
+        self._apply_fields(settings, _HOTKEY_FIELDS)
+        return hotkey_page
+
+    def _build_tags_page(self, settings: Dict[str, Any]) -> QtWidgets.QWidget:
+        """Tag management tab."""
         tags_content = QtWidgets.QWidget()
         self.tags_list = QtWidgets.QListWidget()
         self.tags_list.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
-        for t in (settings.get("tags") or DEFAULT_TAGS):
-            self.tags_list.addItem(t)
+        self.tags_list.setUniformItemSizes(True)
+        # Mirrors tags_list for O(1) duplicate checks
+        self._tags_set: Set[str] = set()
+        self._fill_tags(settings.get("tags") or DEFAULT_TAGS)
         self.tag_input = QtWidgets.QLineEdit()
         self.tag_input.setPlaceholderText(tr("Add tag placeholder"))
         
@@ -473,9 +666,7 @@ class SettingsDialog(QtWidgets.QDialog):
         tags_l.setSpacing(10)
         tags_l.addWidget(self.tags_list)
         tags_l.addLayout(tag_row)
-        tags_hint = QtWidgets.QLabel("💡 " + tr("Tags Hint"))
-        tags_hint.setObjectName("HintLabel")
-        tags_hint.setWordWrap(True)
+        tags_hint = _hint_label("💡 " + tr("Tags Hint"), wrap=True)
         tags_layout = QtWidgets.QVBoxLayout(tags_content)
         tags_layout.setSpacing(12)
         tags_layout.setContentsMargins(16, 16, 16, 16)
@@ -484,14 +675,17 @@ class SettingsDialog(QtWidgets.QDialog):
         tags_layout.addStretch(1)
         
         tags_page = _make_scrollable(tags_content)
+        return tags_page
 
-        # === Templates tab ===
+    def _build_templates_page(self, settings: Dict[str, Any]) -> QtWidgets.QWidget:
+        """Template editor tab."""
         templates_content = QtWidgets.QWidget()
         self.templates_list = QtWidgets.QListWidget()
         self.templates_list.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
         )
         self.templates_list.setMaximumHeight(150)
+        self.templates_list.setUniformItemSizes(True)
         self.template_name = QtWidgets.QLineEdit()
         self.template_name.setPlaceholderText(tr("Title placeholder"))
         self.template_note = QtWidgets.QTextEdit()
@@ -513,14 +707,16 @@ class SettingsDialog(QtWidgets.QDialog):
         self.btn_template_remove.clicked.connect(self.remove_template)
         self.templates_list.currentRowChanged.connect(self.load_template_to_form)
 
-        template_form = QtWidgets.QFormLayout()
+        # One grid with explicit labels instead of QFormLayout rows.
+        template_form = QtWidgets.QGridLayout()
         template_form.setSpacing(8)
-        template_form.addRow("📝 Name", self.template_name)
-        template_form.addRow("📄 Note", self.template_note)
-        template_form.addRow("1️⃣ TODO 1", self.template_todo1)
-        template_form.addRow("2️⃣ TODO 2", self.template_todo2)
-        template_form.addRow("3️⃣ TODO 3", self.template_todo3)
-        template_form.addRow("🏷️ Tags", self.template_tags)
+        template_form.setColumnStretch(1, 1)
+        for row, (text, attr) in enumerate(_TEMPLATE_FORM_ROWS):
+            field = getattr(self, attr)
+            label = QtWidgets.QLabel(text)
+            label.setBuddy(field)
+            template_form.addWidget(label, row, 0)
+            template_form.addWidget(field, row, 1)
 
         template_btns = QtWidgets.QHBoxLayout()
         template_btns.setSpacing(8)
@@ -545,14 +741,13 @@ class SettingsDialog(QtWidgets.QDialog):
         self._load_templates(settings.get("templates", []))
         
         templates_page = _make_scrollable(templates_content)
+        return templates_page
 
-        # === Backup tab ===
+    def _build_backup_page(self, settings: Dict[str, Any]) -> QtWidgets.QWidget:
+        """Backup export/import tab."""
         backup_content = QtWidgets.QWidget()
-        b_title = QtWidgets.QLabel("💾 " + tr("Backup / Restore")) 
-        b_title.setObjectName("TitleLabel")
-        b_hint = QtWidgets.QLabel("💡 " + tr("Backup Hint"))
-        b_hint.setObjectName("HintLabel")
-        b_hint.setWordWrap(True)
+        b_title = _title_label("💾 " + tr("Backup / Restore"))
+        b_hint = _hint_label("💡 " + tr("Backup Hint"), wrap=True)
 
         # export options
         self.exp_settings = QtWidgets.QCheckBox("⚙️ " + tr("Include settings"))
@@ -589,9 +784,12 @@ class SettingsDialog(QtWidgets.QDialog):
         b_row.addStretch(1)
         b_row.addWidget(self.btn_reset)
 
-        self.b_msg = QtWidgets.QLabel("")
-        self.b_msg.setObjectName("HintLabel")
-        self.b_msg.setWordWrap(True)
+        self.b_msg = _hint_label("", wrap=True)
+        # Shown in place of b_msg while an export/import runs in the background.
+        self.b_progress = QtWidgets.QProgressBar()
+        self.b_progress.setRange(0, 0)
+        self.b_progress.setTextVisible(False)
+        self.b_progress.hide()
 
         b_layout = QtWidgets.QVBoxLayout(backup_content)
         b_layout.setSpacing(12)
@@ -604,106 +802,202 @@ class SettingsDialog(QtWidgets.QDialog):
         b_layout.addLayout(b_row)
         b_layout.addSpacing(10)
         b_layout.addWidget(self.b_msg)
+        b_layout.addWidget(self.b_progress)
         b_layout.addStretch(1)
         
         backup_page = _make_scrollable(backup_content)
+        return backup_page
 
-        # Add tabs with emojis
-        tabs.addTab(general_page, "⚙️ " + tr("General"))
-        tabs.addTab(restore_page, "🔄 " + tr("Restore"))
-        tabs.addTab(hotkey_page, "⌨️ " + tr("Global Hotkey"))
-        tabs.addTab(tags_page, "🏷️ " + tr("Tags"))
-        tabs.addTab(templates_page, "📋 " + tr("Template"))
-        tabs.addTab(backup_page, "💾 Backup")
-
-        # Bottom buttons
-        self.err = QtWidgets.QLabel("")
-        self.err.setStyleSheet("color: #ef4444; font-weight: 500;")
-        self.err.setObjectName("ErrorLabel")
-        btn_ok = QtWidgets.QPushButton("✓ " + tr("Save"))
-        btn_ok.setProperty("primary", True)
-        btn_cancel = QtWidgets.QPushButton(tr("Cancel"))
-        btn_ok.clicked.connect(self.validate_and_accept)
-        btn_cancel.clicked.connect(self.reject)
-        btn_row = QtWidgets.QHBoxLayout()
-        btn_row.setSpacing(10)
-        btn_row.addStretch(1)
-        btn_row.addWidget(btn_cancel)
-        btn_row.addWidget(btn_ok)
+    def _ensure_tab(self, index: int) -> None:
+        """Build a lazy tab from the current settings and swap it in for its placeholder."""
+        if index < 0 or index >= len(self._tab_builders):
+            return
+        builder = self._tab_builders[index]
+        if builder is None:
+            return
+        self._tab_builders[index] = None
+        page = builder(self._settings)
+        self._track_changes(page)
+        self._bump_rev()
+        placeholder = self.tabs.widget(index)
+        title = self.tabs.tabText(index)
+        current = self.tabs.currentIndex()
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, page, title)
+            self.tabs.setCurrentIndex(current)
+        finally:
+            self.tabs.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
+    def _track_changes(self, page: QtWidgets.QWidget) -> None:
+        """Invalidate the values() cache whenever an input control on ``page`` changes."""
+        bump = self._bump_rev
+        for box in page.findChildren(QtWidgets.QCheckBox):
+            box.toggled.connect(bump)
+        for spin in page.findChildren(QtWidgets.QSpinBox) + page.findChildren(QtWidgets.QDoubleSpinBox):
+            spin.valueChanged.connect(bump)
+        for edit in page.findChildren(QtWidgets.QLineEdit):
+            edit.textChanged.connect(bump)
+        for combo in page.findChildren(QtWidgets.QComboBox):
+            combo.currentIndexChanged.connect(bump)
+        for lst in page.findChildren(QtWidgets.QListWidget):
+            # Model signals still fire while the list widget itself has signals blocked.
+            model = lst.model()
+            model.rowsInserted.connect(bump)
+            model.rowsRemoved.connect(bump)
+            model.dataChanged.connect(bump)
+            model.modelReset.connect(bump)
+
+    def _bump_rev(self, *_args: Any) -> None:
+        self._values_rev += 1
+        self._values_cache = None
+
+    def _apply_fields(self, settings: Dict[str, Any], fields: Tuple[_FieldSpec, ...]) -> None:
+        sections: Dict[Optional[str], Dict[str, Any]] = {}
+        for attr, section, key, coerce in fields:
+            src = sections.get(section)
+            if src is None:
+                if section is None:
+                    src = {**_TOP_LEVEL_DEFAULTS, **settings}
+                else:
+                    src = _merged_section(settings, section, _SECTION_DEFAULTS[section])
+                sections[section] = src
+            value = src[key]
+            # Values decoded from JSON already have the right type; only coerce strays.
+            if type(value) is not coerce:
+                value = coerce(value)
+            widget = getattr(self, attr)
+            (widget.setChecked if coerce is bool else widget.setValue)(value)
+
+    def _apply_csv_fields(self, settings: Dict[str, Any]) -> None:
+        for attr, key in _CSV_FIELDS:
+            value = settings.get(key, [])
+            text = value if isinstance(value, str) else ", ".join(value)
+            edit = getattr(self, attr)
+            if edit.text() != text:
+                edit.setText(text)
+
+    @contextlib.contextmanager
+    def _frozen(self) -> Iterator[None]:
+        """Block control signals and repaints while many values are set at once."""
+        controls = [getattr(self, attr) for attr in _FROZEN_CONTROLS]
+        previous = [control.blockSignals(True) for control in controls]
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for control, was_blocked in zip(controls, previous):
+                control.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
 
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setSpacing(12)
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.addWidget(header)
-        layout.addWidget(sub)
-        layout.addSpacing(8)
-        layout.addWidget(tabs, 1)
-        layout.addWidget(self.err)
-        layout.addLayout(btn_row)
+    def _ensure_all_tabs(self) -> None:
+        for index in range(len(self._tab_builders)):
+            self._ensure_tab(index)
 
     def export_settings(self):
         default_name = f"{APP_NAME}_backup_{datetime.now().strftime('%Y%m%d')}.json"
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Export backup", str(Path.home() / default_name), "JSON files (*.json)"
+            self, "Export backup", str(Path.home() / default_name), _JSON_FILTER
         )
         if not path:
             return
+        self._export_to(path)
+
+    def _export_to(self, path: str) -> None:
         try:
             # Always export migrated settings; include data optionally
             merged = dict(self._settings)
             merged.update(self.values())
             merged["onboarding_shown"] = True
             vals = migrate_settings(merged)
-            export_backup_to_file(
-                Path(path),
-                settings=vals,
-                snaps_dir=self._snaps_dir,
-                index_path=self._index_path,
-                include_snapshots=bool(self.exp_snaps.isChecked()),
-                include_index=bool(self.exp_index.isChecked()),
-                encrypt_backup=bool(self.exp_encrypt_backup.isChecked()),
-            )
-            self.b_msg.setText(f"✅ {tr('Exported')}{path}")
         except Exception as e:
             log_exc("export backup", e)
             QtWidgets.QMessageBox.warning(self, "Export failed", str(e))
+            return
+        # Widgets are read here; reading snapshots and writing the file run on the pool.
+        export = functools.partial(
+            export_backup_to_file,
+            Path(path),
+            settings=vals,
+            snaps_dir=self._snaps_dir,
+            index_path=self._index_path,
+            include_snapshots=self.exp_snaps.isChecked(),
+            include_index=self.exp_index.isChecked(),
+            encrypt_backup=self.exp_encrypt_backup.isChecked(),
+        )
+        self._start_backup_job("export", path, export)
 
     def import_settings(self):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Import backup", str(Path.home()), "JSON files (*.json)"
+            self, "Import backup", str(Path.home()), _JSON_FILTER
         )
         if not path:
             return
-        try:
-            payload = import_backup_from_file(Path(path))
-            self._imported_payload = payload
-            new_settings = payload.get("settings", {})
-            self.apply_settings_to_controls(new_settings, reset_import_state=False)
-
-            msg = QtWidgets.QMessageBox(self)
-            msg.setWindowTitle(tr("Import Dialog Title"))
-            msg.setText(tr("Import Params"))
-            msg.setInformativeText(tr("Import Info"))
-            btn_apply = msg.addButton(
-                "✓ " + tr("Apply now"),
-                QtWidgets.QMessageBox.ButtonRole.AcceptRole,
-            )
-            btn_keep = msg.addButton(
-                tr("Keep in dialog"),
-                QtWidgets.QMessageBox.ButtonRole.RejectRole,
-            )
-            msg.exec()
-            self._import_apply_now = (msg.clickedButton() == btn_apply)
-
-            if self._import_apply_now:
-                self.settingsImported.emit(payload)
-                self.b_msg.setText(f"✅ {tr('Imported+Applied')}{path}")
+        self._start_backup_job("import", path, lambda: import_backup_from_file(Path(path)))
+
+    def _start_backup_job(self, kind: str, path: str, fn: Callable[[], Any]) -> None:
+        job = _BackupJob(kind, path, fn)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(self._on_backup_finished)
+        self._backup_job = job
+        self._set_backup_busy(True)
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _set_backup_busy(self, busy: bool) -> None:
+        self._backup_busy = busy
+        for button in (self.btn_export, self.btn_import, self.btn_reset, self.btn_ok, self.btn_cancel):
+            button.setEnabled(not busy)
+        self.b_progress.setVisible(busy)
+        self.b_msg.setVisible(not busy)
+
+    def _on_backup_finished(self, kind: str, path: str, result: Any, error: str) -> None:
+        self._backup_job = None
+        self._set_backup_busy(False)
+        if kind == "export":
+            if error:
+                QtWidgets.QMessageBox.warning(self, "Export failed", error)
             else:
-                self.b_msg.setText(f"📋 {tr('Imported into dialog')}{path}")
+                self.b_msg.setText(f"✅ {tr('Exported')}{path}")
+            return
+        if error:
+            QtWidgets.QMessageBox.warning(self, "Import failed", error)
+            return
+        try:
+            self._apply_imported_payload(path, result)
         except Exception as e:
             log_exc("import backup", e)
             QtWidgets.QMessageBox.warning(self, "Import failed", str(e))
 
+    def _apply_imported_payload(self, path: str, payload: Dict[str, Any]) -> None:
+        self._imported_payload = payload
+        # import_backup_from_file() already returns migrated settings
+        new_settings = payload.get("settings", {})
+        self.apply_settings_to_controls(new_settings, reset_import_state=False, migrated=True)
+
+        msg = QtWidgets.QMessageBox(self)
+        msg.setWindowTitle(tr("Import Dialog Title"))
+        msg.setText(tr("Import Params"))
+        msg.setInformativeText(tr("Import Info"))
+        btn_apply = msg.addButton(
+            "✓ " + tr("Apply now"),
+            QtWidgets.QMessageBox.ButtonRole.AcceptRole,
+        )
+        btn_keep = msg.addButton(
+            tr("Keep in dialog"),
+            QtWidgets.QMessageBox.ButtonRole.RejectRole,
+        )
+        msg.exec()
+        self._import_apply_now = (msg.clickedButton() == btn_apply)
+
+        if self._import_apply_now:
+            self.settingsImported.emit(payload)
+            self.b_msg.setText(f"✅ {tr('Imported+Applied')}{path}")
+        else:
+            self.b_msg.setText(f"📋 {tr('Imported into dialog')}{path}")
+
     def reset_defaults(self):
         new_settings = migrate_settings(
             {
@@ -713,7 +1007,7 @@ class SettingsDialog(QtWidgets.QDialog):
         )
         # Keep onboarding shown; reset is for behavior not education
         new_settings["onboarding_shown"] = True
-        self.apply_settings_to_controls(new_settings)
+        self.apply_settings_to_controls(new_settings, migrated=True)
         self.b_msg.setText("✅ " + tr("Reset to defaults done"))
 
     def request_security_migration(self) -> None:
@@ -744,123 +1038,114 @@ class SettingsDialog(QtWidgets.QDialog):
         if path:
             self.default_root_edit.setText(path)
 
-    def apply_settings_to_controls(self, settings: Dict[str, Any], *, reset_import_state: bool = True) -> None:
-        """Apply a settings dict to UI controls (does not save to disk here)."""
-        settings = migrate_settings(settings)
+    def apply_settings_to_controls(
+        self,
+        settings: Dict[str, Any],
+        *,
+        reset_import_state: bool = True,
+        migrated: bool = False,
+    ) -> None:
+        """Apply a settings dict to UI controls (does not save to disk here).
+
+        Pass ``migrated=True`` when the dict already came out of migrate_settings()
+        to skip running the backfill a second time.
+        """
+        if not migrated:
+            settings = migrate_settings(settings)
         self._settings = settings
         if reset_import_state:
             self._imported_payload = None
             self._import_apply_now = False
+        self._ensure_all_tabs()
 
-        # Apply Language
-        lang = settings.get("language", "auto")
-        idx = self.lang_combo.findData(lang)
-        if idx >= 0:
-            self.lang_combo.setCurrentIndex(idx)
-        else:
-            self.lang_combo.setCurrentIndex(0) # Default to auto if unknown
-
-        self.default_root_edit.setText(str(settings.get("default_root", str(Path.home()))))
-
-        hk = settings.get("hotkey", {})
-        self.hk_enabled.setChecked(bool(hk.get("enabled", True)))
-        self.hk_ctrl.setChecked(bool(hk.get("ctrl", True)))
-        self.hk_alt.setChecked(bool(hk.get("alt", True)))
-        self.hk_shift.setChecked(bool(hk.get("shift", False)))
-        vk = str(hk.get("vk", "S")).upper()
-        idx = self.hk_key.findText(vk)
-        if idx >= 0:
-            self.hk_key.setCurrentIndex(idx)
-
-        restore = settings.get("restore", {})
-        self.rs_folder.setChecked(bool(restore.get("open_folder", True)))
-        self.rs_terminal.setChecked(bool(restore.get("open_terminal", True)))
-        self.rs_vscode.setChecked(bool(restore.get("open_vscode", True)))
-        self.rs_running_apps.setChecked(bool(restore.get("open_running_apps", False)))
-        self.rs_checklist.setChecked(bool(restore.get("show_post_restore_checklist", True)))
-        self.preview_default.setChecked(bool(settings.get("restore_preview_default", True)))
-
-        self.recent_spin.setValue(int(settings.get("recent_files_limit", 30)))
-        self.scan_limit_spin.setValue(int(settings.get("recent_files_scan_limit", 20000)))
-        self.scan_seconds_spin.setValue(float(settings.get("recent_files_scan_seconds", 2.0)))
-        self.background_recent.setChecked(bool(settings.get("recent_files_background", False)))
-        self.page_size_spin.setValue(int(settings.get("list_page_size", 200)))
-        self.auto_snapshot_minutes.setValue(int(settings.get("auto_snapshot_minutes", 0)))
-        self.auto_snapshot_on_git.setChecked(bool(settings.get("auto_snapshot_on_git_change", False)))
-        capture = settings.get("capture", {})
-        self.capture_recent.setChecked(bool(capture.get("recent_files", True)))
-        self.capture_processes.setChecked(bool(capture.get("processes", True)))
-        self.capture_running_apps.setChecked(bool(capture.get("running_apps", True)))
-        self.capture_note.setChecked(bool(settings.get("capture_note", True)))
-        self.capture_todos.setChecked(bool(settings.get("capture_todos", True)))
-        self.capture_enforce_todos.setChecked(bool(settings.get("capture_enforce_todos", True)))
-        self.exclude_dirs.setText(", ".join(settings.get("recent_files_exclude", [])))
-        self.include_patterns.setText(", ".join(settings.get("recent_files_include", [])))
-        self.exclude_patterns.setText(", ".join(settings.get("recent_files_exclude_patterns", [])))
-        self.process_keywords.setText(", ".join(settings.get("process_keywords", [])))
-        self.archive_after_days.setValue(int(settings.get("archive_after_days", 0)))
-        self.archive_skip_pinned.setChecked(bool(settings.get("archive_skip_pinned", True)))
-        self.auto_backup_hours.setValue(int(settings.get("auto_backup_hours", 0)))
-        dev_flags = settings.get("dev_flags", {})
-        self.flag_sync_enabled.setChecked(bool(dev_flags.get("sync_enabled", False)))
-        self.flag_security_enabled.setChecked(bool(dev_flags.get("security_enabled", False)))
-        self.flag_adv_search_enabled.setChecked(bool(dev_flags.get("advanced_search_enabled", False)))
-        self.flag_restore_profiles_enabled.setChecked(bool(dev_flags.get("restore_profiles_enabled", False)))
-        sync_cfg = settings.get("sync", {})
-        idx_sync = self.sync_provider.findData(str(sync_cfg.get("provider", "local")))
-        if idx_sync >= 0:
-            self.sync_provider.setCurrentIndex(idx_sync)
-        self.sync_local_root.setText(str(sync_cfg.get("local_root", str(Path.home() / "ctxsnap_sync"))))
-        self.sync_interval_minutes.setValue(int(sync_cfg.get("auto_interval_min", 0)))
-        sec_cfg = settings.get("security", {})
-        self.dpapi_enabled.setChecked(bool(sec_cfg.get("dpapi_enabled", False)))
-        self.sec_note.setChecked(bool(sec_cfg.get("encrypt_note", True)))
-        self.sec_todos.setChecked(bool(sec_cfg.get("encrypt_todos", True)))
-        self.sec_processes.setChecked(bool(sec_cfg.get("encrypt_processes", True)))
-        self.sec_apps.setChecked(bool(sec_cfg.get("encrypt_running_apps", True)))
-        search_cfg = settings.get("search", {})
-        self.search_enable_field_query.setChecked(bool(search_cfg.get("enable_field_query", True)))
-        self.search_saved_queries.setText(", ".join(search_cfg.get("saved_queries", [])))
-        self._load_restore_profiles(settings.get("restore_profiles", []))
+        with self._frozen():
+            self._apply_fields(settings, _ALL_FIELDS)
 
+            # Apply Language
+            lang = settings.get("language", "auto")
+            idx = self.lang_combo.findData(lang)
+            if idx >= 0:
+                self.lang_combo.setCurrentIndex(idx)
+            else:
+                self.lang_combo.setCurrentIndex(0) # Default to auto if unknown
+
+            self.default_root_edit.setText(str(settings.get("default_root", str(Path.home()))))
+
+            hk = _merged_section(settings, "hotkey", _HOTKEY_DEFAULTS)
+            vk = str(hk["vk"]).upper()
+            idx = self.hk_key.findText(vk)
+            if idx >= 0:
+                self.hk_key.setCurrentIndex(idx)
+
+            self._apply_csv_fields(settings)
+            sync_cfg = settings.get("sync", {})
+            idx_sync = self.sync_provider.findData(str(sync_cfg.get("provider", "local")))
+            if idx_sync >= 0:
+                self.sync_provider.setCurrentIndex(idx_sync)
+            self.sync_local_root.setText(str(sync_cfg.get("local_root", str(Path.home() / "ctxsnap_sync"))))
+            self.sync_interval_minutes.setValue(int(sync_cfg.get("auto_interval_min", 0)))
+            search_cfg = _merged_section(settings, "search", _SEARCH_DEFAULTS)
+            self.search_saved_queries.setText(", ".join(search_cfg["saved_queries"]))
+            self._load_restore_profiles(settings.get("restore_profiles", []))
+
+            self._fill_tags(settings.get("tags") or DEFAULT_TAGS)
+            self._load_templates(settings.get("templates", []))
+        # Control signals were blocked above, so invalidate the values() cache explicitly.
+        self._bump_rev()
+
+    def _fill_tags(self, tags: List[str]) -> None:
+        # Insert in one batch so the list is not relaid out per item.
+        tags = list(tags)
+        self._tags_set = set(tags)
+        self.tags_list.setUpdatesEnabled(False)
         self.tags_list.clear()
-        for t in (settings.get("tags") or DEFAULT_TAGS):
-            self.tags_list.addItem(t)
-        self._load_templates(settings.get("templates", []))
+        self.tags_list.addItems(tags)
+        self.tags_list.setUpdatesEnabled(True)
 
     def add_tag(self):
         t = self.tag_input.text().strip()
         if not t:
             return
-        for i in range(self.tags_list.count()):
-            if self.tags_list.item(i).text() == t:
-                self.tag_input.clear()
-                return
+        if t in self._tags_set:
+            self.tag_input.clear()
+            return
         self.tags_list.addItem(t)
+        self._tags_set.add(t)
         self.tag_input.clear()
 
     def remove_tag(self):
         row = self.tags_list.currentRow()
         if row >= 0:
-            self.tags_list.takeItem(row)
+            item = self.tags_list.takeItem(row)
+            if item is not None:
+                self._tags_set.discard(item.text())
 
     def _load_templates(self, templates: List[Dict[str, Any]]) -> None:
         self._templates_cache = templates or []
+        names = [str(tmpl.get("name", "")).strip() or "Untitled" for tmpl in self._templates_cache]
+        # clear() would emit currentRowChanged(-1) before the form is reset below
+        blocker = QtCore.QSignalBlocker(self.templates_list)
+        self.templates_list.setUpdatesEnabled(False)
         self.templates_list.clear()
-        for tmpl in self._templates_cache:
-            name = str(tmpl.get("name", "")).strip() or "Untitled"
-            self.templates_list.addItem(name)
+        self.templates_list.addItems(names)
+        self.templates_list.setUpdatesEnabled(True)
+        blocker.unblock()
         self.template_name.clear()
         self.template_note.clear()
         self.template_todo1.clear()
         self.template_todo2.clear()
         self.template_todo3.clear()
         self.template_tags.clear()
+        self._loaded_template_row = -1
+        self._loaded_template_snapshot = None
 
     def load_template_to_form(self, row: int) -> None:
         if row < 0 or row >= len(self._templates_cache):
             return
         tmpl = self._templates_cache[row]
+        # The form already shows this exact template; skip rewriting six widgets.
+        if row == self._loaded_template_row and tmpl == self._loaded_template_snapshot:
+            return
         self.template_name.setText(str(tmpl.get("name", "")))
         self.template_note.setText(str(tmpl.get("note", "")))
         todos = tmpl.get("todos", []) or []
@@ -868,6 +1153,8 @@ class SettingsDialog(QtWidgets.QDialog):
         self.template_todo2.setText(str(todos[1]) if len(todos) > 1 else "")
         self.template_todo3.setText(str(todos[2]) if len(todos) > 2 else "")
         self.template_tags.setText(", ".join(tmpl.get("tags", []) or []))
+        self._loaded_template_row = row
+        self._loaded_template_snapshot = tmpl
 
     def add_or_update_template(self) -> None:
         name = self.template_name.text().strip() or "Untitled"
@@ -879,7 +1166,7 @@ class SettingsDialog(QtWidgets.QDialog):
                 self.template_todo2.text().strip(),
                 self.template_todo3.text().strip(),
             ],
-            "tags": [t.strip() for t in self.template_tags.text().split(",") if t.strip()],
+            "tags": self._csv(self.template_tags.text()),
         }
         row = self.templates_list.currentRow()
         if row >= 0 and row < len(self._templates_cache):
@@ -888,7 +1175,13 @@ class SettingsDialog(QtWidgets.QDialog):
         else:
             self._templates_cache.append(tmpl)
             self.templates_list.addItem(name)
-            self.templates_list.setCurrentRow(len(self._templates_cache) - 1)
+            # The form already shows this template; don't let currentRowChanged reload it.
+            row = len(self._templates_cache) - 1
+            blocker = QtCore.QSignalBlocker(self.templates_list)
+            self.templates_list.setCurrentRow(row)
+            blocker.unblock()
+        self._loaded_template_row = row
+        self._loaded_template_snapshot = tmpl
 
     def remove_template(self) -> None:
         row = self.templates_list.currentRow()
@@ -899,9 +1192,12 @@ class SettingsDialog(QtWidgets.QDialog):
 
     def _load_restore_profiles(self, profiles: List[Dict[str, Any]]) -> None:
         self._restore_profiles_cache = [p for p in (profiles or []) if isinstance(p, dict)]
+        self.restore_profiles_list.blockSignals(True)
         self.restore_profiles_list.clear()
-        for profile in self._restore_profiles_cache:
-            self.restore_profiles_list.addItem(str(profile.get("name", "Default")))
+        self.restore_profiles_list.addItems(
+            [str(profile.get("name", "Default")) for profile in self._restore_profiles_cache]
+        )
+        self.restore_profiles_list.blockSignals(False)
         self.rp_name.clear()
         self.rp_default.setChecked(False)
         self.rp_folder.setChecked(True)
@@ -962,100 +1258,122 @@ class SettingsDialog(QtWidgets.QDialog):
     def import_apply_now(self) -> bool:
         return bool(self._import_apply_now)
 
+    def reject(self) -> None:
+        # Cancel, Esc and the close button wait for a running export/import so its result is not lost.
+        if self._backup_busy:
+            return
+        super().reject()
+
     def validate_and_accept(self):
+        if self._backup_busy:
+            return
+        self._ensure_all_tabs()
         # Ensure at least one modifier is chosen when enabled
-        if self.hk_enabled.isChecked():
-            if not (self.hk_ctrl.isChecked() or self.hk_alt.isChecked() or self.hk_shift.isChecked()):
-                self.err.setText("⚠️ " + tr("Hotkey selection err"))
-                return
+        if self.hk_enabled.isChecked() and not (
+            self.hk_ctrl.isChecked() or self.hk_alt.isChecked() or self.hk_shift.isChecked()
+        ):
+            self._set_error("⚠️ " + tr("Hotkey selection err"))
+            return
         default_root = self.default_root_edit.text().strip()
-        if default_root and (not Path(default_root).exists() or not Path(default_root).is_dir()):
-            self.err.setText(tr("Root invalid"))
+        if default_root and not Path(default_root).is_dir():
+            self._set_error(tr("Root invalid"))
             return
         self.accept()
 
+    def _set_error(self, text: str) -> None:
+        # Repeated Save clicks with the same problem should not relayout the label.
+        if self.err.text() != text:
+            self.err.setText(text)
+
+    @staticmethod
+    def _csv(text: str, _strip=str.strip) -> List[str]:
+        """Split a comma-separated field into stripped, non-empty parts."""
+        return [part for part in map(_strip, text.split(",")) if part]
+
     def values(self) -> Dict[str, Any]:
+        self._ensure_all_tabs()
+        cached = self._values_cache
+        if cached is None or cached[0] != self._values_rev:
+            cached = self._values_cache = (self._values_rev, self._collect_values())
+        # Copy the section dicts too: callers such as migrate_settings() mutate them.
+        return {key: (value.copy() if type(value) is dict else value) for key, value in cached[1].items()}
+
+    def _collect_values(self) -> Dict[str, Any]:
         tags: List[str] = []
+        tags_item = self.tags_list.item
         for i in range(self.tags_list.count()):
-            t = self.tags_list.item(i).text().strip()
+            t = tags_item(i).text().strip()
             if t:
                 tags.append(t)
-        saved_queries = [part.strip() for part in self.search_saved_queries.text().split(",") if part.strip()]
+        csv = self._csv
+        saved_queries = csv(self.search_saved_queries.text())
         return {
             "schema_version": 2,
             "language": self.lang_combo.currentData(),
             "default_root": self.default_root_edit.text().strip() or str(Path.home()),
-            "recent_files_limit": int(self.recent_spin.value()),
-            "restore_preview_default": bool(self.preview_default.isChecked()),
+            "recent_files_limit": self.recent_spin.value(),
+            "restore_preview_default": self.preview_default.isChecked(),
             "tags": tags or default_tags_for_language(self.lang_combo.currentData()),
             "hotkey": {
-                "enabled": bool(self.hk_enabled.isChecked()),
-                "ctrl": bool(self.hk_ctrl.isChecked()),
-                "alt": bool(self.hk_alt.isChecked()),
-                "shift": bool(self.hk_shift.isChecked()),
-                "vk": str(self.hk_key.currentText()),
+                "enabled": self.hk_enabled.isChecked(),
+                "ctrl": self.hk_ctrl.isChecked(),
+                "alt": self.hk_alt.isChecked(),
+                "shift": self.hk_shift.isChecked(),
+                "vk": self.hk_key.currentText(),
             },
             "capture": {
-                "recent_files": bool(self.capture_recent.isChecked()),
-                "processes": bool(self.capture_processes.isChecked()),
-                "running_apps": bool(self.capture_running_apps.isChecked()),
+                "recent_files": self.capture_recent.isChecked(),
+                "processes": self.capture_processes.isChecked(),
+                "running_apps": self.capture_running_apps.isChecked(),
             },
-            "capture_note": bool(self.capture_note.isChecked()),
-            "capture_todos": bool(self.capture_todos.isChecked()),
-            "capture_enforce_todos": bool(self.capture_enforce_todos.isChecked()),
-            "recent_files_scan_limit": int(self.scan_limit_spin.value()),
-            "recent_files_scan_seconds": float(self.scan_seconds_spin.value()),
-            "recent_files_background": bool(self.background_recent.isChecked()),
-            "list_page_size": int(self.page_size_spin.value()),
-            "recent_files_include": [
-                part.strip() for part in self.include_patterns.text().split(",") if part.strip()
-            ],
-            "recent_files_exclude_patterns": [
-                part.strip() for part in self.exclude_patterns.text().split(",") if part.strip()
-            ],
-            "process_keywords": [
-                part.strip() for part in self.process_keywords.text().split(",") if part.strip()
-            ],
-            "archive_after_days": int(self.archive_after_days.value()),
-            "archive_skip_pinned": bool(self.archive_skip_pinned.isChecked()),
-            "auto_backup_hours": int(self.auto_backup_hours.value()),
+            "capture_note": self.capture_note.isChecked(),
+            "capture_todos": self.capture_todos.isChecked(),
+            "capture_enforce_todos": self.capture_enforce_todos.isChecked(),
+            "recent_files_scan_limit": self.scan_limit_spin.value(),
+            "recent_files_scan_seconds": self.scan_seconds_spin.value(),
+            "recent_files_background": self.background_recent.isChecked(),
+            "list_page_size": self.page_size_spin.value(),
+            "recent_files_include": csv(self.include_patterns.text()),
+            "recent_files_exclude_patterns": csv(self.exclude_patterns.text()),
+            "process_keywords": csv(self.process_keywords.text()),
+            "archive_after_days": self.archive_after_days.value(),
+            "archive_skip_pinned": self.archive_skip_pinned.isChecked(),
+            "auto_backup_hours": self.auto_backup_hours.value(),
             "auto_backup_last": str(self._settings.get("auto_backup_last", "")),
             "templates": self._templates_cache,
-            "auto_snapshot_minutes": int(self.auto_snapshot_minutes.value()),
-            "auto_snapshot_on_git_change": bool(self.auto_snapshot_on_git.isChecked()),
+            "auto_snapshot_minutes": self.auto_snapshot_minutes.value(),
+            "auto_snapshot_on_git_change": self.auto_snapshot_on_git.isChecked(),
             "dev_flags": {
-                "sync_enabled": bool(self.flag_sync_enabled.isChecked()),
-                "security_enabled": bool(self.flag_security_enabled.isChecked()),
-                "advanced_search_enabled": bool(self.flag_adv_search_enabled.isChecked()),
-                "restore_profiles_enabled": bool(self.flag_restore_profiles_enabled.isChecked()),
+                "sync_enabled": self.flag_sync_enabled.isChecked(),
+                "security_enabled": self.flag_security_enabled.isChecked(),
+                "advanced_search_enabled": self.flag_adv_search_enabled.isChecked(),
+                "restore_profiles_enabled": self.flag_restore_profiles_enabled.isChecked(),
             },
             "sync": {
                 "provider": str(self.sync_provider.currentData() or "local"),
                 "local_root": self.sync_local_root.text().strip(),
-                "auto_interval_min": int(self.sync_interval_minutes.value()),
+                "auto_interval_min": self.sync_interval_minutes.value(),
                 "last_cursor": str(self._settings.get("sync", {}).get("last_cursor", "")),
             },
             "security": {
-                "dpapi_enabled": bool(self.dpapi_enabled.isChecked()),
-                "encrypt_note": bool(self.sec_note.isChecked()),
-                "encrypt_todos": bool(self.sec_todos.isChecked()),
-                "encrypt_processes": bool(self.sec_processes.isChecked()),
-                "encrypt_running_apps": bool(self.sec_apps.isChecked()),
+                "dpapi_enabled": self.dpapi_enabled.isChecked(),
+                "encrypt_note": self.sec_note.isChecked(),
+                "encrypt_todos": self.sec_todos.isChecked(),
+                "encrypt_processes": self.sec_processes.isChecked(),
+                "encrypt_running_apps": self.sec_apps.isChecked(),
             },
             "search": {
-                "enable_field_query": bool(self.search_enable_field_query.isChecked()),
+                "enable_field_query": self.search_enable_field_query.isChecked(),
                 "saved_queries": saved_queries,
             },
             "restore_profiles": self._restore_profiles_cache,
-            "recent_files_exclude": [
-                part.strip() for part in self.exclude_dirs.text().split(",") if part.strip()
-            ],
+            "recent_files_exclude": csv(self.exclude_dirs.text()),
             "restore": {
-                "open_folder": bool(self.rs_folder.isChecked()),
-                "open_terminal": bool(self.rs_terminal.isChecked()),
-                "open_vscode": bool(self.rs_vscode.isChecked()),
-                "open_running_apps": bool(self.rs_running_apps.isChecked()),
-                "show_post_restore_checklist": bool(self.rs_checklist.isChecked()),
+                "open_folder": self.rs_folder.isChecked(),
+                "open_terminal": self.rs_terminal.isChecked(),
+                "open_vscode": self.rs_vscode.isChecked(),
+                "open_running_apps": self.rs_running_apps.isChecked(),
+                "show_post_restore_checklist": self.rs_checklist.isChecked(),
             },
             "onboarding_shown": bool(self._settings.get("onboarding_shown", False)),
         }
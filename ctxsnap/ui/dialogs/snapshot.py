@@ -5,8 +5,17 @@ from typing import Any, Dict, List, Optional
 from PySide6 import QtCore, QtWidgets
 
 from ctxsnap.i18n import tr
-from ctxsnap.utils import git_title_suggestion
+from ctxsnap.core.worker import GitProbeWorker
 from ctxsnap.ui.styles import NoScrollComboBox
+from ctxsnap.utils import git_title_suggestion
+
+# Default QListWidgetItem flags + checkable, computed once instead of per item
+_TAG_ITEM_FLAGS = (
+    QtCore.Qt.ItemFlag.ItemIsSelectable
+    | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+    | QtCore.Qt.ItemFlag.ItemIsEnabled
+    | QtCore.Qt.ItemFlag.ItemIsDragEnabled
+)
 
 
 class SnapshotDialog(QtWidgets.QDialog):
@@ -29,9 +38,15 @@ class SnapshotDialog(QtWidgets.QDialog):
         self._import_apply_now = False
         self.enforce_todos = enforce_todos
         self.todos_enabled = todos_enabled
+        # Per-root git title suggestion from the background probe (None = not a repo / failed)
+        self._git_suggestions: Dict[str, Optional[str]] = {}
+        # root -> in-flight probe, held until it reports back so the job is released on this thread
+        self._git_pending: Dict[str, GitProbeWorker] = {}
+        self._git_fallback_title: Optional[str] = None
         selected_tag_set = {str(tag) for tag in (selected_tags or [])}
 
         self.root_edit = QtWidgets.QLineEdit(default_root)
+        self.root_edit.editingFinished.connect(self._start_git_probe)
         self.title_edit = QtWidgets.QLineEdit()
         self.workspace_edit = QtWidgets.QLineEdit()
         self.workspace_edit.setPlaceholderText(tr("Workspace placeholder"))
@@ -51,17 +66,21 @@ class SnapshotDialog(QtWidgets.QDialog):
             QtWidgets.QAbstractItemView.SelectionMode.NoSelection
         )
         self.tags_list.setMaximumHeight(80)
+        # Fill in one batch so the layout is not recomputed per item.
+        self.tags_list.setUniformItemSizes(True)
+        self.tags_list.setUpdatesEnabled(False)
         for t in available_tags:
             it = QtWidgets.QListWidgetItem(t)
-            it.setFlags(it.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+            it.setFlags(_TAG_ITEM_FLAGS)
             it.setCheckState(QtCore.Qt.CheckState.Checked if t in selected_tag_set else QtCore.Qt.CheckState.Unchecked)
             self.tags_list.addItem(it)
             selected_tag_set.discard(t)
         for t in sorted(selected_tag_set):
             it = QtWidgets.QListWidgetItem(t)
-            it.setFlags(it.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+            it.setFlags(_TAG_ITEM_FLAGS)
             it.setCheckState(QtCore.Qt.CheckState.Checked)
             self.tags_list.addItem(it)
+        self.tags_list.setUpdatesEnabled(True)
 
         self.custom_tag = QtWidgets.QLineEdit()
         self.custom_tag.setPlaceholderText(tr("Tags (optional)"))
@@ -147,10 +166,44 @@ class SnapshotDialog(QtWidgets.QDialog):
         layout.addWidget(self.err)
         layout.addLayout(btn_row)
 
+        # Run git in the background while the user fills in the form.
+        self._start_git_probe()
+
+    def _root_path(self) -> Path:
+        return Path(self.root_edit.text().strip()).expanduser()
+
+    def _start_git_probe(self) -> None:
+        root = self._root_path()
+        key = str(root)
+        if not self.root_edit.text().strip() or key in self._git_suggestions or key in self._git_pending:
+            return
+        worker = GitProbeWorker(root)
+        worker.setAutoDelete(False)
+        worker.signals.finished.connect(self._on_git_probe_finished)
+        self._git_pending[key] = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    @QtCore.Slot(str, object)
+    def _on_git_probe_finished(self, key: str, suggestion: Optional[str]) -> None:
+        self._git_pending.pop(key, None)
+        self._git_suggestions[key] = suggestion
+        # A probe for an earlier root must not cancel the current root's pending replacement.
+        if key != str(self._root_path()):
+            return
+        # If Suggest was pressed before the probe finished, replace the fallback title.
+        if (
+            suggestion
+            and self._git_fallback_title is not None
+            and self.title_edit.text() == self._git_fallback_title
+        ):
+            self.title_edit.setText(suggestion)
+        self._git_fallback_title = None
+
     def pick_folder(self):
         path = QtWidgets.QFileDialog.getExistingDirectory(self, tr("Select folder"), self.root_edit.text() or str(Path.home()))
         if path:
             self.root_edit.setText(path)
+            self._start_git_probe()
 
     def pick_workspace(self):
         start = self.root_edit.text().strip() or str(Path.home())
@@ -173,18 +226,22 @@ class SnapshotDialog(QtWidgets.QDialog):
                 self.custom_tag.clear()
                 return
         it = QtWidgets.QListWidgetItem(t)
-        it.setFlags(it.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+        it.setFlags(_TAG_ITEM_FLAGS)
         it.setCheckState(QtCore.Qt.CheckState.Checked)
         self.tags_list.addItem(it)
         self.custom_tag.clear()
 
     def suggest_title(self):
-        root = Path(self.root_edit.text().strip()).expanduser()
-        sug = git_title_suggestion(root)
+        root = self._root_path()
+        self._start_git_probe()
+        sug = self._git_suggestions.get(str(root))
         if sug:
             self.title_edit.setText(sug)
-        else:
-            self.title_edit.setText(f"{root.name} - {datetime.now().strftime('%m/%d %H:%M')}")
+            return
+        fallback = f"{root.name} - {datetime.now().strftime('%m/%d %H:%M')}"
+        self.title_edit.setText(fallback)
+        if str(root) in self._git_pending:
+            self._git_fallback_title = fallback
 
     def imported_payload(self):
         return self._imported_payload
@@ -225,8 +282,13 @@ class SnapshotDialog(QtWidgets.QDialog):
             if it.checkState() == QtCore.Qt.CheckState.Checked:
                 tags.append(it.text())
         if not title:
-            # fallback suggestion logic if empty
-            sug = git_title_suggestion(Path(root))
+            # fallback suggestion logic if empty (uses the background probe result when ready)
+            key = str(self._root_path())
+            if key in self._git_pending:
+                # Accepted before the probe returned: ask git directly (memoized per HEAD state).
+                sug = git_title_suggestion(Path(root))
+            else:
+                sug = self._git_suggestions.get(key)
             title = sug or f"{Path(root).name} - {datetime.now().strftime('%m/%d %H:%M')}"
         if not self.todos_enabled:
             todos = ["", "", ""]
@@ -239,7 +301,7 @@ class SnapshotDialog(QtWidgets.QDialog):
         tmpl = self._templates[idx]
         note = str(tmpl.get("note", "") or "")
         todos = tmpl.get("todos", []) or []
-        tags = tmpl.get("tags", []) or []
+        tag_set = frozenset(str(t) for t in (tmpl.get("tags", []) or []))
         if note:
             self.note_edit.setText(note)
         if len(todos) >= 1:
@@ -252,7 +314,7 @@ class SnapshotDialog(QtWidgets.QDialog):
             it = self.tags_list.item(i)
             it.setCheckState(
                 QtCore.Qt.CheckState.Checked
-                if it.text() in tags
+                if it.text() in tag_set
                 else QtCore.Qt.CheckState.Unchecked
             )
 
@@ -306,7 +368,7 @@ class EditSnapshotDialog(SnapshotDialog):
         # Add any tags that weren't in the available list
         for tag in existing_tags:
             it = QtWidgets.QListWidgetItem(tag)
-            it.setFlags(it.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+            it.setFlags(_TAG_ITEM_FLAGS)
             it.setCheckState(QtCore.Qt.CheckState.Checked)
             self.tags_list.addItem(it)
     
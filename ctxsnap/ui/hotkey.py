@@ -9,7 +9,9 @@ MOD_ALT = 0x0001
 MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
 WM_HOTKEY = 0x0312
-VK_MAP = {chr(i): i for i in range(0x41, 0x5B)}
+# MSG field offsets: read only the needed fields instead of building a full MSG per native message.
+_MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+_MSG_WPARAM_OFFSET = wintypes.MSG.wParam.offset
 
 
 class HotkeyFilter(QtCore.QObject, QtCore.QAbstractNativeEventFilter):
@@ -18,13 +20,20 @@ class HotkeyFilter(QtCore.QObject, QtCore.QAbstractNativeEventFilter):
     def __init__(self, hotkey_id: int):
         super().__init__()
         self.hotkey_id = hotkey_id
+        # Called for every native message, so bind the comparison values up front.
+        self._wm_hotkey = WM_HOTKEY
+        self._hid = hotkey_id
 
     def nativeEventFilter(self, eventType, message):
         try:
             if eventType != "windows_generic_MSG":
                 return False, 0
-            msg = wintypes.MSG.from_address(int(message))
-            if msg.message == WM_HOTKEY and msg.wParam == self.hotkey_id:
+            wm = self._wm_hotkey
+            addr = int(message)
+            if ctypes.c_uint.from_address(addr + _MSG_MESSAGE_OFFSET).value != wm:
+                return False, 0
+            hid = self._hid
+            if wintypes.WPARAM.from_address(addr + _MSG_WPARAM_OFFSET).value == hid:
                 self.hotkeyPressed.emit()
                 return True, 0
             return False, 0
@@ -40,7 +49,9 @@ def register_hotkey(hotkey_id: int, ctrl: bool, alt: bool, shift: bool, vk_lette
         mods |= MOD_ALT
     if shift:
         mods |= MOD_SHIFT
-    vk = VK_MAP.get(vk_letter.upper(), VK_MAP["S"])
+    # VK codes for A-Z equal their ASCII codes
+    c = vk_letter.upper()
+    vk = ord(c) if len(c) == 1 and "A" <= c <= "Z" else ord("S")
     return bool(user32.RegisterHotKey(None, hotkey_id, mods, vk))
 
 
@@ -5,18 +5,20 @@ import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from ctxsnap.app_storage import (
     Snapshot,
+    SnapshotReadCache,
     app_dir,
     ensure_storage,
     export_backup_to_file,
     load_json,
     migrate_settings,
     now_iso,
+    save_index,
     save_json,
     save_snapshot_file,
 )
@@ -51,6 +53,20 @@ from ctxsnap.utils import (
 
 LOGGER = get_logger()
 
+# Index row fields added after the first release, with the value older rows get.
+_INDEX_ROW_DEFAULTS: Dict[str, Any] = {
+    "tags": [],
+    "pinned": False,
+    "archived": False,
+    "vscode_workspace": "",
+    "source": "",
+    "trigger": "",
+    "auto_fingerprint": "",
+    "rev": 1,
+    "search_blob": "",
+    "search_blob_mtime": 0.0,
+}
+
 
 class MainWindow(
     MainWindowSettingsBackupSection,
@@ -94,6 +110,7 @@ class MainWindow(
         query = str(self.saved_query_combo.itemData(row) or "").strip()
         if query:
             self.search.setText(query)
+            self._flush_search()
             self.search.setFocus()
 
     def _build_menus(self) -> None:
@@ -191,11 +208,17 @@ class MainWindow(
         self.snaps_dir, self.index_path, self.settings_path = ensure_storage()
         raw_index = load_json(self.index_path)
         self.index = self.snapshot_service.migrate_index(raw_index)
-        self.settings = migrate_settings(load_json(self.settings_path))
+        # (snapshots list, sid -> index row); rebuilt lazily by _index_row().
+        self._row_index: Optional[Tuple[List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = None
+        # Recently read snapshot file bytes for load_snapshot_raw().
+        self._snap_read_cache = SnapshotReadCache()
+        raw_settings = load_json(self.settings_path)
+        # migrate_settings() fills the dict in place; keep the loaded state to compare.
+        self.settings = migrate_settings(copy.deepcopy(raw_settings))
         self.settings["restore_profiles"] = self.restore_service.normalize_profiles(
             self.settings.get("restore_profiles", [])
         )
-        if not save_json(self.settings_path, self.settings):
+        if self.settings != raw_settings and not save_json(self.settings_path, self.settings):
             LOGGER.warning("Failed to persist migrated settings at startup.")
 
         # Menus
@@ -203,60 +226,31 @@ class MainWindow(
 
         # Migrate index entries
         changed = self.index != raw_index
+        row_keys = _INDEX_ROW_DEFAULTS.keys() | {"updated_at"}
         for it in self.index.get("snapshots", []):
-            if "tags" not in it:
-                it["tags"] = []
-                changed = True
-            if "pinned" not in it:
-                it["pinned"] = False
-                changed = True
-            if "archived" not in it:
-                it["archived"] = False
-                changed = True
-            if "vscode_workspace" not in it:
-                it["vscode_workspace"] = ""
-                changed = True
-            if "source" not in it:
-                it["source"] = ""
-                changed = True
-            if "trigger" not in it:
-                it["trigger"] = ""
-                changed = True
-            if "auto_fingerprint" not in it:
-                it["auto_fingerprint"] = ""
-                changed = True
             if not isinstance(it.get("git_state"), dict):
                 it["git_state"] = {}
                 changed = True
-            if "rev" not in it:
-                it["rev"] = 1
-                changed = True
+            # Up-to-date rows have every key; one subset check skips them.
+            if it.keys() >= row_keys:
+                continue
+            changed = True
+            for key, default in _INDEX_ROW_DEFAULTS.items():
+                if key not in it:
+                    it[key] = list(default) if isinstance(default, list) else default
             if "updated_at" not in it:
                 it["updated_at"] = it.get("created_at", now_iso())
-                changed = True
-            if "search_blob" not in it:
-                it["search_blob"] = ""
-                changed = True
-            if "search_blob_mtime" not in it:
-                it["search_blob_mtime"] = 0.0
-                changed = True
-        
-        if "schema_version" not in self.index:
-            changed = True
-        if "search_meta" not in self.index:
-            changed = True
-        if "tombstones" not in self.index:
-            changed = True
-        if "rev" not in self.index:
-            changed = True
-        if "updated_at" not in self.index:
+
+        if not self.index.keys() >= {"schema_version", "search_meta", "tombstones", "rev", "updated_at"}:
             changed = True
-            
+
         if changed:
             self.index = self.snapshot_service.touch_index(self.index)
-            if not save_json(self.index_path, self.index):
+            if not save_index(self.index_path, self.index):
                 LOGGER.warning("Failed to persist migrated index at startup.")
 
+        # Snapshot ids whose files still need the archived flag written.
+        self._archive_pending: List[str] = []
         self._apply_archive_policy()
 
         # UI Components
@@ -265,7 +259,12 @@ class MainWindow(
 
         self.search = QtWidgets.QLineEdit()
         self.search.setPlaceholderText(tr("Search placeholder"))
-        self.search.textChanged.connect(self._reset_pagination_and_refresh)
+        # Typing bursts collapse into one filter pass once the user pauses.
+        self._search_debounce = QtCore.QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(200)
+        self._search_debounce.timeout.connect(self._reset_pagination_and_refresh)
+        self.search.textChanged.connect(self._on_search_text_changed)
         self.search.textChanged.connect(lambda _text: self._refresh_saved_query_combo())
         self.saved_query_combo = NoScrollComboBox()
         self.saved_query_combo.currentIndexChanged.connect(self._apply_saved_query_choice)
@@ -280,14 +279,18 @@ class MainWindow(
         self.tag_filter_btn.setPopupMode(
             QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup
         )
+        # Built once; _build_tag_menu() then only syncs these actions with the tag list.
+        self._tag_menu: Optional[QtWidgets.QMenu] = None
+        self._tag_actions: Dict[str, QtGui.QAction] = {}
         self._build_tag_menu()
 
         self.days_filter = NoScrollComboBox()
-        self.days_filter.addItem(tr("All time"), "all")
-        self.days_filter.addItem(tr("Last 1 day"), "1")
-        self.days_filter.addItem(tr("Last 3 days"), "3")
-        self.days_filter.addItem(tr("Last 7 days"), "7")
-        self.days_filter.addItem(tr("Last 30 days"), "30")
+        # userData is the day count; 0 means no date filter.
+        self.days_filter.addItem(tr("All time"), 0)
+        self.days_filter.addItem(tr("Last 1 day"), 1)
+        self.days_filter.addItem(tr("Last 3 days"), 3)
+        self.days_filter.addItem(tr("Last 7 days"), 7)
+        self.days_filter.addItem(tr("Last 30 days"), 30)
         self.days_filter.currentIndexChanged.connect(self._reset_pagination_and_refresh)
 
         self.sort_combo = NoScrollComboBox()
@@ -478,6 +481,20 @@ class MainWindow(
         # Initial Refresh
         self._current_page = 1
         self._total_pages = 1
+        # sort_mode -> (snapshots list, index key, sorted rows); see _sorted_snapshots().
+        self._sorted_cache: Dict[str, Any] = {}
+        # (snapshots list, index key, tag -> bit, id(row) -> tag mask); see _tag_masks().
+        self._tag_mask_cache: Optional[Tuple[Any, ...]] = None
+        # Bumped per on_select(); stale background snapshot loads are dropped.
+        self._detail_token = 0
+        # token -> in-flight load, held until it reports back so it is released on the GUI thread
+        self._detail_loads: Dict[int, QtCore.QRunnable] = {}
+        # (sid, (rev, updated_at), snapshot) of the last detail load; re-selecting it skips the read.
+        self._detail_cache: Optional[Tuple[str, Tuple[Any, Any], Dict[str, Any]]] = None
+        # Delete confirmation, created on first use and reused; see _delete_confirm_box().
+        self._confirm_box: Optional[QtWidgets.QMessageBox] = None
+        # Set while a _rebuild_settings_ui() call is queued by apply_settings().
+        self._ui_rebuild_pending = False
         self.refresh_list(reset_page=True)
         if self.list_model.rowCount() > 0:
             self.listw.setCurrentIndex(self.list_model.index(0, 0))
@@ -495,6 +512,12 @@ class MainWindow(
         self.git_timer.setInterval(60_000)
         self.git_timer.timeout.connect(self._check_git_change)
         self._last_git_state = None
+        # Pin/archive/tag toggles and deletes mark the index dirty; this writes it once.
+        self._index_dirty = False
+        self._index_flush_timer = QtCore.QTimer(self)
+        self._index_flush_timer.setSingleShot(True)
+        self._index_flush_timer.setInterval(250)
+        self._index_flush_timer.timeout.connect(self._flush_index)
         
         self._init_sync_engine()
         self._update_auto_snapshot_timer()
@@ -502,6 +525,11 @@ class MainWindow(
         self._update_sync_timer()
         self.git_timer.start()
         self._recent_workers: Dict[str, QtCore.QThread] = {}
+        # sid -> (Snapshot fields, root, scan recent files afterwards, status prefix) while
+        # SnapshotCaptureWorker gathers the rest; see _create_snapshot().
+        self._pending_captures: Dict[str, Tuple[Dict[str, Any], Path, bool, str]] = {}
+        # sid -> in-flight capture job, held until it reports back so it is released on the GUI thread
+        self._capture_jobs: Dict[str, QtCore.QRunnable] = {}
 
         self.on_settings_applied: Optional[Callable[[], None]] = None
         self._is_closing = False
@@ -521,6 +549,8 @@ class MainWindow(
         self.backup_timer.stop()
         self.sync_timer.stop()
         self.git_timer.stop()
+        self._finish_pending_captures()
+        self._flush_index()
         
         # Stop all background workers
         for sid, thread in list(self._recent_workers.items()):
@@ -9,17 +9,20 @@ from typing import List, cast
 
 from PySide6 import QtCore
 
-from ctxsnap.app_storage import app_dir, load_json, migrate_settings, now_iso, save_json, save_snapshot_file
+from ctxsnap.app_storage import app_dir, load_json, migrate_settings, now_iso, save_index, save_json, save_snapshot_file
 from ctxsnap.constants import APP_NAME
 from ctxsnap.core.logging import get_logger
 from ctxsnap.core.sync import SyncEngine
 from ctxsnap.core.sync.providers import CloudStubSyncProvider, LocalSyncProvider
-from ctxsnap.core.worker import RecentFilesWorker
+from ctxsnap.core.worker import RecentFilesWorker, pop_recent_files_result
 from ctxsnap.i18n import tr
-from ctxsnap.utils import git_state_key, log_exc, safe_parse_datetime, snapshot_mtime
+from ctxsnap.utils import find_unique_workspace, git_state_key, log_exc, safe_parse_datetime, snapshot_mtime
 
 LOGGER = get_logger()
 
+# Snapshot files rewritten per event-loop turn by _flush_archived_snapshots().
+_ARCHIVE_BATCH = 20
+
 
 class MainWindowAutomationSection:
     def _auto_snapshot_prompt(self) -> None:
@@ -78,6 +81,8 @@ class MainWindowAutomationSection:
         if not sync_enabled or not self.sync_engine:
             return
         try:
+            # The engine merges against index.json on disk.
+            self._flush_index()
             if isinstance(settings_override, dict):
                 self._init_sync_engine(active_settings)
             result = self.sync_engine.sync()
@@ -141,7 +146,7 @@ class MainWindowAutomationSection:
             return
         skip_pinned = bool(self.settings.get("archive_skip_pinned", True))
         cutoff = datetime.now() - timedelta(days=days)
-        updated = False
+        pending: List[str] = []
         for it in self.index.get("snapshots", []):
             if skip_pinned and bool(it.get("pinned", False)):
                 continue
@@ -152,28 +157,55 @@ class MainWindowAutomationSection:
                 continue
             if created_at >= cutoff:
                 continue
+            it["archived"] = True
             sid = it.get("id")
             if sid:
-                snap = self.load_snapshot_raw(sid)
-                if snap:
-                    snap["archived"] = True
-                    snap = self.snapshot_service.touch_snapshot(snap)
-                    persisted = self._prepare_snapshot_for_persist(snap)
-                    if not save_snapshot_file(self.snap_path(sid), persisted):
-                        LOGGER.warning("Failed to persist archived snapshot: %s", sid)
-                        continue
-                    it.update(
-                        self._index_entry_from_snapshot_data(
-                            persisted,
-                            snap_mtime=snapshot_mtime(self.snap_path(sid)),
-                        )
-                    )
-            it["archived"] = True
+                pending.append(sid)
+        if not pending:
+            return
+        # Phase 1: the index flags are what the list shows, so persist them now.
+        self.index = self.snapshot_service.touch_index(self.index)
+        if not save_index(self.index_path, self.index):
+            LOGGER.warning("Failed to persist archive policy updates.")
+        # Phase 2: the snapshot files follow in small batches from the event loop.
+        queued = not self._archive_pending
+        self._archive_pending.extend(pending)
+        if queued:
+            QtCore.QTimer.singleShot(0, self._flush_archived_snapshots)
+
+    def _flush_archived_snapshots(self) -> None:
+        """Rewrite a batch of snapshot files archived by _apply_archive_policy()."""
+        batch = self._archive_pending[:_ARCHIVE_BATCH]
+        del self._archive_pending[:_ARCHIVE_BATCH]
+        updated = False
+        for sid in batch:
+            it = self._index_row(sid)
+            # Skip rows deleted or un-archived by the user since phase 1.
+            if it is None or not bool(it.get("archived", False)):
+                continue
+            snap = self.load_snapshot_raw(sid)
+            if not snap or bool(snap.get("archived", False)):
+                continue
+            snap["archived"] = True
+            snap = self.snapshot_service.touch_snapshot(snap)
+            persisted = self._prepare_snapshot_for_persist(snap)
+            if not save_snapshot_file(self.snap_path(sid), persisted):
+                LOGGER.warning("Failed to persist archived snapshot: %s", sid)
+                continue
+            it.update(
+                self._index_entry_from_snapshot_data(
+                    persisted,
+                    snap_mtime=snapshot_mtime(self.snap_path(sid)),
+                    search_blob=it.get("search_blob") or None,
+                )
+            )
             updated = True
         if updated:
             self.index = self.snapshot_service.touch_index(self.index)
-            if not save_json(self.index_path, self.index):
-                LOGGER.warning("Failed to persist archive policy updates.")
+            if not save_index(self.index_path, self.index):
+                LOGGER.warning("Failed to persist archived snapshot index entries.")
+        if self._archive_pending:
+            QtCore.QTimer.singleShot(0, self._flush_archived_snapshots)
 
     def _check_git_change(self) -> None:
         if not bool(self.settings.get("auto_snapshot_on_git_change", False)):
@@ -208,9 +240,7 @@ class MainWindowAutomationSection:
         seed_tags = self._normalized_tags(seed.get("tags", []) if seed else [])
 
         if not seed_workspace:
-            workspaces = list(root_path.glob("*.code-workspace"))
-            if len(workspaces) == 1:
-                seed_workspace = str(workspaces[0].resolve())
+            seed_workspace = find_unique_workspace(root_path)
 
         capture_note = bool(self.settings.get("capture_note", True))
         capture_todos = bool(self.settings.get("capture_todos", True))
@@ -273,7 +303,8 @@ class MainWindowAutomationSection:
         self._recent_workers[sid] = thread
         thread.start()
 
-    def _on_recent_files_ready(self, sid: str, files: List[str]) -> None:
+    def _on_recent_files_ready(self, sid: str) -> None:
+        files = list(pop_recent_files_result(sid))
         snap = self.load_snapshot_raw(sid)
         if not snap:
             return
@@ -285,12 +316,11 @@ class MainWindowAutomationSection:
             snap = self.snapshot_service.touch_snapshot(snap)
             snap = self._persist_snapshot_or_raise(snap_path, snap, f"snapshot recent files {sid}")
             snap_mtime = snapshot_mtime(snap_path)
-            for it in self.index.get("snapshots", []):
-                if it.get("id") == sid:
-                    it.update(self._index_entry_from_snapshot_data(snap, snap_mtime=snap_mtime))
-                    break
+            it = self._index_row(sid)
+            if it is not None:
+                it.update(self._index_entry_from_snapshot_data(snap, snap_mtime=snap_mtime))
             self.index = self.snapshot_service.touch_index(self.index)
-            self._save_json_or_raise(self.index_path, self.index, "index")
+            self._save_index_or_raise(self.index_path, self.index, "index")
             self.refresh_list(reset_page=False)
             self.statusBar().showMessage(tr("Recent files updated in background."), 2500)
         except Exception as exc:
@@ -304,7 +334,7 @@ class MainWindowAutomationSection:
                 )
             except Exception as rollback_exc:
                 log_exc("rollback recent files snapshot file", rollback_exc)
-            if not save_json(self.index_path, self.index):
+            if not save_index(self.index_path, self.index):
                 LOGGER.error("Failed to rollback index after recent files update error.")
 
     def _on_recent_files_failed(self, sid: str, error: str) -> None:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 # pyright: reportAttributeAccessIssue=false
 
+import bisect
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -14,25 +15,57 @@ from ctxsnap.utils import safe_parse_datetime
 
 LOGGER = get_logger()
 
+_STAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _is_stamp(value: str) -> bool:
+    """True for fixed-width now_iso() stamps, whose string order is their time order."""
+    return len(value) == 19 and value[10:11] == "T"
+
+
+def _created_since(created_at: str, cutoff: datetime, cutoff_str: str) -> bool:
+    if _is_stamp(created_at):
+        return created_at >= cutoff_str
+    created = safe_parse_datetime(created_at)
+    return created is None or created >= cutoff
+
 
 class MainWindowListViewSection:
     def _build_tag_menu(self) -> None:
-        parent_widget = cast(QtWidgets.QWidget, self)
+        """Sync the tag filter menu with the configured tags, reusing existing actions."""
         parent_obj = cast(QtCore.QObject, self)
-        menu = QtWidgets.QMenu(parent_widget)
-        clear_action = QtGui.QAction("All tags", parent_obj)
-        clear_action.triggered.connect(self._clear_tag_filter)
-        menu.addAction(clear_action)
-        menu.addSeparator()
-        tags = self.settings.get("tags", DEFAULT_TAGS)
+        menu = self._tag_menu
+        if menu is None:
+            menu = QtWidgets.QMenu(cast(QtWidgets.QWidget, self))
+            clear_action = QtGui.QAction("All tags", parent_obj)
+            clear_action.triggered.connect(self._clear_tag_filter)
+            menu.addAction(clear_action)
+            menu.addSeparator()
+            self._tag_menu = menu
+            self.tag_filter_btn.setMenu(menu)
+        tags = list(dict.fromkeys(self.settings.get("tags", DEFAULT_TAGS)))
         self.selected_tags.intersection_update(tags)
-        for tag in tags:
-            action = QtGui.QAction(tag, parent_obj)
-            action.setCheckable(True)
+        actions = self._tag_actions
+        for tag in [tag for tag in actions if tag not in tags]:
+            action = actions.pop(tag)
+            menu.removeAction(action)
+            action.deleteLater()
+        if list(actions) != tags:
+            # Re-append in settings order; only tags new to the menu get a QAction.
+            for action in actions.values():
+                menu.removeAction(action)
+            ordered: Dict[str, QtGui.QAction] = {}
+            for tag in tags:
+                action = actions.get(tag)
+                if action is None:
+                    action = QtGui.QAction(tag, parent_obj)
+                    action.setCheckable(True)
+                    action.triggered.connect(self._toggle_tag_filter)
+                ordered[tag] = action
+                menu.addAction(action)
+            self._tag_actions = actions = ordered
+        for tag, action in actions.items():
             action.setChecked(tag in self.selected_tags)
-            action.triggered.connect(self._toggle_tag_filter)
-            menu.addAction(action)
-        self.tag_filter_btn.setMenu(menu)
 
     def _toggle_tag_filter(self) -> None:
         action = self.sender()
@@ -46,13 +79,49 @@ class MainWindowListViewSection:
 
     def _clear_tag_filter(self) -> None:
         self.selected_tags.clear()
-        self._build_tag_menu()
+        for action in self._tag_actions.values():
+            action.setChecked(False)
         self._reset_pagination_and_refresh()
 
     # ----- index helpers -----
     def _clear_search(self) -> None:
         self.search.clear()
 
+    def _index_row(self, sid: str) -> Optional[Dict[str, Any]]:
+        """Index row for ``sid`` via a dict keyed to the current snapshots list.
+
+        The map is rebuilt when self.index swaps in another list (reload, rollback)
+        or when a lookup misses or finds a row whose id no longer matches.
+        """
+        snapshots = self.index.get("snapshots", [])
+        cached = self._row_index
+        if cached is not None and cached[0] is snapshots:
+            row = cached[1].get(sid)
+            if row is not None and row.get("id") == sid:
+                return row
+        by_id = {it.get("id"): it for it in reversed(snapshots)}
+        self._row_index = (snapshots, by_id)
+        return by_id.get(sid)
+
+    def _remove_index_rows(self, sid: str) -> None:
+        """Drop every index row for ``sid`` in place, keeping the _index_row() map valid."""
+        snapshots = self.index.setdefault("snapshots", [])
+        snapshots[:] = [it for it in snapshots if it.get("id") != sid]
+        cached = self._row_index
+        if cached is not None and cached[0] is snapshots:
+            cached[1].pop(sid, None)
+
+    def _on_search_text_changed(self, text: str) -> None:
+        if not text:
+            # Clearing the box should show everything right away.
+            self._flush_search()
+            return
+        self._search_debounce.start()
+
+    def _flush_search(self) -> None:
+        self._search_debounce.stop()
+        self._reset_pagination_and_refresh()
+
     def _reset_pagination_and_refresh(self) -> None:
         self._current_page = 1
         self.refresh_list(reset_page=False)
@@ -84,52 +153,45 @@ class MainWindowListViewSection:
         pinned_only = bool(self.pinned_only.isChecked()) if hasattr(self, "pinned_only") else False
         show_archived = bool(self.show_archived.isChecked()) if hasattr(self, "show_archived") else False
 
-        items = list(self.index.get("snapshots", []))
         view_items: List[Dict[str, Any]] = []
 
         sort_mode = self.sort_combo.currentData() if hasattr(self, "sort_combo") else "newest"
-        
-        if sort_mode == "pinned":
-            items.sort(key=lambda x: (not bool(x.get("pinned", False)), x.get("created_at", "")), reverse=False)
-        elif sort_mode == "oldest":
-            items.sort(key=lambda x: x.get("created_at", ""))
-        elif sort_mode == "title":
-            items.sort(key=lambda x: (x.get("title", "").lower(), x.get("created_at", "")))
-        else: # newest or default
-            items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        items = self._sorted_snapshots(sort_mode)
 
-        days_filter = self.days_filter.currentData() if hasattr(self, "days_filter") else "all"
-        now = datetime.now()
+        days = self.days_filter.currentData() if hasattr(self, "days_filter") else 0
         day_cutoff = None
-        # Logic based on "1", "3", "7", "30", "all"
-        if days_filter and days_filter != "all":
-            try:
-                days = int(days_filter)
-                day_cutoff = now - timedelta(days=days)
-            except Exception:
-                day_cutoff = None
+        day_cutoff_str = ""
+        if days:
+            # Whole seconds, like the stored created_at stamps, so string and datetime order agree.
+            day_cutoff = datetime.now().replace(microsecond=0) - timedelta(days=days)
+            day_cutoff_str = day_cutoff.strftime(_STAMP_FORMAT)
+        if day_cutoff is not None and sort_mode not in ("pinned", "title"):
+            items = self._drop_older_span(items, day_cutoff_str, newest_first=sort_mode != "oldest")
 
+        filter_tags = bool(self.selected_tags)
+        selected_mask = 0
+        tag_masks: Dict[int, int] = {}
+        if filter_tags:
+            tag_bits, tag_masks = self._tag_masks()
+            for tag in self.selected_tags:
+                selected_mask |= tag_bits.get(tag, 0)
+        matches_item = self.search_service.matches_item
+        load_snapshot = self.load_snapshot
+        # Cheap per-row field checks run first; the text match (which may read the
+        # snapshot file) only sees rows that survived every other filter.
         for it in items:
-            tags = it.get("tags", []) or []
-            if self.selected_tags and not self.selected_tags.intersection(tags):
+            if filter_tags and not tag_masks.get(id(it), 0) & selected_mask:
                 continue
-            if bool(it.get("archived", False)) and not show_archived:
+            if not show_archived and it.get("archived", False):
                 continue
-            if query_raw:
-                if not self.search_service.matches_item(
-                    it,
-                    parsed_query,
-                    load_snapshot=self.load_snapshot,
-                ):
-                    continue
-
-            if pinned_only and not bool(it.get("pinned", False)):
+            if pinned_only and not it.get("pinned", False):
                 continue
 
-            if day_cutoff:
-                created_at = safe_parse_datetime(it.get("created_at", ""))
-                if created_at and created_at < day_cutoff:
-                    continue
+            if day_cutoff and not _created_since(it.get("created_at", ""), day_cutoff, day_cutoff_str):
+                continue
+
+            if query_raw and not matches_item(it, parsed_query, load_snapshot=load_snapshot):
+                continue
 
             view_items.append(it)
         page_size = max(1, int(self.settings.get("list_page_size", 200)))
@@ -141,10 +203,26 @@ class MainWindowListViewSection:
             self._current_page = self._total_pages
         start = (self._current_page - 1) * page_size
         end = start + page_size
-        self.list_model.set_items(view_items[start:end])
+        page_items = view_items[start:end]
+        current_sid = self.selected_id()
+        if current_sid and all(it.get("id") != current_sid for it in page_items):
+            # set_items() removes rows in place instead of resetting the model; drop the
+            # current index quietly first so the view does not hop to a neighbouring row.
+            selection = self.listw.selectionModel()
+            with QtCore.QSignalBlocker(selection):
+                selection.clear()
+        self.list_model.set_items(page_items)
+        if current_sid and self.selected_id() != current_sid:
+            # A model reset drops the current index even when the row is still shown;
+            # put it back quietly so the detail pane is neither cleared nor reloaded.
+            row = self.list_model.row_for_id(current_sid)
+            if row >= 0:
+                selection = self.listw.selectionModel()
+                with QtCore.QSignalBlocker(selection):
+                    self.listw.setCurrentIndex(self.list_model.index(row, 0))
         if hasattr(self, "result_label"):
             total_all = len(self.index.get("snapshots", []))
-            showing = len(view_items[start:end])
+            showing = len(page_items)
             self.result_label.setText(
                 f"{tr('Storage:')} {showing} / {len(view_items)} (Total {total_all})"
             )
@@ -157,6 +235,67 @@ class MainWindowListViewSection:
             else:
                 self.list_stack.setCurrentWidget(self.listw)
 
+    @staticmethod
+    def _drop_older_span(
+        items: List[Dict[str, Any]], cutoff_str: str, *, newest_first: bool
+    ) -> List[Dict[str, Any]]:
+        """Cut rows created before the cutoff from a list sorted by created_at.
+
+        The boundary is found by bisection; rows on the older side are only kept
+        when their created_at is not a regular stamp (the loop then checks them).
+        """
+        if newest_first:
+            idx = bisect.bisect_left(items, True, key=lambda it: it.get("created_at", "") < cutoff_str)
+            return items[:idx] + [it for it in items[idx:] if not _is_stamp(it.get("created_at", ""))]
+        idx = bisect.bisect_left(items, True, key=lambda it: it.get("created_at", "") >= cutoff_str)
+        return [it for it in items[:idx] if not _is_stamp(it.get("created_at", ""))] + items[idx:]
+
+    def _sorted_snapshots(self, sort_mode: str) -> List[Dict[str, Any]]:
+        """Index rows in display order, re-sorted only when the index changed.
+
+        Every index mutation either goes through touch_index() (new rev/updated_at)
+        or swaps in another snapshots list (reload, rollback), so those identify
+        the order. The returned list is shared; callers must not mutate it.
+        """
+        snapshots = self.index.get("snapshots", [])
+        key = (len(snapshots), self.index.get("rev"), self.index.get("updated_at"))
+        cached = self._sorted_cache.get(sort_mode)
+        if cached is not None and cached[0] is snapshots and cached[1] == key:
+            return cached[2]
+        items = list(snapshots)
+        if sort_mode == "pinned":
+            items.sort(key=lambda x: (not bool(x.get("pinned", False)), x.get("created_at", "")), reverse=False)
+        elif sort_mode == "oldest":
+            items.sort(key=lambda x: x.get("created_at", ""))
+        elif sort_mode == "title":
+            items.sort(key=lambda x: (x.get("title", "").lower(), x.get("created_at", "")))
+        else: # newest or default
+            items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        self._sorted_cache[sort_mode] = (snapshots, key, items)
+        return items
+
+    def _tag_masks(self) -> Tuple[Dict[str, int], Dict[int, int]]:
+        """Bit per configured tag, and each index row's tags as a mask keyed by id(row).
+
+        Cached like _sorted_snapshots(); a tag edit on a row goes through
+        touch_index(), and the tag list itself is part of the key.
+        """
+        snapshots = self.index.get("snapshots", [])
+        tags = tuple(self.settings.get("tags", DEFAULT_TAGS))
+        key = (len(snapshots), self.index.get("rev"), self.index.get("updated_at"), tags)
+        cached = self._tag_mask_cache
+        if cached is not None and cached[0] is snapshots and cached[1] == key:
+            return cached[2], cached[3]
+        tag_bits = {tag: 1 << bit for bit, tag in enumerate(dict.fromkeys(tags))}
+        masks: Dict[int, int] = {}
+        for it in snapshots:
+            mask = 0
+            for tag in it.get("tags", []) or []:
+                mask |= tag_bits.get(tag, 0)
+            masks[id(it)] = mask
+        self._tag_mask_cache = (snapshots, key, tag_bits, masks)
+        return tag_bits, masks
+
     def selected_id(self) -> Optional[str]:
         idx = self.listw.currentIndex()
         if not idx.isValid():
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 # pyright: reportAttributeAccessIssue=false
 
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
 
 from PySide6 import QtWidgets
 
-from ctxsnap.app_storage import append_restore_history, app_dir, now_iso, save_snapshot_file
+from ctxsnap.app_storage import append_restore_history, app_dir, load_json, now_iso, save_json
 from ctxsnap.i18n import tr
 from ctxsnap.restore import open_folder, open_terminal_at, open_vscode_at, resolve_vscode_target
 from ctxsnap.ui.dialogs.history import CompareDialog, RestoreHistoryDialog, SyncConflictsDialog
@@ -17,6 +16,14 @@ from ctxsnap.ui.dialogs.restore import ChecklistDialog, RestorePreviewDialog
 from ctxsnap.utils import restore_running_apps, safe_parse_datetime
 
 
+def _newline_joined(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the pieces of "\\n".join(lines) without building the joined string."""
+    sep = ""
+    for line in lines:
+        yield sep + line
+        sep = "\n"
+
+
 class MainWindowRestoreActionsSection:
     @staticmethod
     def _parent_widget(instance: object) -> QtWidgets.QWidget:
@@ -93,31 +100,33 @@ class MainWindowRestoreActionsSection:
         return out
 
     @staticmethod
-    def _weekly_report_lines(snaps: List[Dict[str, Any]], *, redacted: bool) -> List[str]:
-        lines = ["# Weekly Snapshot Report", f"Generated: {now_iso()}", ""]
+    def _weekly_report_lines(snaps: List[Dict[str, Any]], *, redacted: bool) -> Iterator[str]:
+        yield "# Weekly Snapshot Report"
+        yield f"Generated: {now_iso()}"
+        yield ""
         for snap in snaps:
-            lines.append("## (redacted snapshot)" if redacted else f"## {snap.get('title','(no title)')}")
-            lines.append(f"- Created: {snap.get('created_at','')}")
+            yield "## (redacted snapshot)" if redacted else f"## {snap.get('title','(no title)')}"
+            yield f"- Created: {snap.get('created_at','')}"
             if redacted:
-                lines.append("- Root: (redacted)")
+                yield "- Root: (redacted)"
             else:
-                lines.append(f"- Root: {snap.get('root','')}")
+                yield f"- Root: {snap.get('root','')}"
             tags = [] if redacted else snap.get("tags", [])
             if tags:
-                lines.append(f"- Tags: {', '.join(str(tag) for tag in tags)}")
+                yield f"- Tags: {', '.join(str(tag) for tag in tags)}"
             todos = [str(t) for t in snap.get("todos", []) if str(t).strip()]
             if todos:
-                lines.append("### TODOs")
+                yield "### TODOs"
                 if redacted:
-                    lines.append("- (redacted)")
+                    yield "- (redacted)"
                 else:
-                    lines.extend([f"- {t}" for t in todos])
+                    for t in todos:
+                        yield f"- {t}"
             note = str(snap.get("note", "") or "")
             if note:
-                lines.append("### Note")
-                lines.append("(redacted)" if redacted else note)
-            lines.append("")
-        return lines
+                yield "### Note"
+                yield "(redacted)" if redacted else note
+            yield ""
 
     def open_selected_root(self) -> None:
         sid = self.selected_id()
@@ -167,7 +176,8 @@ class MainWindowRestoreActionsSection:
         )
         if not path:
             return
-        if save_snapshot_file(
+        # Exports are meant to be read, so they keep the indented layout.
+        if save_json(
             Path(path),
             self._snapshot_export_payload(snap, redacted=(export_mode == "redacted")),
         ):
@@ -210,7 +220,8 @@ class MainWindowRestoreActionsSection:
         if not path:
             return
         lines = self._weekly_report_lines(snaps, redacted=(export_mode == "redacted"))
-        Path(path).write_text("\n".join(lines), encoding="utf-8")
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(_newline_joined(lines))
         self.statusBar().showMessage("Weekly report exported.", 2500)
 
     def open_compare_dialog(self) -> None:
@@ -234,10 +245,7 @@ class MainWindowRestoreActionsSection:
                 tr("No restore history yet"),
             )
             return
-        try:
-            history = json.loads(history_path.read_text(encoding="utf-8"))
-        except Exception:
-            history = {"restores": []}
+        history = load_json(history_path, default={"restores": []})
         dlg = RestoreHistoryDialog(self._parent_widget(self), history)
         dlg.restoreRequested.connect(self._restore_by_id)
         dlg.exec()
@@ -251,10 +259,7 @@ class MainWindowRestoreActionsSection:
                 tr("No sync conflicts yet"),
             )
             return
-        try:
-            conflicts = json.loads(conflicts_path.read_text(encoding="utf-8"))
-        except Exception:
-            conflicts = {"conflicts": []}
+        conflicts = load_json(conflicts_path, default={"conflicts": []})
         if not conflicts.get("conflicts"):
             QtWidgets.QMessageBox.information(
                 self._parent_widget(self),
@@ -297,9 +302,10 @@ class MainWindowRestoreActionsSection:
         open_running_apps_default = bool(restore_defaults.get("open_running_apps", False))
         show_checklist_default = bool(restore_defaults.get("show_checklist", True))
         profile_default = str(restore_defaults.get("profile_name", "") or "")
-        profile_enabled = bool(self.settings.get("dev_flags", {}).get("restore_profiles_enabled", False))
-        profiles = self.restore_service.normalize_profiles(self.settings.get("restore_profiles", [])) if profile_enabled else []
-        preview_default = bool(self.settings.get("restore_preview_default", True))
+        setting = self.settings.get
+        profile_enabled = bool((setting("dev_flags") or {}).get("restore_profiles_enabled", False))
+        profiles = self.restore_service.normalize_profiles(setting("restore_profiles", [])) if profile_enabled else []
+        preview_default = bool(setting("restore_preview_default", True))
 
         if preview_default:
             dlg = RestorePreviewDialog(
@@ -388,8 +394,8 @@ class MainWindowRestoreActionsSection:
             )
 
         if show_checklist:
-            todos = snap.get("todos", [])
-            if any(todos):
-                dlg = ChecklistDialog(self._parent_widget(self), [t for t in todos if t])
+            todos = [t for t in snap.get("todos", []) if t]
+            if todos:
+                dlg = ChecklistDialog(self._parent_widget(self), todos)
                 dlg.exec()
         self.statusBar().showMessage("Restore triggered.", 2500)
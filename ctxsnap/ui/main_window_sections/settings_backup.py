@@ -7,9 +7,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, cast
 
-from PySide6 import QtWidgets
-
-from ctxsnap.app_storage import app_dir, is_valid_snapshot_id, migrate_settings, migrate_snapshot, safe_snapshot_path, save_json
+from PySide6 import QtCore, QtWidgets
+
+from ctxsnap.app_storage import (
+    app_dir,
+    is_valid_snapshot_id,
+    migrate_settings,
+    migrate_snapshot,
+    read_snapshot_dir,
+    remove_snapshot_files,
+    safe_snapshot_path,
+    save_index,
+    save_json,
+)
 from ctxsnap.constants import APP_NAME
 from ctxsnap.core.logging import get_logger
 from ctxsnap.i18n import tr
@@ -24,9 +34,13 @@ class MainWindowSettingsBackupSection:
     def _parent_widget(instance: object) -> QtWidgets.QWidget:
         return cast(QtWidgets.QWidget, instance)
 
-    def apply_settings(self, vals: Dict[str, Any], *, save: bool = True) -> bool:
-        """Apply settings immediately (UI + hotkey)."""
-        vals = migrate_settings(vals)
+    def apply_settings(self, vals: Dict[str, Any], *, save: bool = True, migrated: bool = False) -> bool:
+        """Apply settings immediately (UI + hotkey).
+
+        Pass ``migrated=True`` when ``vals`` already came out of migrate_settings().
+        """
+        if not migrated:
+            vals = migrate_settings(vals)
         vals["restore_profiles"] = self.restore_service.normalize_profiles(vals.get("restore_profiles", []))
         vals.setdefault("default_root", self.settings.get("default_root", str(Path.home())))
         vals["auto_backup_last"] = str(vals.get("auto_backup_last", self.settings.get("auto_backup_last", "")) or "")
@@ -42,14 +56,7 @@ class MainWindowSettingsBackupSection:
                 )
                 return False
 
-        self._build_tag_menu()
-        if hasattr(self, "_refresh_saved_query_combo"):
-            self._refresh_saved_query_combo()
-        self._reset_pagination_and_refresh()
-
-        if hasattr(self, "btn_quick"):
-            self.btn_quick.setText(f"Quick Snapshot ({self.hotkey_label()})")
-        self._build_menus()
+        self._schedule_ui_rebuild()
 
         if callable(self.on_settings_applied):
             self.on_settings_applied()
@@ -60,10 +67,35 @@ class MainWindowSettingsBackupSection:
         self._apply_archive_policy()
         return True
 
+    def _schedule_ui_rebuild(self) -> None:
+        """Rebuild settings-driven widgets once on the next event-loop turn.
+
+        Import and onboarding can apply settings several times in a row; the tag
+        menu, menu bar and list are then rebuilt once for the last settings.
+        """
+        if self._ui_rebuild_pending:
+            return
+        self._ui_rebuild_pending = True
+        QtCore.QTimer.singleShot(0, self._rebuild_settings_ui)
+
+    def _rebuild_settings_ui(self) -> None:
+        if not self._ui_rebuild_pending:
+            return
+        self._ui_rebuild_pending = False
+        self._build_tag_menu()
+        if hasattr(self, "_refresh_saved_query_combo"):
+            self._refresh_saved_query_combo()
+        self._reset_pagination_and_refresh()
+
+        if hasattr(self, "btn_quick"):
+            self.btn_quick.setText(f"Quick Snapshot ({self.hotkey_label()})")
+        self._build_menus()
+
     def _auto_backup_current(self) -> Tuple[Path, bool, str]:
         backups = app_dir() / "backups"
         backups.mkdir(parents=True, exist_ok=True)
         bkp = backups / f"{APP_NAME}_autobackup_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        self._flush_index()
         try:
             self.backup_service.export_backup(
                 bkp,
@@ -85,7 +117,7 @@ class MainWindowSettingsBackupSection:
         safety_backup: Optional[Path] = None
         prev_index = copy.deepcopy(self.index)
         prev_settings = copy.deepcopy(self.settings)
-        prev_snapshot_files: Dict[str, str] = {}
+        prev_snapshot_files: Dict[str, bytes] = {}
         captured_snapshot_files = False
 
         try:
@@ -132,16 +164,19 @@ class MainWindowSettingsBackupSection:
                 if not isinstance(imported_snaps, list):
                     raise ValueError("Invalid backup: snapshots field must be a list.")
 
-                for f in self.snaps_dir.glob("*.json"):
-                    prev_snapshot_files[f.name] = f.read_text(encoding="utf-8")
+                prev_snapshot_files = read_snapshot_dir(self.snaps_dir)
                 captured_snapshot_files = True
 
                 if strategy == "replace":
-                    for f in self.snaps_dir.glob("*.json"):
-                        f.unlink(missing_ok=True)
+                    remove_snapshot_files(self.snaps_dir)
+                    self._snap_read_cache.clear()
                     self.index = self.snapshot_service.migrate_index({"snapshots": [], "tombstones": []})
 
-                existing_ids = {str(it.get("id")) for it in self.index.get("snapshots", []) if it.get("id")}
+                # First row per id wins, matching the dedup pass below; rows appended
+                # here are registered too, so repeated ids in the backup stay O(1).
+                index_by_id: Dict[str, Dict[str, Any]] = {
+                    str(it.get("id")): it for it in reversed(self.index.get("snapshots", [])) if it.get("id")
+                }
 
                 for raw_snap in imported_snaps:
                     if not isinstance(raw_snap, dict):
@@ -151,21 +186,19 @@ class MainWindowSettingsBackupSection:
                     if not is_valid_snapshot_id(sid):
                         LOGGER.warning("Skipping imported snapshot with invalid id: %s", sid)
                         continue
-                    if strategy == "merge" and sid in existing_ids:
+                    if strategy == "merge" and sid in index_by_id:
                         continue
 
                     snap_path = safe_snapshot_path(self.snaps_dir, sid)
                     self._save_snapshot_or_raise(snap_path, snap, f"imported snapshot {sid}")
                     snap_mtime = snapshot_mtime(snap_path)
                     entry = self._index_entry_from_snapshot_data(snap, snap_mtime=snap_mtime)
-                    if sid not in existing_ids:
+                    existing = index_by_id.get(sid)
+                    if existing is None:
                         self.index.setdefault("snapshots", []).append(entry)
-                        existing_ids.add(sid)
+                        index_by_id[sid] = entry
                     elif strategy == "overwrite":
-                        for it in self.index.get("snapshots", []):
-                            if it.get("id") == sid:
-                                it.update(entry)
-                                break
+                        existing.update(entry)
 
                 imported_tombstones = []
                 if imported_index:
@@ -206,31 +239,26 @@ class MainWindowSettingsBackupSection:
                         [{"id": sid, "deleted_at": deleted_at} for sid, deleted_at in merged_tombstones.items()]
                     )
 
-                seen = set()
-                dedup = []
-                for it in self.index.get("snapshots", []):
-                    sid = str(it.get("id") or "")
-                    if not is_valid_snapshot_id(sid) or sid in seen:
-                        continue
-                    seen.add(sid)
-                    dedup.append(it)
-                self.index["snapshots"] = dedup
                 tombstone_map = {
                     item["id"]: item["deleted_at"]
                     for item in self.snapshot_service.normalize_tombstones(self.index.get("tombstones", []))
                 }
-                kept_snapshots = []
+                # One pass dedups (first row per id wins) and applies tombstones; the
+                # dict doubles as the seen-set, with None marking tombstoned ids.
+                kept: Dict[str, Optional[Dict[str, Any]]] = {}
                 for item in self.index.get("snapshots", []):
                     sid = str(item.get("id") or "")
+                    if sid in kept or not is_valid_snapshot_id(sid):
+                        continue
                     deleted_at = tombstone_map.get(sid, "")
-                    snapshot_stamp = self.snapshot_service.snapshot_timestamp(item)
-                    if deleted_at and deleted_at >= snapshot_stamp:
+                    if deleted_at and deleted_at >= self.snapshot_service.snapshot_timestamp(item):
                         safe_snapshot_path(self.snaps_dir, sid).unlink(missing_ok=True)
+                        kept[sid] = None
                         continue
-                    kept_snapshots.append(item)
-                self.index["snapshots"] = kept_snapshots
+                    kept[sid] = item
+                self.index["snapshots"] = [item for item in kept.values() if item is not None]
                 self.index = self.snapshot_service.touch_index(self.index)
-                self._save_json_or_raise(self.index_path, self.index, "index after import")
+                self._save_index_or_raise(self.index_path, self.index, "index after import")
                 self._reset_pagination_and_refresh()
 
             imported_settings = migrate_settings(payload.get("settings", {}))
@@ -248,7 +276,7 @@ class MainWindowSettingsBackupSection:
                     imported_settings["default_root"] = current_root
             imported_settings["auto_backup_last"] = prev_settings.get("auto_backup_last", "")
             imported_settings["onboarding_shown"] = prev_settings.get("onboarding_shown", False)
-            if not self.apply_settings(imported_settings, save=True):
+            if not self.apply_settings(imported_settings, save=True, migrated=True):
                 raise RuntimeError("Failed to apply imported settings.")
             return True
 
@@ -257,16 +285,16 @@ class MainWindowSettingsBackupSection:
 
             try:
                 if data and captured_snapshot_files:
-                    for f in self.snaps_dir.glob("*.json"):
-                        f.unlink(missing_ok=True)
+                    remove_snapshot_files(self.snaps_dir)
+                    self._snap_read_cache.clear()
                     for name, raw in prev_snapshot_files.items():
-                        (self.snaps_dir / name).write_text(raw, encoding="utf-8")
+                        (self.snaps_dir / name).write_bytes(raw)
             except Exception as rollback_exc:
                 log_exc("rollback imported snapshots", rollback_exc)
 
             self.index = prev_index
             self.settings = prev_settings
-            if not save_json(self.index_path, self.index):
+            if not save_index(self.index_path, self.index):
                 LOGGER.error("Failed to rollback index after import failure.")
             if not save_json(self.settings_path, self.settings):
                 LOGGER.error("Failed to rollback settings after import failure.")
@@ -300,14 +328,13 @@ class MainWindowSettingsBackupSection:
             return
         prev_index = copy.deepcopy(self.index)
         prev_settings = copy.deepcopy(self.settings)
-        prev_snapshot_files: Dict[str, str] = {}
+        prev_snapshot_files: Dict[str, bytes] = {}
         captured_snapshot_files = False
         try:
             safety_backup, backup_success, backup_error = self._auto_backup_current()
             if not backup_success:
                 raise RuntimeError(f"Failed to create safety backup before encryption: {backup_error}")
-            for f in self.snaps_dir.glob("*.json"):
-                prev_snapshot_files[f.name] = f.read_text(encoding="utf-8")
+            prev_snapshot_files = read_snapshot_dir(self.snaps_dir)
             captured_snapshot_files = True
             if not self.apply_settings(vals, save=True):
                 return
@@ -326,7 +353,7 @@ class MainWindowSettingsBackupSection:
                 item.update(self._index_entry_from_snapshot_data(persisted, snap_mtime=snapshot_mtime(path)))
                 migrated_count += 1
             self.index = self.snapshot_service.touch_index(self.index)
-            self._save_json_or_raise(self.index_path, self.index, "index after security migration")
+            self._save_index_or_raise(self.index_path, self.index, "index after security migration")
             self._reset_pagination_and_refresh()
             self.statusBar().showMessage(
                 tr("Security migration done").format(count=migrated_count, backup=safety_backup.name),
@@ -336,15 +363,15 @@ class MainWindowSettingsBackupSection:
             log_exc("security migration", exc if isinstance(exc, Exception) else Exception(str(exc)))
             try:
                 if captured_snapshot_files:
-                    for f in self.snaps_dir.glob("*.json"):
-                        f.unlink(missing_ok=True)
+                    remove_snapshot_files(self.snaps_dir)
+                    self._snap_read_cache.clear()
                     for name, raw in prev_snapshot_files.items():
-                        safe_snapshot_path(self.snaps_dir, Path(name).stem).write_text(raw, encoding="utf-8")
+                        safe_snapshot_path(self.snaps_dir, Path(name).stem).write_bytes(raw)
             except Exception as rollback_exc:
                 log_exc("rollback security migration", rollback_exc)
             self.index = prev_index
             self.settings = prev_settings
-            save_json(self.index_path, self.index)
+            save_index(self.index_path, self.index)
             save_json(self.settings_path, self.settings)
             self._reset_pagination_and_refresh()
             QtWidgets.QMessageBox.warning(
@@ -354,6 +381,8 @@ class MainWindowSettingsBackupSection:
             )
 
     def open_settings(self) -> None:
+        # Backup export in the dialog reads index.json from disk.
+        self._flush_index()
         dlg = SettingsDialog(
             self._parent_widget(self),
             self.settings,
@@ -6,20 +6,22 @@ import copy
 import hashlib
 import html
 import json
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from PySide6 import QtCore, QtWidgets
 
-from ctxsnap.app_storage import Snapshot, gen_id, migrate_snapshot, now_iso, safe_snapshot_path, save_json, save_snapshot_file
+from ctxsnap.app_storage import Snapshot, gen_id, now_iso, safe_snapshot_path, save_index, save_json, save_snapshot_file
 from ctxsnap.constants import DEFAULT_TAGS
 from ctxsnap.core.logging import get_logger
+from ctxsnap.core.worker import SnapshotCaptureWorker, SnapshotLoadWorker
 from ctxsnap.i18n import tr
 from ctxsnap.ui.dialogs.snapshot import EditSnapshotDialog, SnapshotDialog
 from ctxsnap.utils import (
     build_search_blob,
+    find_unique_workspace,
     git_state_details,
     list_processes_filtered,
     list_running_apps,
@@ -30,6 +32,9 @@ from ctxsnap.utils import (
 
 LOGGER = get_logger()
 
+# The three TODO slots of a snapshot, all blank.
+_EMPTY_TODOS: Tuple[str, str, str] = ("", "", "")
+
 
 class MainWindowSnapshotCrudSection:
     @staticmethod
@@ -39,10 +44,26 @@ class MainWindowSnapshotCrudSection:
     def snap_path(self, sid: str) -> Path:
         return safe_snapshot_path(self.snaps_dir, sid)
 
-    def _save_json_or_raise(self, path: Path, data: Dict[str, Any], label: str) -> None:
-        if not save_json(path, data):
+    def _save_index_or_raise(self, path: Path, data: Dict[str, Any], label: str) -> None:
+        if not save_index(path, data):
             raise RuntimeError(f"Failed to save {label}: {path}")
 
+    def _schedule_index_flush(self) -> None:
+        """Write the index shortly, coalescing bursts of metadata changes into one save."""
+        self._index_dirty = True
+        self._index_flush_timer.start()
+
+    def _flush_index(self) -> bool:
+        """Write a pending index now; call before anything reads index.json from disk."""
+        self._index_flush_timer.stop()
+        if not self._index_dirty:
+            return True
+        if not save_index(self.index_path, self.index):
+            LOGGER.error("Failed to save index.")
+            return False
+        self._index_dirty = False
+        return True
+
     def _save_snapshot_or_raise(self, path: Path, snap: Dict[str, Any], label: str) -> None:
         if not save_snapshot_file(path, snap):
             raise RuntimeError(f"Failed to save {label}: {path}")
@@ -73,7 +94,14 @@ class MainWindowSnapshotCrudSection:
         return persisted
 
     @staticmethod
-    def _index_entry_from_snapshot_data(snap: Dict[str, Any], *, snap_mtime: float = 0.0) -> Dict[str, Any]:
+    def _index_entry_from_snapshot_data(
+        snap: Dict[str, Any], *, snap_mtime: float = 0.0, search_blob: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Index row for a persisted snapshot.
+
+        Pass the row's current search_blob when only metadata (pin/archive/tags)
+        changed; the blob covers note, todos, files and apps, so it is still valid.
+        """
         return {
             "id": snap.get("id", ""),
             "title": snap.get("title", ""),
@@ -85,7 +113,7 @@ class MainWindowSnapshotCrudSection:
             "tags": snap.get("tags", []),
             "pinned": bool(snap.get("pinned", False)),
             "archived": bool(snap.get("archived", False)),
-            "search_blob": build_search_blob(snap),
+            "search_blob": build_search_blob(snap) if search_blob is None else search_blob,
             "search_blob_mtime": snap_mtime,
             "source": snap.get("source", ""),
             "trigger": snap.get("trigger", ""),
@@ -96,8 +124,8 @@ class MainWindowSnapshotCrudSection:
     @staticmethod
     def _normalized_todos(todos: List[str]) -> List[str]:
         out = [str(t or "").strip() for t in todos[:3]]
-        while len(out) < 3:
-            out.append("")
+        if len(out) < 3:
+            out.extend(_EMPTY_TODOS[len(out):])
         return out
 
     @staticmethod
@@ -182,10 +210,7 @@ class MainWindowSnapshotCrudSection:
 
     def load_snapshot_raw(self, sid: str) -> Optional[Dict[str, Any]]:
         try:
-            p = self.snap_path(sid)
-            if not p.exists():
-                return None
-            return migrate_snapshot(json.loads(p.read_text(encoding="utf-8")))
+            return self._snap_read_cache.read(self.snap_path(sid))
         except (json.JSONDecodeError, Exception) as e:
             log_exc(f"load snapshot {sid}", e)
             return None
@@ -200,10 +225,14 @@ class MainWindowSnapshotCrudSection:
         snap_path = self.snap_path(snap.id)
         prev_index = copy.deepcopy(self.index)
         prev_settings = copy.deepcopy(self.settings)
-        prev_snapshot_raw = snap_path.read_text(encoding="utf-8") if snap_path.exists() else None
+        prev_snapshot_raw = snap_path.read_bytes() if snap_path.exists() else None
 
         try:
-            snap_data = self.snapshot_service.prepare_new_snapshot(asdict(snap))
+            # Shallow field dict: prepare_new_snapshot() deep-copies it anyway, so
+            # asdict()'s recursive copy would only double the work.
+            snap_data = self.snapshot_service.prepare_new_snapshot(
+                {f.name: getattr(snap, f.name) for f in fields(snap)}
+            )
             if not snap_data.get("updated_at"):
                 snap_data["updated_at"] = now_iso()
             snap_data = self._persist_snapshot_or_raise(snap_path, snap_data, f"snapshot {snap.id}")
@@ -213,7 +242,7 @@ class MainWindowSnapshotCrudSection:
                 self._index_entry_from_snapshot_data(snap_data, snap_mtime=snap_mtime),
             )
             self.index = self.snapshot_service.touch_index(self.index)
-            self._save_json_or_raise(self.index_path, self.index, "index")
+            self._save_index_or_raise(self.index_path, self.index, "index")
             return True
         except Exception as exc:
             log_exc("save snapshot", exc if isinstance(exc, Exception) else Exception(str(exc)))
@@ -223,10 +252,10 @@ class MainWindowSnapshotCrudSection:
                 if prev_snapshot_raw is None:
                     snap_path.unlink(missing_ok=True)
                 else:
-                    snap_path.write_text(prev_snapshot_raw, encoding="utf-8")
+                    snap_path.write_bytes(prev_snapshot_raw)
             except Exception as rollback_exc:
                 log_exc("rollback snapshot file", rollback_exc)
-            if not save_json(self.index_path, self.index):
+            if not save_index(self.index_path, self.index):
                 LOGGER.error("Failed to rollback index file after snapshot save error.")
             if not save_json(self.settings_path, self.settings):
                 LOGGER.error("Failed to rollback settings file after snapshot save error.")
@@ -235,6 +264,7 @@ class MainWindowSnapshotCrudSection:
     # ----- selection rendering -----
     def on_select(self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex) -> None:
         if not current.isValid():
+            self._detail_token += 1
             self.detail_title.setText(tr("No snapshot selected"))
             self.detail_meta.setText("")
             self.detail.setText(tr("Select a snapshot to see details."))
@@ -242,14 +272,39 @@ class MainWindowSnapshotCrudSection:
         sid = self.selected_id()
         if not sid:
             return
-        snap = self.load_snapshot(sid)
-        if not snap:
-            self.detail_title.setText("Snapshot file missing")
-            self.detail_meta.setText("")
-            self.detail.setText("")
+        # Title/meta come from the index row right away; the snapshot file is read and
+        # decrypted on the thread pool and fills the detail pane when it arrives.
+        self._detail_token += 1
+        row = self._index_row(sid)
+        cached = self._detail_cache
+        if row is not None and cached is not None and cached[0] == sid and cached[1] == self._detail_stamp(row):
+            self._show_snapshot_detail(sid, cached[2])
+            return
+        if row is not None:
+            self.detail_title.setText(str(row.get("title", sid)))
+            self.detail_meta.setText(self._detail_meta_text(row))
+        self.detail.setText("")
+        worker = SnapshotLoadWorker(sid, self._detail_token, self.load_snapshot)
+        worker.setAutoDelete(False)
+        worker.signals.finished.connect(self._on_detail_snapshot_loaded)
+        self._detail_loads[self._detail_token] = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_detail_snapshot_loaded(self, sid: str, token: int, snap: Optional[Dict[str, Any]]) -> None:
+        self._detail_loads.pop(token, None)
+        # A newer selection (or a cleared one) supersedes this result.
+        if token != self._detail_token or sid != self.selected_id():
             return
+        self._detail_cache = (sid, self._detail_stamp(snap), snap) if snap else None
+        self._show_snapshot_detail(sid, snap)
 
-        self.detail_title.setText(str(snap.get("title", sid)))
+    @staticmethod
+    def _detail_stamp(snap: Dict[str, Any]) -> Tuple[Any, Any]:
+        # Every snapshot write bumps rev/updated_at and copies them into the index row.
+        return snap.get("rev"), snap.get("updated_at")
+
+    @staticmethod
+    def _detail_meta_text(snap: Dict[str, Any]) -> str:
         tags = snap.get("tags", [])
         pinned = "📌" if bool(snap.get("pinned", False)) else ""
         archived = "🗄️ " if bool(snap.get("archived", False)) else ""
@@ -258,9 +313,18 @@ class MainWindowSnapshotCrudSection:
         ws_line = f"  •  workspace: {ws}" if ws else ""
         tag_line = f"  •  tags: {', '.join(str(tag) for tag in tags)}" if tags else ""
         security_line = "  •  [Security Warning]" if security_error else ""
-        self.detail_meta.setText(
-            f"{archived}{pinned}{snap.get('created_at','')}  •  {snap.get('root','')}{ws_line}{tag_line}{security_line}"
-        )
+        return f"{archived}{pinned}{snap.get('created_at','')}  •  {snap.get('root','')}{ws_line}{tag_line}{security_line}"
+
+    def _show_snapshot_detail(self, sid: str, snap: Optional[Dict[str, Any]]) -> None:
+        if not snap:
+            self.detail_title.setText("Snapshot file missing")
+            self.detail_meta.setText("")
+            self.detail.setText("")
+            return
+
+        self.detail_title.setText(str(snap.get("title", sid)))
+        security_error = str(snap.get("_security_error", "") or "").strip()
+        self.detail_meta.setText(self._detail_meta_text(snap))
 
         todos = snap.get("todos", [])
         recent = snap.get("recent_files", [])
@@ -377,7 +441,7 @@ class MainWindowSnapshotCrudSection:
 
         prev_index = copy.deepcopy(self.index)
         snap_path = self.snap_path(sid)
-        prev_snapshot_raw = snap_path.read_text(encoding="utf-8") if snap_path.exists() else None
+        prev_snapshot_raw = snap_path.read_bytes() if snap_path.exists() else None
 
         try:
             # Update snapshot fields
@@ -392,12 +456,11 @@ class MainWindowSnapshotCrudSection:
             snap_mtime = snapshot_mtime(snap_path)
 
             # Update index entry
-            for it in self.index.get("snapshots", []):
-                if it.get("id") == sid:
-                    it.update(self._index_entry_from_snapshot_data(snap, snap_mtime=snap_mtime))
-                    break
+            it = self._index_row(sid)
+            if it is not None:
+                it.update(self._index_entry_from_snapshot_data(snap, snap_mtime=snap_mtime))
             self.index = self.snapshot_service.touch_index(self.index)
-            self._save_json_or_raise(self.index_path, self.index, "index")
+            self._save_index_or_raise(self.index_path, self.index, "index")
         except Exception as exc:
             log_exc("update snapshot", exc if isinstance(exc, Exception) else Exception(str(exc)))
             self.index = prev_index
@@ -405,10 +468,10 @@ class MainWindowSnapshotCrudSection:
                 if prev_snapshot_raw is None:
                     snap_path.unlink(missing_ok=True)
                 else:
-                    snap_path.write_text(prev_snapshot_raw, encoding="utf-8")
+                    snap_path.write_bytes(prev_snapshot_raw)
             except Exception as rollback_exc:
                 log_exc("rollback snapshot update file", rollback_exc)
-            if not save_json(self.index_path, self.index):
+            if not save_index(self.index_path, self.index):
                 LOGGER.error("Failed to rollback index file after update error.")
             QtWidgets.QMessageBox.warning(
                 self._parent_widget(self),
@@ -497,75 +560,95 @@ class MainWindowSnapshotCrudSection:
         ws = workspace.strip()
         if not ws:
             # if exactly one workspace file exists under root, use it
-            wss = list(root_path.glob("*.code-workspace"))
-            if len(wss) == 1:
-                ws = str(wss[0].resolve())
+            ws = find_unique_workspace(root_path)
+        if auto_fingerprint and any(
+            pending[0]["auto_fingerprint"] == auto_fingerprint for pending in self._pending_captures.values()
+        ):
+            # The same auto snapshot is still being captured.
+            return
         sid = gen_id()
-        capture = self.settings.get("capture", {})
+        setting = self.settings.get
+        capture = setting("capture") or {}
         capture_recent = bool(capture.get("recent_files", True))
         capture_processes = bool(capture.get("processes", True))
         capture_running_apps = bool(capture.get("running_apps", True))
-        capture_note = bool(self.settings.get("capture_note", True))
-        capture_todos = bool(self.settings.get("capture_todos", True))
-        background_recent = bool(self.settings.get("recent_files_background", False))
-        recent_files: List[str] = []
-        if capture_recent and not background_recent:
-            recent_files = recent_files_under(
-                root_path,
-                limit=int(self.settings.get("recent_files_limit", 30)),
-                exclude_dirs=self.settings.get("recent_files_exclude", []),
-                include_patterns=self.settings.get("recent_files_include", []),
-                exclude_patterns=self.settings.get("recent_files_exclude_patterns", []),
-                scan_limit=int(self.settings.get("recent_files_scan_limit", 20000)),
-                scan_seconds=float(self.settings.get("recent_files_scan_seconds", 2.0)),
-            )
-        snapshot_note = note if capture_note else ""
-        snapshot_todos = self._normalized_todos(todos) if capture_todos else ["", "", ""]
-        process_keywords = self.settings.get("process_keywords", [])
-        effective_git_state = git_state_data if git_state_data is not None else self._auto_git_state(root_path)
-        processes_data: List[Dict[str, Any]] = (
-            [dict(proc) for proc in list_processes_filtered(process_keywords)]
-            if capture_processes
-            else []
-        )
-        running_apps_data: List[Dict[str, Any]] = (
-            [dict(app) for app in list_running_apps()]
-            if capture_running_apps
-            else []
-        )
-        snap = Snapshot(
-            id=sid,
-            title=title,
-            created_at=now_iso(),
-            root=str(root_path),
-            vscode_workspace=ws,
-            note=snapshot_note,
-            todos=snapshot_todos,
-            tags=self._normalized_tags(tags),
-            pinned=False,
-            archived=False,
-            recent_files=recent_files,
-            processes=processes_data,
-            running_apps=running_apps_data,
-            source=source,
-            trigger=trigger,
-            git_state=effective_git_state or {},
-            auto_fingerprint=auto_fingerprint,
-        )
-        if not self.save_snapshot(snap):
+        capture_note = bool(setting("capture_note", True))
+        capture_todos = bool(setting("capture_todos", True))
+        background_recent = bool(setting("recent_files_background", False))
+        scan_recent = capture_recent and not background_recent
+        recent_kwargs: Dict[str, Any] = {
+            "limit": int(setting("recent_files_limit", 30)),
+            "exclude_dirs": setting("recent_files_exclude", []),
+            "include_patterns": setting("recent_files_include", []),
+            "exclude_patterns": setting("recent_files_exclude_patterns", []),
+            "scan_limit": int(setting("recent_files_scan_limit", 20000)),
+            "scan_seconds": float(setting("recent_files_scan_seconds", 2.0)),
+        }
+        process_keywords = setting("process_keywords", [])
+        auto_git_state = self._auto_git_state
+
+        def capture_fields() -> Dict[str, Any]:
+            # Runs on the thread pool: file scan, process/window enumeration and git.
+            return {
+                "recent_files": recent_files_under(root_path, **recent_kwargs) if scan_recent else [],
+                "processes": (
+                    [dict(proc) for proc in list_processes_filtered(process_keywords)] if capture_processes else []
+                ),
+                "running_apps": [dict(app) for app in list_running_apps()] if capture_running_apps else [],
+                "git_state": (git_state_data if git_state_data is not None else auto_git_state(root_path)) or {},
+            }
+
+        snap_fields: Dict[str, Any] = {
+            "id": sid,
+            "title": title,
+            "created_at": now_iso(),
+            "root": str(root_path),
+            "vscode_workspace": ws,
+            "note": note if capture_note else "",
+            "todos": self._normalized_todos(todos) if capture_todos else list(_EMPTY_TODOS),
+            "tags": self._normalized_tags(tags),
+            "pinned": False,
+            "archived": False,
+            "source": source,
+            "trigger": trigger,
+            "auto_fingerprint": auto_fingerprint,
+        }
+        self._pending_captures[sid] = (snap_fields, root_path, capture_recent and background_recent, status_prefix)
+        worker = SnapshotCaptureWorker(sid, capture_fields)
+        worker.setAutoDelete(False)
+        worker.signals.finished.connect(self._on_snapshot_captured)
+        self._capture_jobs[sid] = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_snapshot_captured(self, sid: str, captured: Optional[Dict[str, Any]]) -> None:
+        self._capture_jobs.pop(sid, None)
+        pending = self._pending_captures.pop(sid, None)
+        if pending is None:
+            return
+        snap_fields, root_path, scan_recent_later, status_prefix = pending
+        if captured is None or not self.save_snapshot(Snapshot(**snap_fields, **captured)):
             QtWidgets.QMessageBox.warning(
                 self._parent_widget(self),
                 tr("Error"),
                 f"Failed to save snapshot: {sid}",
             )
             return
-        if capture_recent and background_recent:
+        if scan_recent_later:
             self._start_recent_files_scan(sid, root_path)
         self._reset_pagination_and_refresh()
         if self.list_model.rowCount() > 0:
             self.listw.setCurrentIndex(self.list_model.index(0, 0))
         self.statusBar().showMessage(f"{status_prefix}: {sid}", 3500)
 
+    def _finish_pending_captures(self, timeout_ms: int = 5000) -> None:
+        """Wait for in-flight captures and save them now; called when quitting."""
+        if not self._pending_captures:
+            return
+        if not QtCore.QThreadPool.globalInstance().waitForDone(timeout_ms):
+            LOGGER.warning("Snapshot capture still running at exit: %s", ", ".join(self._pending_captures))
+        # The finished signals are queued to this object; deliver them so each capture is saved.
+        QtCore.QCoreApplication.sendPostedEvents(self, QtCore.QEvent.Type.MetaCall)
+
     def _update_snapshot_meta(
         self,
         sid: str,
@@ -593,12 +676,16 @@ class MainWindowSnapshotCrudSection:
             snap_mtime = snapshot_mtime(snap_path)
 
             # update index
-            for it in self.index.get("snapshots", []):
-                if it.get("id") == sid:
-                    it.update(self._index_entry_from_snapshot_data(snap, snap_mtime=snap_mtime))
-                    break
+            it = self._index_row(sid)
+            if it is not None:
+                # pinned/archived/tags are not part of the search blob; keep the row's copy.
+                it.update(
+                    self._index_entry_from_snapshot_data(
+                        snap, snap_mtime=snap_mtime, search_blob=it.get("search_blob") or None
+                    )
+                )
             self.index = self.snapshot_service.touch_index(self.index)
-            self._save_json_or_raise(self.index_path, self.index, "index")
+            self._schedule_index_flush()
         except Exception as exc:
             log_exc("update snapshot meta", exc if isinstance(exc, Exception) else Exception(str(exc)))
             self.index = prev_index
@@ -606,7 +693,7 @@ class MainWindowSnapshotCrudSection:
                 self._save_snapshot_or_raise(snap_path, prev_snap, f"snapshot meta rollback {sid}")
             except Exception as rollback_exc:
                 log_exc("rollback snapshot meta file", rollback_exc)
-            if not save_json(self.index_path, self.index):
+            if not save_index(self.index_path, self.index):
                 LOGGER.error("Failed to rollback index file after meta update error.")
             QtWidgets.QMessageBox.warning(
                 self._parent_widget(self),
@@ -638,18 +725,29 @@ class MainWindowSnapshotCrudSection:
         self._reset_pagination_and_refresh()
         self.statusBar().showMessage("Archived." if new_state else "Unarchived.", 2000)
 
+    def _delete_confirm_box(self) -> QtWidgets.QMessageBox:
+        box = self._confirm_box
+        if box is None:
+            box = QtWidgets.QMessageBox(self._parent_widget(self))
+            box.setIcon(QtWidgets.QMessageBox.Icon.Question)
+            box.setStandardButtons(
+                QtWidgets.QMessageBox.StandardButton.Yes
+                | QtWidgets.QMessageBox.StandardButton.No
+            )
+            self._confirm_box = box
+        # Texts are set per use so a language change is picked up.
+        box.setWindowTitle(tr("Delete snapshot?"))
+        box.setText(tr("Delete confirm msg"))
+        return box
+
     def delete_selected(self) -> None:
         sid = self.selected_id()
         if not sid:
             return
-        r = QtWidgets.QMessageBox.question(
-            self._parent_widget(self),
-            tr("Delete snapshot?"),
-            tr("Delete confirm msg"),
-            QtWidgets.QMessageBox.StandardButton.Yes
-            | QtWidgets.QMessageBox.StandardButton.No,
-        )
-        if r != QtWidgets.QMessageBox.StandardButton.Yes:
+        box = self._delete_confirm_box()
+        box.exec()
+        clicked = box.clickedButton()
+        if clicked is None or box.standardButton(clicked) != QtWidgets.QMessageBox.StandardButton.Yes:
             return
         p = self.snap_path(sid)
         if p.exists():
@@ -663,16 +761,10 @@ class MainWindowSnapshotCrudSection:
                     tr("Failed to delete snapshot file") + f": {e}"
                 )
                 return
-        self.index["snapshots"] = [x for x in self.index.get("snapshots", []) if x.get("id") != sid]
+        self._remove_index_rows(sid)
         self.index = self.snapshot_service.upsert_tombstone(self.index, sid)
         self.index = self.snapshot_service.touch_index(self.index)
-        if not save_json(self.index_path, self.index):
-            QtWidgets.QMessageBox.warning(
-                self._parent_widget(self),
-                tr("Error"),
-                "Failed to save index after delete.",
-            )
-            return
+        self._schedule_index_flush()
         self._reset_pagination_and_refresh()
         if self.list_model.rowCount() > 0:
             self.listw.setCurrentIndex(self.list_model.index(0, 0))
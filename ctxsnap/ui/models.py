@@ -1,10 +1,31 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 from PySide6 import QtCore, QtGui, QtWidgets
 
 
 class SnapshotItemDelegate(QtWidgets.QStyledItemDelegate):
     """HTML을 지원하는 QListView 커스텀 카드 델리게이트"""
+
+    _DOC_CACHE_LIMIT = 512
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        # (html, 폭, 폰트) -> 레이아웃이 끝난 QTextDocument. 페인트마다 HTML 파싱/레이아웃을 반복하지 않는다.
+        self._docs: Dict[Tuple[str, int, str], QtGui.QTextDocument] = {}
+
+    def _document(self, html: str, width: int, font: QtGui.QFont) -> QtGui.QTextDocument:
+        key = (html, width, font.key())
+        doc = self._docs.get(key)
+        if doc is None:
+            if len(self._docs) >= self._DOC_CACHE_LIMIT:
+                self._docs.clear()
+            doc = QtGui.QTextDocument()
+            doc.setDefaultFont(font)
+            doc.setHtml(html)
+            doc.setTextWidth(float(width))
+            self._docs[key] = doc
+        return doc
+
     def paint(
         self,
         painter: QtGui.QPainter,
@@ -31,11 +52,12 @@ class SnapshotItemDelegate(QtWidgets.QStyledItemDelegate):
 
         painter.save()
         
-        # HTML 텍스트 문서 생성
-        doc = QtGui.QTextDocument()
-        doc.setDefaultFont(options_any.font)
-        doc.setHtml(str(index.data(QtCore.Qt.ItemDataRole.DisplayRole) or ""))
-        doc.setTextWidth(float(options_any.rect.width()))
+        # HTML 텍스트 문서 (캐시)
+        doc = self._document(
+            str(index.data(QtCore.Qt.ItemDataRole.DisplayRole) or ""),
+            int(options_any.rect.width()),
+            options_any.font,
+        )
         
         # 렌더링 위치 설정
         painter.translate(options_any.rect.left(), options_any.rect.top())
@@ -58,87 +80,176 @@ class SnapshotItemDelegate(QtWidgets.QStyledItemDelegate):
         self.initStyleOption(options, index)
         options_any = cast(Any, options)
         
-        doc = QtGui.QTextDocument()
-        doc.setDefaultFont(options_any.font)
-        doc.setHtml(str(index.data(QtCore.Qt.ItemDataRole.DisplayRole) or ""))
         rect_width = int(options_any.rect.width())
-        doc.setTextWidth(float(rect_width if rect_width > 0 else 300))
+        doc = self._document(
+            str(index.data(QtCore.Qt.ItemDataRole.DisplayRole) or ""),
+            rect_width if rect_width > 0 else 300,
+            options_any.font,
+        )
         
         return QtCore.QSize(int(doc.idealWidth()), int(doc.size().height()))
 
 
+_DISPLAY_ROLE = int(QtCore.Qt.ItemDataRole.DisplayRole)
+_ID_ROLE = int(QtCore.Qt.ItemDataRole.UserRole)
+_ITEM_ROLE = int(QtCore.Qt.ItemDataRole.UserRole) + 1
+
+
+def _is_subsequence(short: List[str], long: List[str]) -> bool:
+    it = iter(long)
+    return all(sid in it for sid in short)
+
+
+def _runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """오름차순 행 번호를 연속 구간 (first, last) 목록으로 묶는다."""
+    runs: List[Tuple[int, int]] = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+
 class SnapshotListModel(QtCore.QAbstractListModel):
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         super().__init__(parent)
         self._items: List[Dict[str, Any]] = []
-        self._display_cache: Dict[str, str] = {}
+        # 행 인덱스로 바로 접근하는 병렬 리스트 (sid 해시 조회 없이 data() 처리)
+        self._ids: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._display_cache: List[str] = []
+        # role -> 열(column) 리스트. data()는 dict 조회 한 번 + 리스트 인덱싱으로 끝난다.
+        self._columns: Dict[int, List[Any]] = {}
 
     def set_items(self, items: List[Dict[str, Any]]) -> None:
+        ids = [str(it.get("id") or "") for it in items]
+        # 표시 문자열은 페인트 경로가 아닌 여기서 한 번에 만든다.
+        fmt = self._format_display
+        display = [fmt(it) for it in items]
+        old_ids = self._ids
+        if len(set(ids)) == len(ids) and len(set(old_ids)) == len(old_ids):
+            # 검색어 입력처럼 행이 빠지거나 더해지기만 하는 경우 리셋 없이 행 단위로 반영한다.
+            # (리셋은 모든 행 높이를 다시 계산하고 선택을 잃는다.)
+            if ids == old_ids or self._apply_row_diff(ids, items, display):
+                self._replace_rows(items, ids, display)
+                return
         self.beginResetModel()
-        self._items = items
-        self._display_cache.clear()
+        self._replace_rows(items, ids, display, emit=False)
         self.endResetModel()
 
+    def _replace_rows(
+        self,
+        items: List[Dict[str, Any]],
+        ids: List[str],
+        display: List[str],
+        *,
+        emit: bool = True,
+    ) -> None:
+        """행 구성이 ids와 같아진 뒤 열 데이터를 교체하고, 바뀐 표시 문자열만 알린다."""
+        old_display = self._display_cache
+        # 다음 diff가 리스트를 제자리 수정하므로 호출자의 리스트는 복사해 둔다.
+        items = list(items)
+        self._items = items
+        self._ids = ids
+        self._row_by_id = {sid: row for row, sid in enumerate(ids)}
+        self._display_cache = display
+        self._columns = {
+            _DISPLAY_ROLE: display,
+            _ID_ROLE: ids,
+            _ITEM_ROLE: items,
+        }
+        if not emit:
+            return
+        changed = [row for row, text in enumerate(display) if old_display[row] != text]
+        if changed:
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], 0))
+
+    def _apply_row_diff(self, ids: List[str], items: List[Dict[str, Any]], display: List[str]) -> bool:
+        """제거만 또는 삽입만으로 ids에 도달할 수 있으면 해당 행 신호를 내고 True."""
+        old_ids = self._ids
+        parent = QtCore.QModelIndex()
+        if len(ids) < len(old_ids) and _is_subsequence(ids, old_ids):
+            keep = set(ids)
+            runs = _runs([row for row, sid in enumerate(old_ids) if sid not in keep])
+            # 뒤에서부터 지워야 앞쪽 행 번호가 유지된다.
+            for first, last in reversed(runs):
+                self.beginRemoveRows(parent, first, last)
+                for column in (self._items, self._ids, self._display_cache):
+                    del column[first:last + 1]
+                self.endRemoveRows()
+            return True
+        if len(ids) > len(old_ids) and _is_subsequence(old_ids, ids):
+            existing = set(old_ids)
+            runs = _runs([row for row, sid in enumerate(ids) if sid not in existing])
+            # 앞에서부터 넣으면 새 목록의 행 번호가 그대로 삽입 위치가 된다.
+            for first, last in runs:
+                self.beginInsertRows(parent, first, last)
+                self._items[first:first] = items[first:last + 1]
+                self._ids[first:first] = ids[first:last + 1]
+                self._display_cache[first:first] = display[first:last + 1]
+                self.endInsertRows()
+            return True
+        return False
+
+    def invalidate_row(self, row: int) -> None:
+        """Rebuild one row's display string after its item dict was mutated."""
+        if row < 0 or row >= len(self._items):
+            return
+        self._display_cache[row] = self._format_display(self._items[row])
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+
     def rowCount(
         self,
         parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = QtCore.QModelIndex(),
     ) -> int:
         if parent.isValid():
             return 0
-        return len(self._items)
+        return len(self._ids)
 
     def id_for_index(self, index: QtCore.QModelIndex) -> Optional[str]:
         if not index.isValid():
             return None
         row = index.row()
-        if row < 0 or row >= len(self._items):
+        if row < 0 or row >= len(self._ids):
             return None
-        return str(self._items[row].get("id") or "")
+        return self._ids[row]
+
+    def row_for_id(self, sid: str) -> int:
+        return self._row_by_id.get(sid, -1)
+
+    @staticmethod
+    def _format_display(item: Dict[str, Any]) -> str:
+        title = item.get("title", "")
+        root = item.get("root", "")
+        created = item.get("created_at", "")
+        tags = item.get("tags", []) or []
+        pin = "📌&nbsp;" if bool(item.get("pinned", False)) else ""
+        archived = "🗄️&nbsp;" if bool(item.get("archived", False)) else ""
+
+        # 태그 배지 HTML 디자인
+        tag_html = ""
+        for tag in tags:
+            tag_html += f'<span style="background-color: #2a2a40; color: #a78bfa; padding: 2px 6px; border-radius: 4px; font-size: 11px;">{tag}</span>&nbsp;'
+
+        # 메인 타이틀
+        title_html = f'<span style="font-size: 14px; font-weight: bold; color: #f0f0f5;">{title}</span>'
+
+        # 하위 정보
+        sub_html = f'<span style="font-size: 12px; color: #9090a8;">{root} &bull; {created}</span>'
+
+        return f"{pin}{archived}{tag_html}<br>{title_html}<br>{sub_html}"
 
     def data(
         self,
         index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
-        role: int = int(QtCore.Qt.ItemDataRole.DisplayRole),
+        role: int = _DISPLAY_ROLE,
     ) -> Any:
-        if not index.isValid():
+        column = self._columns.get(int(role))
+        if column is None or not index.isValid():
             return None
         row = index.row()
-        if row < 0 or row >= len(self._items):
+        if row < 0 or row >= len(column):
             return None
-        
-        item = self._items[row]
-        sid = str(item.get("id") or "")
-        if role == int(QtCore.Qt.ItemDataRole.DisplayRole):
-            cached = self._display_cache.get(sid)
-            if cached is not None:
-                return cached
-            title = item.get("title", "")
-            root = item.get("root", "")
-            created = item.get("created_at", "")
-            tags = item.get("tags", []) or []
-            pin = "📌&nbsp;" if bool(item.get("pinned", False)) else ""
-            archived = "🗄️&nbsp;" if bool(item.get("archived", False)) else ""
-            
-            # 태그 배지 HTML 디자인
-            tag_html = ""
-            for tag in tags:
-                tag_html += f'<span style="background-color: #2a2a40; color: #a78bfa; padding: 2px 6px; border-radius: 4px; font-size: 11px;">{tag}</span>&nbsp;'
-            
-            # 메인 타이틀
-            title_html = f'<span style="font-size: 14px; font-weight: bold; color: #f0f0f5;">{title}</span>'
-            
-            # 하위 정보
-            sub_html = f'<span style="font-size: 12px; color: #9090a8;">{root} &bull; {created}</span>'
-            
-            html = f"{pin}{archived}{tag_html}<br>{title_html}<br>{sub_html}"
-            
-            self._display_cache[sid] = html
-            return html
-            
-        if role == int(QtCore.Qt.ItemDataRole.UserRole):
-            return sid
-        
-        if role == int(QtCore.Qt.ItemDataRole.UserRole) + 1:
-            return item
-            
-        return None
+        return column[row]
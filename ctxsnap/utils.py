@@ -1,25 +1,39 @@
 from __future__ import annotations
 
+import contextlib
 import ctypes
 import fnmatch
+import functools
+import heapq
 import logging
 import os
+import re
 import subprocess
 import shutil
 import sys
 import time
+from ctypes import wintypes
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict
 
 import psutil
-from PySide6 import QtWidgets
 
 from ctxsnap.constants import APP_NAME, DEFAULT_PROCESS_KEYWORDS
 from ctxsnap.i18n import tr
 
+if TYPE_CHECKING:  # Qt is only needed for restore_running_apps()'s failure notice
+    from PySide6 import QtWidgets
+
 LOGGER = logging.getLogger(APP_NAME)
 
+# list_running_apps() result cache (avoids repeated EnumWindows + psutil lookups)
+_RUNNING_APPS_TTL = 0.5
+
+# Fast path for the now_iso() format (%Y-%m-%dT%H:%M:%S)
+_DT_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\Z")
+_running_apps_cache: Optional[Tuple[float, List["RunningAppInfo"]]] = None
+
 
 class ProcessInfo(TypedDict):
     pid: int
@@ -64,36 +78,167 @@ def safe_parse_datetime(s: str) -> Optional[datetime]:
     if not s:
         return None
     try:
+        if _DT_RE.match(s):
+            # now_iso() shape; the regex rules out offsets, so the result stays naive.
+            return datetime.fromisoformat(s)
         return datetime.strptime(s, "%Y-%m-%dT%H:%M:%S")
     except ValueError:
         return None
 
 
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+_FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+_FIND_EX_INFO_BASIC = 1
+_FIND_EX_SEARCH_NAME_MATCH = 0
+_FIND_FIRST_EX_LARGE_FETCH = 2
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_NO_MORE_FILES = 18
+_FILETIME_EPOCH_OFFSET = 116444736000000000  # 1601-01-01 -> 1970-01-01 (100ns units)
+_kernel32_find: Optional[Any] = None
+
+
+class _FindEntry:
+    """DirEntry-compatible view over WIN32_FIND_DATAW (mtime comes with the listing)."""
+
+    __slots__ = ("name", "path", "_attrs", "st_mtime")
+
+    def __init__(self, name: str, path: str, attrs: int, mtime: float) -> None:
+        self.name = name
+        self.path = path
+        self._attrs = attrs
+        self.st_mtime = mtime
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        if not self._attrs & _FILE_ATTRIBUTE_DIRECTORY:
+            return False
+        return follow_symlinks or not self._attrs & _FILE_ATTRIBUTE_REPARSE_POINT
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return not self._attrs & _FILE_ATTRIBUTE_DIRECTORY
+
+    def stat(self, *, follow_symlinks: bool = True) -> "_FindEntry":
+        return self
+
+
+def _find_api() -> Optional[Any]:
+    global _kernel32_find
+    if _kernel32_find is None and hasattr(ctypes, "windll"):
+        try:
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            kernel32.FindFirstFileExW.restype = wintypes.HANDLE
+            kernel32.FindFirstFileExW.argtypes = [
+                wintypes.LPCWSTR,
+                ctypes.c_int,
+                ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                ctypes.c_int,
+                ctypes.c_void_p,
+                wintypes.DWORD,
+            ]
+            kernel32.FindNextFileW.restype = wintypes.BOOL
+            kernel32.FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+            kernel32.FindClose.restype = wintypes.BOOL
+            kernel32.FindClose.argtypes = [wintypes.HANDLE]
+            _kernel32_find = kernel32
+        except (AttributeError, OSError):
+            _kernel32_find = None
+    return _kernel32_find
+
+
+def _iter_find_data(kernel32: Any, handle: int, data: Any, dir_path: str) -> Iterator[_FindEntry]:
+    sep = "" if dir_path.endswith(("\\", "/")) else "\\"
+    while True:
+        name = data.cFileName
+        if name != "." and name != "..":
+            ft = data.ftLastWriteTime
+            mtime = (((ft.dwHighDateTime << 32) | ft.dwLowDateTime) - _FILETIME_EPOCH_OFFSET) / 10_000_000
+            yield _FindEntry(name, dir_path + sep + name, data.dwFileAttributes, mtime)
+        if not kernel32.FindNextFileW(handle, ctypes.byref(data)):
+            err = ctypes.get_last_error()
+            if err != _ERROR_NO_MORE_FILES:
+                raise ctypes.WinError(err)
+            return
+
+
+@contextlib.contextmanager
+def _scandir(dir_path: str) -> Iterator[Any]:
+    """os.scandir drop-in; on Windows uses FindFirstFileExW with FIND_FIRST_EX_LARGE_FETCH."""
+    kernel32 = _find_api()
+    if kernel32 is None:
+        with os.scandir(dir_path) as entries:
+            yield entries
+        return
+    data = wintypes.WIN32_FIND_DATAW()
+    handle = kernel32.FindFirstFileExW(
+        os.path.join(dir_path, "*"),
+        _FIND_EX_INFO_BASIC,
+        ctypes.byref(data),
+        _FIND_EX_SEARCH_NAME_MATCH,
+        None,
+        _FIND_FIRST_EX_LARGE_FETCH,
+    )
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        err = ctypes.get_last_error()
+        if err == _ERROR_FILE_NOT_FOUND:
+            yield iter(())
+            return
+        raise ctypes.WinError(err)
+    try:
+        yield _iter_find_data(kernel32, handle, data, dir_path)
+    finally:
+        kernel32.FindClose(handle)
+
+
+def compile_glob_patterns(patterns: Optional[Iterable[str]]) -> Optional["re.Pattern[str]"]:
+    """Fold case-insensitive glob patterns into one alternation regex (None when empty)."""
+    globs = tuple(p.strip().lower() for p in (patterns or []) if p.strip())
+    if not globs:
+        return None
+    return _compile_globs(globs)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_globs(globs: Tuple[str, ...]) -> "re.Pattern[str]":
+    # Keyed by the normalized pattern tuple: every scan with unchanged settings reuses the regex.
+    return re.compile("|".join(f"(?:{fnmatch.translate(pat)})" for pat in globs))
+
+
 def recent_files_under(
     root: Path,
     limit: int = 30,
     *,
-    exclude_dirs: Optional[List[str]] = None,
+    exclude_dirs: Optional[Iterable[str]] = None,
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
     scan_limit: int = 20000,
     scan_seconds: float = 2.0,
+    include_re: Optional["re.Pattern[str]"] = None,
+    exclude_re: Optional["re.Pattern[str]"] = None,
 ) -> List[str]:
     if not root.exists():
         return []
 
-    exclude_dirs_set = {d.lower() for d in (exclude_dirs or [])}
-    include_globs = [p.lower() for p in (include_patterns or []) if p.strip()]
-    exclude_globs = [p.lower() for p in (exclude_patterns or []) if p.strip()]
+    exclude_dirs_set = frozenset(d.lower() for d in (exclude_dirs or ()))
+    # Precompiled include_re/exclude_re take precedence over the pattern lists.
+    if include_re is None:
+        include_re = compile_glob_patterns(include_patterns)
+    if exclude_re is None:
+        exclude_re = compile_glob_patterns(exclude_patterns)
+    # Skip the per-entry lower() when there are no patterns or excluded dirs.
+    need_name_lc = bool(exclude_dirs_set or include_re is not None or exclude_re is not None)
 
-    files: List[Tuple[float, Path]] = []
-    start_time = time.monotonic()
+    if limit <= 0:
+        return []
+    # Min-heap holding only the newest `limit` files instead of sorting everything
+    top: List[Tuple[float, str]] = []
+    monotonic = time.monotonic
+    start_time = monotonic()
     scanned_count = 0
+    entry_count = 0
     truncated_reason: Optional[str] = None
 
     # Stack-based recursive scan (iterative) to avoid recursion depth limits
-    # Stack items: (Path object)
-    stack = [root]
+    # Stack items: directory path strings (Path objects are only built for the final results)
+    stack: List[str] = [str(root)]
 
     while stack:
         if truncated_reason:
@@ -102,8 +247,8 @@ def recent_files_under(
         current_dir = stack.pop()
         
         try:
-            # os.scandir is faster than Path.iterdir or rglob as it yields DirEntry objects with cached stat
-            with os.scandir(current_dir) as entries:
+            # _scandir yields DirEntry-like objects with cached stat (large-fetch FindFirstFileExW on Windows)
+            with _scandir(current_dir) as entries:
                 for entry in entries:
                     if truncated_reason:
                         break
@@ -112,16 +257,19 @@ def recent_files_under(
                     if scanned_count >= scan_limit:
                         truncated_reason = "scan_limit"
                         break
-                    if time.monotonic() - start_time >= scan_seconds:
+                    # Only check the clock every 256 entries.
+                    entry_count += 1
+                    if not entry_count & 0xFF and monotonic() - start_time >= scan_seconds:
                         truncated_reason = "scan_seconds"
                         break
 
-                    entry_name_lower = entry.name.lower()
+                    entry_name = entry.name
+                    entry_name_lower = entry_name.lower() if need_name_lc else entry_name
 
                     # 1. Directory handling (Pruning)
                     if entry.is_dir(follow_symlinks=False):
                         # Skip hidden dirs if implicit rule (checking "." prefix)
-                        if entry.name.startswith("."):
+                        if entry_name.startswith("."):
                             continue
                         # Skip excluded dirs
                         if entry_name_lower in exclude_dirs_set:
@@ -129,10 +277,10 @@ def recent_files_under(
                         # Skip if dir matches exclude patterns (broad check)
                         # (Optimized: Checking directory name against globs might be aggressive, 
                         # but standard usage usually implies excluding folder names)
-                        if exclude_globs and any(fnmatch.fnmatch(entry_name_lower, pat) for pat in exclude_globs):
+                        if exclude_re is not None and exclude_re.match(entry_name_lower):
                             continue
                         
-                        stack.append(Path(entry.path))
+                        stack.append(entry.path)
                         continue
                     
                     # 2. File handling
@@ -140,23 +288,26 @@ def recent_files_under(
                         continue
 
                     # Skip hidden files
-                    if entry.name.startswith("."):
+                    if entry_name.startswith("."):
                         continue
                     
                     scanned_count += 1
                     
                     # File-level Excludes
-                    if exclude_globs and any(fnmatch.fnmatch(entry_name_lower, pat) for pat in exclude_globs):
+                    if exclude_re is not None and exclude_re.match(entry_name_lower):
                         continue
                         
                     # File-level Includes (if specified, must match at least one)
-                    if include_globs and not any(fnmatch.fnmatch(entry_name_lower, pat) for pat in include_globs):
+                    if include_re is not None and not include_re.match(entry_name_lower):
                         continue
 
                     try:
                         # entry.stat() is cached on Windows for os.scandir
-                        mtime = entry.stat().st_mtime
-                        files.append((mtime, Path(entry.path)))
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                        if len(top) < limit:
+                            heapq.heappush(top, (mtime, entry.path))
+                        elif mtime > top[0][0]:
+                            heapq.heapreplace(top, (mtime, entry.path))
                     except OSError:
                         pass
                         
@@ -173,43 +324,46 @@ def recent_files_under(
             scan_seconds,
         )
 
-    files.sort(key=lambda x: x[0], reverse=True)
-    return [str(p.resolve()) for _, p in files[:limit]]
+    top.sort(key=lambda x: x[0], reverse=True)
+    return [str(Path(p).resolve()) for _, p in top]
 
 
 def list_processes_filtered(keywords: Optional[List[str]] = None) -> List[ProcessInfo]:
     kws = keywords or DEFAULT_PROCESS_KEYWORDS
-    out: List[ProcessInfo] = []
+    seen: set[Tuple[str, str]] = set()
+    uniq: List[ProcessInfo] = []
     for proc in psutil.process_iter(attrs=["pid", "name", "exe", "cmdline"]):
         try:
-            name = (proc.info.get("name") or "").lower()
-            exe = (proc.info.get("exe") or "").lower()
-            hay = f"{name} {exe}"
-            if any(k in hay for k in kws):
-                pid = _to_int(proc.info.get("pid"), 0)
-                raw_name = str(proc.info.get("name") or "")
-                raw_exe = str(proc.info.get("exe") or "")
-                cmdline = _to_str_list(proc.info.get("cmdline"), max_items=6)
-                out.append({
-                    "pid": pid,
-                    "name": raw_name,
-                    "exe": raw_exe,
-                    "cmdline": cmdline,
-                })
+            raw_name = str(proc.info.get("name") or "")
+            raw_exe = str(proc.info.get("exe") or "")
+            hay = f"{raw_name.lower()} {raw_exe.lower()}"
+            if not any(k in hay for k in kws):
+                continue
+            key = (raw_name, raw_exe)
+            if key in seen:
+                continue
+            seen.add(key)
+            uniq.append({
+                "pid": _to_int(proc.info.get("pid"), 0),
+                "name": raw_name,
+                "exe": raw_exe,
+                "cmdline": _to_str_list(proc.info.get("cmdline"), max_items=6),
+            })
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
-    seen: set[Tuple[str, str]] = set()
-    uniq: List[ProcessInfo] = []
-    for p in out:
-        key = (p.get("name") or "", p.get("exe") or "")
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append(p)
     return uniq
 
 
+def _copy_running_apps(apps: List[RunningAppInfo]) -> List[RunningAppInfo]:
+    return [{**app, "cmdline": list(app["cmdline"])} for app in apps]  # type: ignore[typeddict-item]
+
+
 def list_running_apps() -> List[RunningAppInfo]:
+    global _running_apps_cache
+    cached = _running_apps_cache
+    if cached is not None and time.monotonic() - cached[0] < _RUNNING_APPS_TTL:
+        return _copy_running_apps(cached[1])
+
     user32 = ctypes.windll.user32
     get_window_text_length = user32.GetWindowTextLengthW
     get_window_text = user32.GetWindowTextW
@@ -218,6 +372,8 @@ def list_running_apps() -> List[RunningAppInfo]:
 
     results: List[RunningAppInfo] = []
     seen: set[Tuple[str, str]] = set()
+    # Most window titles fit in 512 chars: reuse one buffer and grow it only when needed.
+    title_buf = [ctypes.create_unicode_buffer(512)]
 
     @ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
     def enum_proc(hwnd: int, lparam: int) -> bool:
@@ -226,8 +382,10 @@ def list_running_apps() -> List[RunningAppInfo]:
         length = get_window_text_length(hwnd)
         if length <= 0:
             return True
-        buf = ctypes.create_unicode_buffer(length + 1)
-        get_window_text(hwnd, buf, length + 1)
+        buf = title_buf[0]
+        if length + 1 > len(buf):
+            buf = title_buf[0] = ctypes.create_unicode_buffer(length + 1)
+        get_window_text(hwnd, buf, len(buf))
         title = buf.value.strip()
         if not title:
             return True
@@ -258,6 +416,7 @@ def list_running_apps() -> List[RunningAppInfo]:
         return True
 
     user32.EnumWindows(enum_proc, 0)
+    _running_apps_cache = (time.monotonic(), _copy_running_apps(results))
     return results
 
 
@@ -266,13 +425,22 @@ def restore_running_apps(apps: List[Dict[str, object]], parent: Optional[QtWidge
         return []
     running: set[str] = set()
     failures: List[str] = []
-    for proc in psutil.process_iter(attrs=["exe"]):
-        try:
-            exe = (proc.info.get("exe") or "").lower()
-            if exe:
-                running.add(exe)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    # name() is cheap; only resolve exe() for processes whose name matches a target.
+    wanted_names = {
+        os.path.basename(str(app.get("exe") or "").strip()).lower()
+        for app in apps
+        if str(app.get("exe") or "").strip()
+    }
+    if wanted_names:
+        for proc in psutil.process_iter(attrs=["name"]):
+            try:
+                if (proc.info.get("name") or "").lower() not in wanted_names:
+                    continue
+                exe = (proc.exe() or "").lower()
+                if exe:
+                    running.add(exe)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
     for app in apps:
         exe = str(app.get("exe") or "").strip()
         cmdline = _to_str_list(app.get("cmdline"))
@@ -298,6 +466,8 @@ def restore_running_apps(apps: List[Dict[str, object]], parent: Optional[QtWidge
             LOGGER.exception("restore running app")
             failures.append(f"{app.get('name') or app.get('exe') or 'unknown'} (error)")
     if failures:
+        from PySide6 import QtWidgets
+
         QtWidgets.QMessageBox.information(
             parent,
             tr("Restore"),
@@ -306,27 +476,56 @@ def restore_running_apps(apps: List[Dict[str, object]], parent: Optional[QtWidge
     return failures
 
 
-def build_search_blob(snap: Dict[str, object]) -> str:
-    parts: List[str] = []
-    parts.append(str(snap.get("note", "") or ""))
-    parts.extend(_to_str_list(snap.get("todos")))
-    parts.extend(_to_str_list(snap.get("recent_files")))
+def _search_blob_parts(snap: Dict[str, object]) -> Iterator[str]:
+    yield str(snap.get("note", "") or "")
+    for key in ("todos", "recent_files"):
+        values = snap.get(key)
+        if isinstance(values, list):
+            for item in values:
+                text = str(item)
+                if text.strip():
+                    yield text
 
     processes = snap.get("processes")
     if isinstance(processes, list):
         for proc in processes:
             if isinstance(proc, dict):
-                parts.append(str(proc.get("name", "")))
-                parts.append(str(proc.get("exe", "")))
+                yield str(proc.get("name", ""))
+                yield str(proc.get("exe", ""))
 
     running_apps = snap.get("running_apps")
     if isinstance(running_apps, list):
         for app in running_apps:
             if isinstance(app, dict):
-                parts.append(str(app.get("name", "")))
+                yield str(app.get("name", ""))
+
+
+def build_search_blob(snap: Dict[str, object]) -> str:
+    # Join once without an intermediate list and lower() the final string once.
+    return " ".join(filter(None, _search_blob_parts(snap))).lower()
+
 
-    return " ".join(p for p in parts if p).lower()
 
+def find_unique_workspace(root: Path) -> str:
+    """Resolved path of the only *.code-workspace file directly in root, else "".
+
+    One scandir pass that stops at the second match; names are compared with
+    os.path.normcase, so the match is case-insensitive on Windows like glob().
+    """
+    found = ""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not os.path.normcase(entry.name).endswith(".code-workspace"):
+                    continue
+                if not entry.is_file():
+                    continue
+                if found:
+                    return ""
+                found = entry.path
+    except OSError:
+        return ""
+    return str(Path(found).resolve()) if found else ""
 
 
 def snapshot_mtime(path: Path) -> float:
@@ -336,60 +535,141 @@ def snapshot_mtime(path: Path) -> float:
         return 0.0
 
 
-def git_title_suggestion(root: Path) -> Optional[str]:
-    git = shutil.which("git")
-    if not git:
+# Keep git from flashing a console window on Windows.
+_GIT_CREATIONFLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+# Roots known to be inside a work tree (positive results only, so a later `git init` is still seen)
+_GIT_ROOTS: set[str] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _git_exe() -> Optional[str]:
+    """Path to the git executable, resolved once."""
+    return shutil.which("git")
+
+
+def _has_git(root: Path) -> bool:
+    """Return True if root or one of its parents has a .git entry (dir or file)."""
+    key = os.path.abspath(str(root))
+    if key in _GIT_ROOTS:
+        return True
+    current = key
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            _GIT_ROOTS.add(key)
+            return True
+        parent = os.path.dirname(current)
+        if parent == current:
+            return False
+        current = parent
+
+
+def _run_git(git: str, root: Path, *args: str) -> str:
+    # Read bytes and decode as UTF-8 (text=True would use the locale encoding, e.g. cp949)
+    out = subprocess.check_output(
+        [git, "-C", str(root), *args],
+        stderr=subprocess.DEVNULL,
+        timeout=5,
+        creationflags=_GIT_CREATIONFLAGS,
+    )
+    return out.decode("utf-8", "replace")
+
+
+def _git_title_uncached(root: Path) -> Optional[str]:
+    git = _git_exe()
+    if not git or not _has_git(root):
         return None
     try:
-        subprocess.check_output([git, "-C", str(root), "rev-parse", "--show-toplevel"], text=True, timeout=5)
-        branch = subprocess.check_output([git, "-C", str(root), "rev-parse", "--abbrev-ref", "HEAD"], text=True, timeout=5).strip()
-        subj = subprocess.check_output([git, "-C", str(root), "log", "-1", "--pretty=%s"], text=True, timeout=5).strip()
-        return f"{root.name} [{branch}] - {subj}"
+        # One call returns both the ref names (%D) and the subject (%s).
+        out = _run_git(git, root, "log", "-1", "--pretty=format:%D%n%s")
+        refs, _, subj = out.partition("\n")
+        branch = "HEAD"
+        if refs.startswith("HEAD -> "):
+            branch = refs[len("HEAD -> "):].split(",", 1)[0].strip()
+        return f"{root.name} [{branch}] - {subj.strip()}"
     except Exception as e:
         LOGGER.debug("Git title suggestion failed: %s", e)
         return None
 
 
+def _git_head_stamp(root: Path) -> Optional[Tuple[str, int, int]]:
+    """(git dir, HEAD mtime_ns, logs/HEAD mtime_ns) — changes on commit/checkout/reset."""
+    try:
+        base = root.resolve()
+        for candidate in (base, *base.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # worktree/submodule: the ".git" file points at the real gitdir.
+                text = dot_git.read_text(encoding="utf-8", errors="replace").strip()
+                if not text.startswith("gitdir:"):
+                    return None
+                git_dir = (candidate / text[len("gitdir:"):].strip()).resolve()
+            else:
+                continue
+            head_ns = (git_dir / "HEAD").stat().st_mtime_ns
+            try:
+                log_ns = (git_dir / "logs" / "HEAD").stat().st_mtime_ns
+            except OSError:
+                log_ns = 0
+            return str(git_dir), head_ns, log_ns
+    except OSError:
+        return None
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _git_title_probe(root_str: str, stamp: Tuple[str, int, int]) -> Optional[str]:
+    return _git_title_uncached(Path(root_str))
+
+
+def git_title_suggestion(root: Path) -> Optional[str]:
+    # Keyed on HEAD/reflog mtimes so git is not re-run for an unchanged repo.
+    stamp = _git_head_stamp(root)
+    if stamp is None:
+        return _git_title_uncached(root) if _has_git(root) else None
+    return _git_title_probe(str(root), stamp)
+
+
 def git_state_details(root: Path) -> Optional[Dict[str, Any]]:
-    git = shutil.which("git")
-    if not git:
+    git = _git_exe()
+    if not git or not _has_git(root):
         return None
     try:
-        subprocess.check_output(
-            [git, "-C", str(root), "rev-parse", "--show-toplevel"],
-            text=True,
-            timeout=5,
-        )
-        branch = subprocess.check_output(
-            [git, "-C", str(root), "rev-parse", "--abbrev-ref", "HEAD"],
-            text=True,
-            timeout=5,
-        ).strip()
-        sha = subprocess.check_output(
-            [git, "-C", str(root), "rev-parse", "HEAD"],
-            text=True,
-            timeout=5,
-        ).strip()
-        porcelain = subprocess.check_output(
-            [git, "-C", str(root), "status", "--porcelain"],
-            text=True,
-            timeout=5,
-        )
+        # porcelain v2 --branch reports branch, HEAD sha and changes in one process.
+        porcelain = _run_git(git, root, "status", "--porcelain=v2", "--branch")
+        branch = ""
+        sha = ""
         changed = 0
         staged = 0
         untracked = 0
         for line in porcelain.splitlines():
             if not line:
                 continue
-            if line.startswith("??"):
+            if line.startswith("# "):
+                if line.startswith("# branch.oid "):
+                    sha = line[len("# branch.oid "):].strip()
+                elif line.startswith("# branch.head "):
+                    branch = line[len("# branch.head "):].strip()
+                continue
+            if line.startswith("?"):
                 untracked += 1
                 continue
-            x = line[0:1]
-            y = line[1:2]
-            if x and x != " ":
+            if line[0:1] not in ("1", "2", "u"):
+                continue
+            x = line[2:3]
+            y = line[3:4]
+            if x and x != ".":
                 staged += 1
-            if y and y != " ":
+            if y and y != ".":
                 changed += 1
+        if not sha or sha == "(initial)":
+            # A repo without commits fails like `rev-parse HEAD` did.
+            return None
+        if branch == "(detached)":
+            branch = "HEAD"
         dirty = bool(changed or staged or untracked)
         return {
             "branch": branch,
@@ -129,7 +129,8 @@ def main() -> None:
 
     def apply_hotkey_from_settings():
         unregister_hotkey(hotkey_id)
-        hk = migrate_settings(win.settings).get("hotkey", {})
+        # win.settings only ever holds migrated dicts (startup and apply_settings()).
+        hk = win.settings.get("hotkey", {})
         if not hk.get("enabled", True):
             win.statusBar().showMessage("Hotkey disabled.", 2500)
             return
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+from ctxsnap.app_storage import load_json
+from ctxsnap.services.snapshot_service import SnapshotService
+from ctxsnap.ui.main_window_sections import automation
 from ctxsnap.ui.main_window_sections.automation import MainWindowAutomationSection
 
 
@@ -28,3 +33,53 @@ def test_auto_backup_failure_does_not_update_last_timestamp() -> None:
     win._run_scheduled_backup()
     assert win.settings["auto_backup_last"] == ""
     assert "Auto backup failed" in win.status.messages[-1]
+
+
+class _ArchiveWindow(MainWindowAutomationSection):
+    def __init__(self, tmp_path: Path) -> None:
+        self.settings = {"archive_after_days": 30, "archive_skip_pinned": True}
+        self.snapshot_service = SnapshotService()
+        self.index_path = tmp_path / "index.json"
+        self.index = {
+            "snapshots": [
+                {"id": "old", "created_at": "2020-01-01T00:00:00", "archived": False},
+                {"id": "pinned", "created_at": "2020-01-01T00:00:00", "pinned": True},
+                {"id": "new", "created_at": "2999-01-01T00:00:00"},
+            ]
+        }
+        self._archive_pending: list[str] = []
+        self.snaps = {"old": {"id": "old", "archived": False}}
+        self.written: list[str] = []
+
+    def _index_row(self, sid: str):
+        return next((it for it in self.index["snapshots"] if it.get("id") == sid), None)
+
+    def load_snapshot_raw(self, sid: str):
+        return dict(self.snaps[sid]) if sid in self.snaps else None
+
+    def _prepare_snapshot_for_persist(self, snap):
+        return snap
+
+    def snap_path(self, sid: str) -> Path:
+        return self.index_path.parent / f"{sid}.json"
+
+    def _index_entry_from_snapshot_data(self, snap, *, snap_mtime: float, search_blob=None):
+        return {"archived": snap["archived"], "rev": snap.get("rev", 1), "search_blob": search_blob}
+
+
+def test_archive_policy_flags_index_first_and_rewrites_files_later(tmp_path: Path, monkeypatch) -> None:
+    scheduled = []
+    monkeypatch.setattr(automation.QtCore.QTimer, "singleShot", lambda _ms, fn: scheduled.append(fn))
+    monkeypatch.setattr(automation, "save_snapshot_file", lambda path, snap: win.written.append(path.stem) or True)
+    win = _ArchiveWindow(tmp_path)
+
+    win._apply_archive_policy()
+    assert [it.get("archived", False) for it in win.index["snapshots"]] == [True, False, False]
+    assert load_json(win.index_path)["snapshots"][0]["archived"] is True
+    assert win.written == []
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+    assert win.written == ["old"]
+    assert win._archive_pending == []
+    assert scheduled == []
@@ -5,7 +5,15 @@ from pathlib import Path
 
 import pytest
 
-from ctxsnap.app_storage import export_backup_to_file, import_backup_from_file, save_json
+from ctxsnap.app_storage import (
+    _MIGRATED_SNAPSHOT_KEYS,
+    _snapshot_is_migrated,
+    export_backup_to_file,
+    import_backup_from_file,
+    migrate_snapshot,
+    save_json,
+    save_snapshot_file,
+)
 from ctxsnap.core.security import SecurityService
 
 
@@ -39,3 +47,67 @@ def test_encrypted_backup_roundtrip(tmp_path: Path) -> None:
     imported = import_backup_from_file(out_path)
     assert "settings" in imported
     assert imported["data"] is not None
+
+
+def test_plain_backup_export_streams_snapshots(tmp_path: Path) -> None:
+    snaps_dir = tmp_path / "snapshots"
+    snaps_dir.mkdir(parents=True, exist_ok=True)
+    for sid in ("s1", "s2"):
+        (snaps_dir / f"{sid}.json").write_text(
+            json.dumps({"id": sid, "created_at": "2026-01-01T00:00:00", "note": "line1\nline2"}),
+            encoding="utf-8",
+        )
+    (snaps_dir / "broken.json").write_text("{", encoding="utf-8")
+    index_path = tmp_path / "index.json"
+    save_json(index_path, {"snapshots": [{"id": "s1"}, {"id": "s2"}]})
+
+    out_path = tmp_path / "backup.json"
+    export_backup_to_file(
+        out_path,
+        settings={"tags": ["업무"]},
+        snaps_dir=snaps_dir,
+        index_path=index_path,
+        include_snapshots=True,
+        include_index=True,
+    )
+    raw = json.loads(out_path.read_text(encoding="utf-8"))
+    assert [s["id"] for s in raw["data"]["snapshots"]] == ["s1", "s2"]
+    assert raw["data"]["snapshots"][0]["note"] == "line1\nline2"
+    assert raw["data"]["snapshots"][0]["schema_version"] == 2
+    assert raw["data"]["index"]["snapshots"][0]["id"] == "s1"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["backup.json", "index.json", "snapshots"]
+
+    imported = import_backup_from_file(out_path)
+    assert imported["settings"]["tags"] == ["업무"]
+    assert len(imported["data"]["snapshots"]) == 2
+
+def test_plain_backup_export_splices_current_snapshot_files(tmp_path: Path) -> None:
+    snaps_dir = tmp_path / "snapshots"
+    snaps_dir.mkdir()
+    assert save_snapshot_file(snaps_dir / "s1.json", migrate_snapshot({"id": "s1", "note": "kept"}))
+    current = (snaps_dir / "s1.json").read_bytes()
+    (snaps_dir / "s2.json").write_text(json.dumps({"id": "s2", "rev": True}), encoding="utf-8")
+
+    out_path = tmp_path / "backup.json"
+    export_backup_to_file(
+        out_path,
+        settings={},
+        snaps_dir=snaps_dir,
+        index_path=tmp_path / "index.json",
+        include_snapshots=True,
+        include_index=False,
+    )
+    out = out_path.read_bytes()
+    assert current.strip() in out
+    snaps = json.loads(out)["data"]["snapshots"]
+    assert [s["id"] for s in snaps] == ["s1", "s2"]
+    assert snaps[1]["rev"] == 1 and snaps[1]["schema_version"] == 2
+
+
+def test_snapshot_is_migrated_tracks_migrate_snapshot() -> None:
+    migrated = migrate_snapshot({"id": "s1"})
+    assert migrated.keys() - {"id"} == _MIGRATED_SNAPSHOT_KEYS
+    assert _snapshot_is_migrated(migrated)
+    assert not _snapshot_is_migrated({**migrated, "schema_version": 1})
+    assert not _snapshot_is_migrated({**migrated, "git_state": {}})
+    assert not _snapshot_is_migrated([])
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import difflib
 import os
+import threading
+import time
 from pathlib import Path
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 
-from ctxsnap.ui.dialogs.history import RestoreHistoryDialog
+from ctxsnap.app_storage import migrate_settings
+from ctxsnap.core.worker import GitProbeWorker, SnapshotCaptureWorker
+from ctxsnap.ui.dialogs import snapshot as snapshot_dialog
+from ctxsnap.ui.dialogs.history import CompareDialog, RestoreHistoryDialog, _line_diff
+from ctxsnap.ui.dialogs.settings import SettingsDialog
 from ctxsnap.ui.dialogs.snapshot import SnapshotDialog
+from ctxsnap.ui.main_window_sections.list_view import MainWindowListViewSection
+from ctxsnap.ui.main_window_sections.settings_backup import MainWindowSettingsBackupSection
+from ctxsnap.ui.main_window_sections.snapshot_crud import MainWindowSnapshotCrudSection
 
 _APP: QtWidgets.QApplication | None = None
 
@@ -39,6 +49,97 @@ def test_snapshot_dialog_accepts_empty_todos_when_todo_capture_disabled(tmp_path
     assert dlg.values()["todos"] == ["", "", ""]
 
 
+def test_snapshot_dialog_suggest_title_uses_background_git_probe(tmp_path: Path) -> None:
+    app = _app()
+    parent = QtWidgets.QWidget()
+    dlg = SnapshotDialog(parent, str(tmp_path), [], [])
+    QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    assert str(tmp_path) in dlg._git_suggestions
+
+    dlg._git_suggestions[str(tmp_path)] = "repo [main] - subject"
+    dlg.suggest_title()
+    assert dlg.title_edit.text() == "repo [main] - subject"
+
+
+def test_snapshot_dialog_values_probes_git_when_background_probe_pending(tmp_path: Path, monkeypatch) -> None:
+    app = _app()
+    parent = QtWidgets.QWidget()
+    dlg = SnapshotDialog(parent, str(tmp_path), [], [])
+    QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    dlg._git_suggestions.clear()
+    dlg._git_pending[str(tmp_path)] = GitProbeWorker(tmp_path)
+    monkeypatch.setattr(snapshot_dialog, "git_title_suggestion", lambda root: f"{root.name} [main] - subject")
+    assert dlg.values()["title"] == f"{tmp_path.name} [main] - subject"
+
+
+def test_snapshot_dialog_stale_probe_keeps_pending_fallback_replacement(tmp_path: Path) -> None:
+    app = _app()
+    parent = QtWidgets.QWidget()
+    dlg = SnapshotDialog(parent, str(tmp_path), [], [])
+    QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    dlg.title_edit.setText("fallback")
+    dlg._git_fallback_title = "fallback"
+
+    dlg._on_git_probe_finished(str(tmp_path / "old-root"), "old [main] - subject")
+    assert dlg.title_edit.text() == "fallback"
+    assert dlg._git_fallback_title == "fallback"
+
+    dlg._on_git_probe_finished(str(tmp_path), "repo [main] - subject")
+    assert dlg.title_edit.text() == "repo [main] - subject"
+    assert dlg._git_fallback_title is None
+
+
+def test_line_diff_matches_difflib_unified_output() -> None:
+    left = ["Title: A", "", "TODOs:", "  • one", "  • two", "", "Tags: x", "tail", "end"]
+    right = ["Title: B", "", "TODOs:", "  • one", "  • three", "", "Tags: x", "tail", "end", "extra"]
+    expected = list(difflib.unified_diff(left, right, fromfile="Snapshot A", tofile="Snapshot B", lineterm=""))
+    assert list(_line_diff(left, right, "Snapshot A", "Snapshot B")) == expected
+    assert list(_line_diff(left, left, "Snapshot A", "Snapshot B")) == []
+
+
+def test_compare_dialog_runs_diff_in_background() -> None:
+    app = _app()
+    parent = QtWidgets.QWidget()
+    snaps = [
+        {"id": "a", "title": "Alpha", "created_at": "2026-01-01T00:00:00"},
+        {"id": "b", "title": "Beta", "created_at": "2026-01-02T00:00:00"},
+    ]
+    dlg = CompareDialog(parent, snaps, loader=lambda _sid: None)
+    dlg._run_compare()
+    QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    text = dlg.diff_view.toPlainText()
+    assert "-Title: Alpha" in text
+    assert "+Title: Beta" in text
+    assert dlg.btn_compare.isEnabled()
+
+
+def test_compare_dialog_loads_snapshots_only_when_comparing() -> None:
+    app = _app()
+    parent = QtWidgets.QWidget()
+    snaps = [
+        {"id": "a", "title": "Alpha", "created_at": "2026-01-01T00:00:00"},
+        {"id": "b", "title": "Beta", "created_at": "2026-01-02T00:00:00"},
+    ]
+    loaded: list[str] = []
+
+    def loader(sid: str) -> dict:
+        loaded.append(sid)
+        return {"id": sid, "title": sid.upper()}
+
+    dlg = CompareDialog(parent, snaps, loader=loader)
+    assert dlg.left_combo.count() == 2
+    assert loaded == []
+    dlg.right_combo.setCurrentIndex(0)
+    dlg._run_compare()
+    QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    assert loaded == ["a"]
+
+
 def test_restore_history_dialog_emits_restore_again_request() -> None:
     _app()
     parent = QtWidgets.QWidget()
@@ -51,3 +152,251 @@ def test_restore_history_dialog_emits_restore_again_request() -> None:
     dlg.listw.setCurrentRow(0)
     dlg._request_restore()
     assert emitted == ["s1"]
+
+
+# Keeps dialog parents alive without a dialog -> parent reference cycle, which the
+# garbage collector could otherwise tear down while Qt still owns the dialog.
+_PARENTS: list[QtWidgets.QWidget] = []
+
+
+def _settings_dialog(tmp_path: Path, settings: dict | None = None) -> SettingsDialog:
+    _app()
+    parent = QtWidgets.QWidget()
+    _PARENTS.append(parent)
+    dlg = SettingsDialog(
+        parent,
+        migrate_settings(settings or {}),
+        index_path=tmp_path / "index.json",
+        snaps_dir=tmp_path / "snapshots",
+    )
+    return dlg
+
+
+def test_settings_dialog_builds_tabs_lazily(tmp_path: Path) -> None:
+    dlg = _settings_dialog(tmp_path, {"tags": ["Work"], "hotkey": {"vk": "Q"}})
+    assert not hasattr(dlg, "tags_list")
+    dlg.tabs.setCurrentIndex(3)
+    assert [dlg.tags_list.item(i).text() for i in range(dlg.tags_list.count())] == ["Work"]
+    assert dlg.tabs.currentIndex() == 3
+    assert not hasattr(dlg, "hk_key")
+
+    vals = dlg.values()
+    assert vals["hotkey"]["vk"] == "Q"
+    assert vals["tags"] == ["Work"]
+
+
+def test_settings_dialog_add_tag_skips_duplicates_and_tracks_removal(tmp_path: Path) -> None:
+    dlg = _settings_dialog(tmp_path, {"tags": ["Work", "Idea"]})
+    dlg.tabs.setCurrentIndex(3)
+    dlg.tag_input.setText("Work")
+    dlg.add_tag()
+    assert dlg.values()["tags"] == ["Work", "Idea"]
+
+    dlg.tags_list.setCurrentRow(0)
+    dlg.remove_tag()
+    dlg.tag_input.setText("Work")
+    dlg.add_tag()
+    assert dlg.values()["tags"] == ["Idea", "Work"]
+    assert dlg.tag_input.text() == ""
+
+
+def test_settings_dialog_exports_backup_on_thread_pool(tmp_path: Path) -> None:
+    app = _app()
+    dlg = _settings_dialog(tmp_path)
+    target = tmp_path / "backup.json"
+
+    dlg._export_to(str(target))
+    assert QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    for _ in range(50):
+        app.processEvents()
+        if not dlg._backup_busy:
+            break
+
+    assert not dlg._backup_busy
+    assert dlg.btn_export.isEnabled()
+    assert target.exists()
+    assert str(target) in dlg.b_msg.text()
+
+
+def test_settings_dialog_cannot_be_dismissed_while_backup_job_runs(tmp_path: Path) -> None:
+    app = _app()
+    dlg = _settings_dialog(tmp_path)
+    release = threading.Event()
+    dlg.show()
+    dlg.tabs.setCurrentIndex(5)
+    dlg._start_backup_job("export", "backup.json", lambda: release.wait(5))
+    assert not dlg.btn_cancel.isEnabled()
+    dlg.reject()
+    dlg.close()
+    assert dlg.isVisible()
+
+    release.set()
+    assert QtCore.QThreadPool.globalInstance().waitForDone(5000)
+    for _ in range(50):
+        app.processEvents()
+        if not dlg._backup_busy:
+            break
+    assert dlg.btn_cancel.isEnabled()
+    dlg.reject()
+    assert not dlg.isVisible()
+
+
+def test_settings_dialog_template_form_reloads_only_on_change(tmp_path: Path) -> None:
+    dlg = _settings_dialog(
+        tmp_path,
+        {"templates": [{"name": "A", "note": "a", "todos": ["1"], "tags": []}, {"name": "B"}]},
+    )
+    dlg.tabs.setCurrentIndex(4)
+
+    dlg.templates_list.setCurrentRow(0)
+    assert dlg.template_name.text() == "A"
+    dlg.template_name.setText("edited")
+    dlg.load_template_to_form(0)
+    assert dlg.template_name.text() == "edited"
+
+    dlg._templates_cache[0] = {"name": "A2"}
+    dlg.load_template_to_form(0)
+    assert dlg.template_name.text() == "A2"
+    dlg.templates_list.setCurrentRow(1)
+    assert dlg.template_name.text() == "B"
+
+
+def test_settings_dialog_values_cache_tracks_control_changes(tmp_path: Path) -> None:
+    dlg = _settings_dialog(tmp_path, {"tags": ["Work"]})
+
+    first = dlg.values()
+    first["hotkey"]["vk"] = "mutated"
+    second = dlg.values()
+    assert second == dlg._collect_values()
+    assert second["hotkey"]["vk"] != "mutated"
+
+    dlg.recent_spin.setValue(dlg.recent_spin.value() + 1)
+    dlg.hk_ctrl.setChecked(not dlg.hk_ctrl.isChecked())
+    dlg.tags_list.addItem("Idea")
+    third = dlg.values()
+    assert third["recent_files_limit"] == second["recent_files_limit"] + 1
+    assert third["hotkey"]["ctrl"] != second["hotkey"]["ctrl"]
+    assert third["tags"] == ["Work", "Idea"]
+
+    dlg.apply_settings_to_controls(migrate_settings({"tags": ["Other"]}))
+    assert dlg.values()["tags"] == ["Other"]
+
+
+class _ConfirmWindow(MainWindowSnapshotCrudSection, QtWidgets.QWidget):
+    def __init__(self) -> None:
+        QtWidgets.QWidget.__init__(self)
+        self._confirm_box = None
+
+    def selected_id(self) -> str:
+        return "s1"
+
+    def snap_path(self, sid: str) -> Path:
+        raise AssertionError("declined delete must not touch files")
+
+
+def test_delete_confirmation_box_is_reused_and_no_keeps_snapshot() -> None:
+    _app()
+    win = _ConfirmWindow()
+    box = win._delete_confirm_box()
+    assert win._delete_confirm_box() is box
+    no = box.button(QtWidgets.QMessageBox.StandardButton.No)
+    box.exec = no.click
+    win.delete_selected()
+    assert box.clickedButton() is no
+
+
+class _CaptureWindow(MainWindowSnapshotCrudSection, QtWidgets.QWidget):
+    def __init__(self) -> None:
+        QtWidgets.QWidget.__init__(self)
+        self._pending_captures = {}
+        self._capture_jobs = {}
+        self.saved: list[tuple] = []
+
+    def _on_snapshot_captured(self, sid: str, captured) -> None:
+        self._capture_jobs.pop(sid, None)
+        self._pending_captures.pop(sid, None)
+        self.saved.append((sid, captured))
+
+
+def test_finish_pending_captures_saves_in_flight_capture_before_quit() -> None:
+    _app()
+    win = _CaptureWindow()
+
+    def capture():
+        time.sleep(0.05)
+        return {"recent_files": ["a.py"]}
+
+    worker = SnapshotCaptureWorker("s1", capture)
+    worker.setAutoDelete(False)
+    worker.signals.finished.connect(win._on_snapshot_captured)
+    win._pending_captures["s1"] = ({}, Path("."), False, "Saved")
+    win._capture_jobs["s1"] = worker
+    QtCore.QThreadPool.globalInstance().start(worker)
+
+    win._finish_pending_captures()
+    assert win.saved == [("s1", {"recent_files": ["a.py"]})]
+    assert win._capture_jobs == {}
+
+
+class _RebuildWindow(MainWindowSettingsBackupSection):
+    def __init__(self) -> None:
+        self._ui_rebuild_pending = False
+        self.calls: list[str] = []
+
+    def _build_tag_menu(self) -> None:
+        self.calls.append("tags")
+
+    def _reset_pagination_and_refresh(self) -> None:
+        self.calls.append("list")
+
+    def _build_menus(self) -> None:
+        self.calls.append("menus")
+
+
+def test_settings_ui_rebuild_is_coalesced_per_event_loop_turn() -> None:
+    app = _app()
+    win = _RebuildWindow()
+    win._schedule_ui_rebuild()
+    win._schedule_ui_rebuild()
+    assert win.calls == []
+    app.processEvents()
+    assert win.calls == ["tags", "list", "menus"]
+    app.processEvents()
+    assert win.calls == ["tags", "list", "menus"]
+
+
+class _TagMenuWindow(MainWindowListViewSection, QtWidgets.QWidget):
+    def __init__(self) -> None:
+        QtWidgets.QWidget.__init__(self)
+        self.settings = {"tags": ["work", "home", "misc"]}
+        self.selected_tags = {"home", "misc"}
+        self.tag_filter_btn = QtWidgets.QToolButton(self)
+        self._tag_menu = None
+        self._tag_actions = {}
+        self.refreshes = 0
+
+    def _reset_pagination_and_refresh(self) -> None:
+        self.refreshes += 1
+
+
+def test_tag_menu_is_built_once_and_synced_with_tag_changes() -> None:
+    _app()
+    win = _TagMenuWindow()
+    win._build_tag_menu()
+    menu = win.tag_filter_btn.menu()
+    home = win._tag_actions["home"]
+    assert [a.text() for a in menu.actions() if a.isCheckable()] == ["work", "home", "misc"]
+    assert home.isChecked()
+
+    win.settings["tags"] = ["new", "home"]
+    win._build_tag_menu()
+    assert win.tag_filter_btn.menu() is menu
+    assert win._tag_actions["home"] is home
+    assert [a.text() for a in menu.actions() if a.isCheckable()] == ["new", "home"]
+    assert win.selected_tags == {"home"}
+
+    win._clear_tag_filter()
+    assert not home.isChecked()
+    assert win.selected_tags == set()
+    assert win.refreshes == 1
+    win.deleteLater()
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from ctxsnap.app_storage import load_json
+from ctxsnap.services import SnapshotService
+from ctxsnap.ui.main_window_sections import snapshot_crud
+from ctxsnap.ui.main_window_sections.list_view import MainWindowListViewSection
+from ctxsnap.ui.main_window_sections.snapshot_crud import MainWindowSnapshotCrudSection
+from ctxsnap.ui.models import SnapshotListModel
+
+
+def _rows(*stamps: str) -> list[dict]:
+    return [{"id": str(i), "created_at": stamp} for i, stamp in enumerate(stamps)]
+
+
+def test_drop_older_span_matches_day_filter_for_both_orders() -> None:
+    rows = _rows("2024-05-01T00:00:00", "", "2024-05-03T00:00:00", "bogus", "2024-05-02T12:00:00")
+    cutoff = "2024-05-02T00:00:00"
+
+    newest = sorted(rows, key=lambda x: x["created_at"], reverse=True)
+    kept = MainWindowListViewSection._drop_older_span(newest, cutoff, newest_first=True)
+    assert [it["created_at"] for it in kept] == ["bogus", "2024-05-03T00:00:00", "2024-05-02T12:00:00", ""]
+
+    oldest = sorted(rows, key=lambda x: x["created_at"])
+    kept = MainWindowListViewSection._drop_older_span(oldest, cutoff, newest_first=False)
+    assert [it["created_at"] for it in kept] == ["", "2024-05-02T12:00:00", "2024-05-03T00:00:00", "bogus"]
+
+
+def test_list_model_applies_filter_changes_without_reset() -> None:
+    model = SnapshotListModel()
+    rows = [{"id": sid, "title": sid} for sid in ("a", "b", "c", "d")]
+    model.set_items(rows)
+    events: list[tuple] = []
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.rowsRemoved.connect(lambda _p, first, last: events.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda _p, first, last: events.append(("inserted", first, last)))
+
+    model.set_items([rows[0], rows[3]])
+    assert events == [("removed", 1, 2)]
+    assert [model.id_for_index(model.index(r, 0)) for r in range(model.rowCount())] == ["a", "d"]
+
+    events.clear()
+    model.set_items(rows)
+    assert events == [("inserted", 1, 2)]
+    assert model.row_for_id("c") == 2
+
+    events.clear()
+    model.set_items(list(reversed(rows)))
+    assert events == [("reset",)]
+
+
+class _Label:
+    def setText(self, _text: str) -> None:
+        pass
+
+
+class _DetailWindow(MainWindowSnapshotCrudSection):
+    def __init__(self, row: dict) -> None:
+        self.row = row
+        self._detail_token = 0
+        self._detail_loads = {}
+        self._detail_cache = None
+        self.shown: list[tuple] = []
+        self.loads: list[str] = []
+        self.detail_title = self.detail_meta = self.detail = _Label()
+
+    def selected_id(self):
+        return self.row["id"]
+
+    def _index_row(self, sid: str):
+        return self.row if sid == self.row["id"] else None
+
+    def _show_snapshot_detail(self, sid, snap) -> None:
+        self.shown.append((sid, snap["rev"]))
+
+    def load_snapshot(self, sid: str):
+        self.loads.append(sid)
+        return dict(self.row)
+
+
+class _Index:
+    def isValid(self) -> bool:
+        return True
+
+
+def test_reselecting_unchanged_snapshot_reuses_loaded_detail(monkeypatch) -> None:
+    class _Pool:
+        def start(self, worker) -> None:
+            worker.run()
+
+    monkeypatch.setattr(snapshot_crud.QtCore.QThreadPool, "globalInstance", staticmethod(lambda: _Pool()))
+    win = _DetailWindow({"id": "a", "rev": 1, "updated_at": "2026-01-01T00:00:00"})
+    win._detail_token = 1
+    win._on_detail_snapshot_loaded("a", 1, dict(win.row))
+    win.on_select(_Index(), _Index())
+    assert win.loads == []
+    assert win.shown == [("a", 1), ("a", 1)]
+
+    win.row["rev"] = 2
+    win.on_select(_Index(), _Index())
+    assert win.loads == ["a"]
+
+
+class _TagWindow(MainWindowListViewSection):
+    def __init__(self) -> None:
+        self.settings = {"tags": ["work", "home", "misc"]}
+        self.index = {
+            "rev": 1,
+            "snapshots": [
+                {"id": "a", "tags": ["work"]},
+                {"id": "b", "tags": ["home", "misc", "unknown"]},
+                {"id": "c"},
+            ],
+        }
+        self._tag_mask_cache = None
+
+
+def test_tag_masks_follow_configured_tags_and_index_changes() -> None:
+    win = _TagWindow()
+    bits, masks = win._tag_masks()
+    a, b, c = win.index["snapshots"]
+    assert bits == {"work": 1, "home": 2, "misc": 4}
+    assert (masks[id(a)], masks[id(b)], masks[id(c)]) == (1, 6, 0)
+    assert win._tag_masks()[1] is masks
+
+    a["tags"] = ["home"]
+    win.index["rev"] = 2
+    assert win._tag_masks()[1][id(a)] == 2
+
+
+class _Timer:
+    def __init__(self) -> None:
+        self.active = False
+
+    def start(self) -> None:
+        self.active = True
+
+    def stop(self) -> None:
+        self.active = False
+
+
+class _FlushWindow(MainWindowSnapshotCrudSection):
+    def __init__(self, index_path) -> None:
+        self.index_path = index_path
+        self.index = {"snapshots": [], "rev": 1}
+        self._index_dirty = False
+        self._index_flush_timer = _Timer()
+
+
+def test_index_flush_coalesces_metadata_writes(tmp_path) -> None:
+    win = _FlushWindow(tmp_path / "index.json")
+    for rev in (2, 3, 4):
+        win.index["rev"] = rev
+        win._schedule_index_flush()
+    assert win._index_flush_timer.active
+    assert not win.index_path.exists()
+
+    assert win._flush_index()
+    assert load_json(win.index_path)["rev"] == 4
+    assert not win._index_dirty and not win._index_flush_timer.active
+
+    win.index_path.unlink()
+    assert win._flush_index()
+    assert not win.index_path.exists()
+
+
+class _List:
+    def currentIndex(self) -> _Index:
+        return _Index()
+
+
+class _EditWindow(MainWindowSnapshotCrudSection):
+    def __init__(self, tmp_path) -> None:
+        self.settings = {}
+        self.snapshot_service = SnapshotService()
+        self.index_path = tmp_path / "index.json"
+        self.snaps_dir = tmp_path
+        self.snap = {"id": "a", "title": "A", "note": "stale note", "todos": ["", "", ""], "rev": 1}
+        self.index = {
+            "snapshots": [{"id": "a", "search_blob": "stale note"}],
+            "rev": 1,
+            "search_meta": {"engine": "blob", "version": SnapshotService.SEARCH_BLOB_VERSION},
+        }
+        self._index_dirty = False
+        self._index_flush_timer = _Timer()
+        self.listw = _List()
+
+    def load_snapshot(self, sid: str):
+        return dict(self.snap)
+
+    def load_snapshot_raw(self, sid: str):
+        return dict(self.snap)
+
+    def snap_path(self, sid: str):
+        return self.snaps_dir / f"{sid}.json"
+
+    def _index_row(self, sid: str):
+        return self.index["snapshots"][0]
+
+    def refresh_list(self, reset_page: bool = False) -> None:
+        pass
+
+    def on_select(self, current, previous) -> None:
+        pass
+
+
+def test_snapshot_edit_rebuilds_search_blob_and_meta_update_keeps_it(tmp_path) -> None:
+    win = _EditWindow(tmp_path)
+    win._update_snapshot("a", title="A", root="", workspace="", note="fresh note", todos=["next"], tags=[])
+    row = win.index["snapshots"][0]
+    assert "fresh note" in row["search_blob"]
+    assert "stale" not in row["search_blob"]
+
+    row["search_blob"] = "kept blob"
+    win._update_snapshot_meta("a", pinned=True)
+    assert row["pinned"] is True
+    assert row["search_blob"] == "kept blob"
+
+
+class _RowWindow(MainWindowListViewSection):
+    def __init__(self) -> None:
+        self.index = {"snapshots": [{"id": "a"}, {"id": "b"}, {"id": "a"}]}
+        self._row_index = None
+
+
+def test_remove_index_rows_keeps_row_map_in_sync() -> None:
+    win = _RowWindow()
+    snapshots = win.index["snapshots"]
+    assert win._index_row("b") is snapshots[1]
+    win._remove_index_rows("a")
+    assert win.index["snapshots"] is snapshots
+    assert snapshots == [{"id": "b"}]
+    assert win._index_row("a") is None
+    assert win._index_row("b") is snapshots[0]
+
+def test_normalized_todos_pads_and_trims_to_three_slots() -> None:
+    normalize = MainWindowSnapshotCrudSection._normalized_todos
+    assert normalize([" a "]) == ["a", "", ""]
+    assert normalize(["a", None, "c", "d"]) == ["a", "", "c"]
+    first, second = normalize([]), normalize([])
+    first[0] = "edited"
+    assert second == ["", "", ""]
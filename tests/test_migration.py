@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+
 import pytest
 
-from ctxsnap.app_storage import migrate_settings, migrate_snapshot, safe_snapshot_path
+from ctxsnap._json import dumps, loads
+from ctxsnap.app_storage import (
+    SnapshotReadCache,
+    load_json,
+    migrate_settings,
+    migrate_snapshot,
+    read_snapshot_dir,
+    read_snapshot_file,
+    remove_snapshot_files,
+    safe_snapshot_path,
+    save_index,
+    save_snapshot_file,
+)
 from ctxsnap.constants import default_tags_for_language
 from ctxsnap.services.snapshot_service import SnapshotService
 
@@ -43,6 +59,65 @@ def test_migrate_snapshot_backfills_revision_and_git_state() -> None:
     assert snap["git_state"]["untracked"] == 0
 
 
+def test_read_snapshot_file_parses_bytes_and_migrates(tmp_path) -> None:
+    p = tmp_path / "x.json"
+    p.write_text(json.dumps({"id": "x", "title": "한글", "created_at": "2026-01-01T00:00:00"}, ensure_ascii=False), encoding="utf-8")
+    snap = read_snapshot_file(p)
+    assert snap["title"] == "한글"
+    assert snap["rev"] >= 1
+    p.write_bytes(b"{broken")
+    with pytest.raises(json.JSONDecodeError):
+        read_snapshot_file(p)
+
+
+def test_save_index_writes_compact_json_that_load_json_reads(tmp_path) -> None:
+    p = tmp_path / "index.json"
+    index = {"snapshots": [{"id": "a", "title": "한글", "pinned": True}], "rev": 3}
+    assert save_index(p, index)
+    raw = p.read_bytes()
+    assert b"\n" not in raw
+    assert load_json(p) == index
+
+
+def test_save_snapshot_file_writes_compact_json(tmp_path) -> None:
+    p = tmp_path / "s1.json"
+    snap = {"id": "s1", "created_at": "2026-01-01T00:00:00", "todos": ["a", "b", "c"]}
+    assert save_snapshot_file(p, snap)
+    assert b"\n" not in p.read_bytes()
+    assert read_snapshot_file(p)["todos"] == ["a", "b", "c"]
+
+
+def test_snapshot_read_cache_reuses_bytes_until_file_changes(tmp_path) -> None:
+    p = tmp_path / "s1.json"
+    p.write_text(json.dumps({"id": "s1", "note": "v1"}), encoding="utf-8")
+    cache = SnapshotReadCache(limit=1)
+    first = cache.read(p)
+    first["note"] = "mutated"
+    assert cache.read(p)["note"] == "v1"
+
+    p.write_text(json.dumps({"id": "s1", "note": "version 2"}), encoding="utf-8")
+    assert cache.read(p)["note"] == "version 2"
+
+    other = tmp_path / "s2.json"
+    other.write_text(json.dumps({"id": "s2"}), encoding="utf-8")
+    assert cache.read(other)["id"] == "s2"
+    assert list(cache._entries) == [str(other)]
+
+    other.unlink()
+    assert cache.read(other) is None
+
+
+def test_snapshot_dir_capture_and_wipe_only_touch_json_files(tmp_path) -> None:
+    (tmp_path / "s1.json").write_bytes(b'{"id":"s1"}')
+    (tmp_path / "s2.json").write_bytes(b'{"id":"s2"}')
+    (tmp_path / "notes.txt").write_bytes(b"keep")
+    (tmp_path / "nested.json").mkdir()
+
+    assert read_snapshot_dir(tmp_path) == {"s1.json": b'{"id":"s1"}', "s2.json": b'{"id":"s2"}'}
+    assert remove_snapshot_files(tmp_path) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["nested.json", "notes.txt"]
+
+
 def test_migrate_index_clears_legacy_search_cache_and_normalizes_tombstones() -> None:
     service = SnapshotService()
     migrated = service.migrate_index(
@@ -63,6 +138,47 @@ def test_migrate_index_clears_legacy_search_cache_and_normalizes_tombstones() ->
     assert migrated["tombstones"] == [{"id": "s1", "deleted_at": "2026-01-03T00:00:00"}]
 
 
+def test_touch_index_shares_rows_while_migrate_index_copies_them() -> None:
+    service = SnapshotService()
+    index = service.migrate_index({"snapshots": [{"id": "s1"}], "rev": 3})
+    touched = service.upsert_tombstone(service.touch_index(index), "s0")
+    assert touched["snapshots"] is index["snapshots"]
+    assert touched["rev"] == 4
+    assert index["tombstones"] == []
+    assert service.migrate_index(touched)["snapshots"][0] is not index["snapshots"][0]
+
+
+def test_json_shim_matches_stdlib_layout() -> None:
+    data = {"title": "업무", "todos": ["a", ""], "rev": 2}
+    assert dumps(data) == json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    assert dumps(data, indent=False) == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert loads(dumps(data, indent=False)) == data
+    with pytest.raises(json.JSONDecodeError):
+        loads(b"{broken")
+
+
+def test_storage_and_services_import_without_qt() -> None:
+    code = (
+        "import sys, ctxsnap.app_storage, ctxsnap.services, ctxsnap.core.sync; "
+        "print(any(name.startswith('PySide6') for name in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_prune_tombstones_keeps_recent_and_unparseable_entries() -> None:
+    service = SnapshotService()
+    kept = service.prune_tombstones(
+        [
+            {"id": "old", "deleted_at": "2026-01-01T00:00:00"},
+            {"id": "new", "deleted_at": "2026-03-01T00:00:00"},
+            {"id": "odd", "deleted_at": "2026-02-30T00:00:00"},
+        ],
+        now="2026-03-10T00:00:00",
+    )
+    assert sorted(item["id"] for item in kept) == ["new", "odd"]
+
+
 def test_latest_snapshot_item_prefers_created_at_then_updated_at_then_id() -> None:
     service = SnapshotService()
     item = service.latest_snapshot_item(
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from ctxsnap.core.worker import (
+    RecentFilesWorker,
+    SnapshotCaptureWorker,
+    SnapshotLoadWorker,
+    pop_recent_files_result,
+)
+from ctxsnap.utils import compile_glob_patterns, find_unique_workspace, recent_files_under
+
+
+def _touch(path: Path, mtime: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x", encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_recent_files_under_returns_newest_first_and_respects_filters(tmp_path: Path) -> None:
+    _touch(tmp_path / "a.py", 1000)
+    _touch(tmp_path / "src" / "b.py", 3000)
+    _touch(tmp_path / "src" / "c.txt", 4000)
+    _touch(tmp_path / "node_modules" / "d.py", 5000)
+    _touch(tmp_path / ".hidden" / "e.py", 6000)
+    _touch(tmp_path / "build.log", 7000)
+
+    out = recent_files_under(
+        tmp_path,
+        limit=2,
+        exclude_dirs=["node_modules"],
+        include_patterns=["*.py", "*.LOG"],
+        exclude_patterns=["build.*"],
+    )
+
+    assert [Path(p).name for p in out] == ["b.py", "a.py"]
+
+
+def test_recent_files_under_handles_missing_root_and_zero_limit(tmp_path: Path) -> None:
+    _touch(tmp_path / "a.py", 1000)
+    assert recent_files_under(tmp_path / "missing") == []
+    assert recent_files_under(tmp_path, limit=0) == []
+
+
+def test_recent_files_worker_uses_precompiled_patterns(tmp_path: Path) -> None:
+    _touch(tmp_path / "keep.py", 2000)
+    _touch(tmp_path / "skip.tmp.py", 3000)
+    _touch(tmp_path / "Vendor" / "lib.py", 4000)
+
+    worker = RecentFilesWorker(
+        "sid",
+        tmp_path,
+        limit=10,
+        exclude_dirs=["vendor"],
+        include_patterns=["*.PY"],
+        exclude_patterns=["*.tmp.*", " "],
+        scan_limit=100,
+        scan_seconds=5.0,
+    )
+    finished: list[str] = []
+    worker.finished.connect(finished.append)
+    worker.run()
+
+    assert finished == ["sid"]
+    assert [Path(p).name for p in pop_recent_files_result("sid")] == ["keep.py"]
+    assert pop_recent_files_result("sid") == ()
+
+
+def test_compile_glob_patterns_reuses_compiled_regex() -> None:
+    first = compile_glob_patterns(["*.PY", " ", "*.md"])
+    assert first is not None
+    assert compile_glob_patterns(["*.py", "*.md "]) is first
+    assert first.match("readme.md")
+    assert compile_glob_patterns([" "]) is None
+
+
+def test_snapshot_load_worker_reports_result_and_swallows_errors() -> None:
+    results: list[tuple] = []
+
+    worker = SnapshotLoadWorker("s1", 7, lambda sid: {"id": sid})
+    worker.signals.finished.connect(lambda sid, token, snap: results.append((sid, token, snap)))
+    worker.run()
+
+    def boom(_sid: str):
+        raise OSError("unreadable")
+
+    failing = SnapshotLoadWorker("s2", 8, boom)
+    failing.signals.finished.connect(lambda sid, token, snap: results.append((sid, token, snap)))
+    failing.run()
+
+    assert results == [("s1", 7, {"id": "s1"}), ("s2", 8, None)]
+
+
+def test_snapshot_capture_worker_emits_fields_or_none_on_error() -> None:
+    results = []
+    worker = SnapshotCaptureWorker("s1", lambda: {"recent_files": ["a.py"]})
+    worker.signals.finished.connect(lambda sid, captured: results.append((sid, captured)))
+    worker.run()
+
+    def boom():
+        raise RuntimeError("git failed")
+
+    failing = SnapshotCaptureWorker("s2", boom)
+    failing.signals.finished.connect(lambda sid, captured: results.append((sid, captured)))
+    failing.run()
+
+    assert results == [("s1", {"recent_files": ["a.py"]}), ("s2", None)]
+
+
+def test_find_unique_workspace_requires_exactly_one_file(tmp_path: Path) -> None:
+    assert find_unique_workspace(tmp_path / "missing") == ""
+    (tmp_path / "dir.code-workspace").mkdir()
+    assert find_unique_workspace(tmp_path) == ""
+    (tmp_path / "a.code-workspace").write_text("{}", encoding="utf-8")
+    assert find_unique_workspace(tmp_path) == str((tmp_path / "a.code-workspace").resolve())
+    (tmp_path / "b.code-workspace").write_text("{}", encoding="utf-8")
+    assert find_unique_workspace(tmp_path) == ""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from ctxsnap.ui.main_window_sections.restore_actions import MainWindowRestoreActionsSection
+from ctxsnap.ui.main_window_sections.restore_actions import MainWindowRestoreActionsSection, _newline_joined
 
 
 def test_snapshot_export_payload_redacts_sensitive_fields() -> None:
@@ -53,3 +53,8 @@ def test_weekly_report_lines_redact_note_and_todos() -> None:
     report = "\n".join(lines)
     assert "- (redacted)" in report
     assert "private note" not in report
+
+
+def test_newline_joined_matches_str_join() -> None:
+    for lines in ([], ["only"], ["# Title", "", "body", ""]):
+        assert "".join(_newline_joined(iter(lines))) == "\n".join(lines)
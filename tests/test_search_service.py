@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from ctxsnap.services.search_service import SearchService
+from ctxsnap.ui.main_window_sections.snapshot_crud import MainWindowSnapshotCrudSection
+from ctxsnap.utils import build_search_blob
 
 
 def test_parse_with_field_query_enabled() -> None:
@@ -79,3 +81,44 @@ def test_parse_preserves_windows_backslashes() -> None:
     svc = SearchService()
     parsed = svc.parse(r"root:C:\Projects\ctxsnap", field_enabled=True)
     assert parsed.fields["root"] == [r"c:\projects\ctxsnap"]
+
+
+def test_cached_haystack_follows_index_row_edits() -> None:
+    svc = SearchService()
+    item = {"id": "s1", "title": "Alpha", "root": "C:/repo", "tags": ["Work"], "search_blob": ""}
+    assert svc.matches_item(item, svc.parse("alpha", field_enabled=True)) is True
+    assert svc.matches_item(item, svc.parse("tag:work", field_enabled=True)) is True
+
+    item["title"] = "Beta"
+    item["tags"] = ["Home"]
+    item["search_blob"] = "needle"
+    assert svc.matches_item(item, svc.parse("alpha", field_enabled=True)) is False
+    assert svc.matches_item(item, svc.parse("beta needle", field_enabled=True)) is True
+    assert svc.matches_item(item, svc.parse("tag:home", field_enabled=True)) is True
+
+
+def test_plain_snapshot_is_not_reloaded_after_a_confirmed_miss() -> None:
+    svc = SearchService()
+    snap = {"title": "t", "root": "", "tags": [], "note": "hello", "todos": [], "processes": [], "running_apps": []}
+    item = {"id": "s1", "title": "t", "root": "", "tags": [], "search_blob": build_search_blob(snap), "rev": 1}
+    loads: list[str] = []
+
+    def loader(sid: str):
+        loads.append(sid)
+        return dict(snap)
+
+    parsed = svc.parse("absent", field_enabled=True)
+    assert svc.matches_item(item, parsed, load_snapshot=loader) is False
+    assert svc.matches_item(item, parsed, load_snapshot=loader) is False
+    assert loads == ["s1"]
+
+    item["rev"] = 2
+    assert svc.matches_item(item, parsed, load_snapshot=loader) is False
+    assert loads == ["s1", "s1"]
+
+
+def test_index_entry_reuses_search_blob_for_metadata_updates() -> None:
+    snap = {"id": "s1", "note": "Deploy Notes", "todos": ["ship"], "pinned": True}
+    entry = MainWindowSnapshotCrudSection._index_entry_from_snapshot_data
+    assert entry(snap)["search_blob"] == build_search_blob(snap)
+    assert entry(snap, search_blob="kept blob")["search_blob"] == "kept blob"